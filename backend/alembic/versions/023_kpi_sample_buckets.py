@@ -0,0 +1,43 @@
+"""Add kpi_sample_buckets (vertical array-per-minute KPI storage)
+
+Revision ID: 023_kpi_sample_buckets
+Revises: 325e829bc843
+Create Date: 2026-10-16 09:00:00.000000
+
+Changes:
+  kpi_sample_buckets  — new table, one row per (tenant, entity, metric, minute)
+  holding the minute's samples as parallel arrays (values, ts_offsets_ms).
+  Replaces ~60 kpi_samples rows per minute at 1 Hz with a single row.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "023_kpi_sample_buckets"
+down_revision = "325e829bc843"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "kpi_sample_buckets",
+        sa.Column("tenant_id", sa.String(100), nullable=False),
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("metric_name", sa.String(100), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("values", postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column("ts_offsets_ms", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("source", sa.String(50), nullable=False),
+        sa.PrimaryKeyConstraint("tenant_id", "entity_id", "metric_name", "bucket_start"),
+        sa.ForeignKeyConstraint(["entity_id"], ["network_entities.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_kpi_bucket_tenant_start", "kpi_sample_buckets", ["tenant_id", "bucket_start"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_kpi_bucket_tenant_start", table_name="kpi_sample_buckets")
+    op.drop_table("kpi_sample_buckets")
@@ -0,0 +1,44 @@
+"""Make ix_kpi_entity_metric_time a covering index (INCLUDE value)
+
+Revision ID: 024_kpi_samples_covering_index
+Revises: 023_kpi_sample_buckets
+Create Date: 2026-10-16 10:00:00.000000
+
+Changes:
+  kpi_samples.ix_kpi_entity_metric_time — recreated with INCLUDE (value).
+  The hot read "SELECT value, timestamp WHERE entity_id=? AND metric_name=?
+  ORDER BY timestamp DESC LIMIT N" becomes an index-only scan (no heap fetch
+  per row). Requires PostgreSQL 11+.
+
+On non-postgres backends (e.g. SQLite) this migration is a no-op.
+"""
+
+from alembic import op
+
+revision = "024_kpi_samples_covering_index"
+down_revision = "023_kpi_sample_buckets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_kpi_entity_metric_time", table_name="kpi_samples")
+    op.create_index(
+        "ix_kpi_entity_metric_time",
+        "kpi_samples",
+        ["entity_id", "metric_name", "timestamp"],
+        postgresql_include=["value"],
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_kpi_entity_metric_time", table_name="kpi_samples")
+    op.create_index(
+        "ix_kpi_entity_metric_time",
+        "kpi_samples",
+        ["entity_id", "metric_name", "timestamp"],
+    )
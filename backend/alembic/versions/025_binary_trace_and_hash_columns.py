@@ -0,0 +1,55 @@
+"""Store decision_trace_id as uuid and llm_prompt_hash as bytea
+
+Revision ID: 025_binary_trace_and_hash_columns
+Revises: 024_kpi_samples_covering_index
+Create Date: 2026-10-16 11:00:00.000000
+
+Changes:
+  incidents.decision_trace_id              VARCHAR(36) -> UUID  (36 -> 16 bytes)
+  incidents.llm_prompt_hash                VARCHAR(32) -> BYTEA (hex decoded)
+  incident_audit_entries.llm_prompt_hash   VARCHAR(32) -> BYTEA (hex decoded)
+
+Empty or non-hex prompt hashes are converted to NULL. The ORM keeps exposing
+both columns as str (see Uuid(as_uuid=False) and core.db_types.HexDigest).
+
+On non-postgres backends (e.g. SQLite) this migration is a no-op.
+"""
+
+from alembic import op
+
+revision = "025_binary_trace_and_hash_columns"
+down_revision = "024_kpi_samples_covering_index"
+branch_labels = None
+depends_on = None
+
+_HEX_TO_BYTEA = (
+    "CASE WHEN {col} ~ '^([0-9a-fA-F]{{2}})+$' THEN decode({col}, 'hex') ELSE NULL END"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "ALTER TABLE incidents ALTER COLUMN decision_trace_id TYPE UUID "
+        "USING NULLIF(decision_trace_id, '')::uuid"
+    )
+    for table in ("incidents", "incident_audit_entries"):
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN llm_prompt_hash TYPE BYTEA "
+            f"USING {_HEX_TO_BYTEA.format(col='llm_prompt_hash')}"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in ("incidents", "incident_audit_entries"):
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN llm_prompt_hash TYPE VARCHAR(32) "
+            f"USING encode(llm_prompt_hash, 'hex')"
+        )
+    op.execute(
+        "ALTER TABLE incidents ALTER COLUMN decision_trace_id TYPE VARCHAR(36) "
+        "USING decision_trace_id::text"
+    )
@@ -0,0 +1,30 @@
+"""Add composite (tenant_id, associated_site_id) index on customers
+
+Revision ID: 026_customers_tenant_site_index
+Revises: 025_binary_trace_and_hash_columns
+Create Date: 2026-10-16 12:00:00.000000
+
+Changes:
+  customers.ix_customers_tenant_site — new composite index. The alarm
+  customer-impact query "WHERE tenant_id = ? AND associated_site_id = ANY(?)"
+  becomes a single index scan instead of a site-index scan plus tenant filter.
+"""
+
+from alembic import op
+
+revision = "026_customers_tenant_site_index"
+down_revision = "025_binary_trace_and_hash_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_customers_tenant_site",
+        "customers",
+        ["tenant_id", "associated_site_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_customers_tenant_site", table_name="customers")
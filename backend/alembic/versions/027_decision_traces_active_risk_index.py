@@ -0,0 +1,41 @@
+"""Partial expression index for cumulative active revenue risk
+
+Revision ID: 027_decision_traces_active_risk_index
+Revises: 026_customers_tenant_site_index
+Create Date: 2026-10-16 14:00:00.000000
+
+Changes:
+  decision_traces.ix_decision_traces_active_revenue_loss — new partial index
+  on (created_at, (context ->> 'predicted_revenue_loss')::float) WHERE
+  outcome IS NULL. BSSService.calculate_cumulative_active_risk sums that
+  expression over the last hour of open decisions; the sum is answered from
+  the index instead of extracting JSON from every heap row.
+
+Built CONCURRENTLY so decision writes are not blocked. PostgreSQL only; on
+other backends (e.g. SQLite) this migration is a no-op.
+"""
+
+from alembic import op
+
+revision = "027_decision_traces_active_risk_index"
+down_revision = "026_customers_tenant_site_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_decision_traces_active_revenue_loss "
+            "ON decision_traces (created_at, (CAST(context ->> 'predicted_revenue_loss' AS FLOAT))) "
+            "WHERE outcome IS NULL"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_decision_traces_active_revenue_loss")
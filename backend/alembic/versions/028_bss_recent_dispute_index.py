@@ -0,0 +1,49 @@
+"""Partial index on bss_billing_accounts.last_billing_dispute
+
+Revision ID: 028_bss_recent_dispute_index
+Revises: 027_decision_traces_active_risk_index
+Create Date: 2026-10-16 15:00:00.000000
+
+Changes:
+  bss_billing_accounts.ix_bss_dispute_recent — new partial index on
+  last_billing_dispute WHERE last_billing_dispute IS NOT NULL. Most accounts
+  have never disputed a bill, so the index stays small and the 30-day
+  dispute filter (check_recent_disputes, summarize_impact) can use an index
+  scan instead of reading every matched account.
+
+Built CONCURRENTLY so account writes are not blocked. PostgreSQL only; on
+other backends (e.g. SQLite) this migration is a no-op.
+"""
+
+from alembic import op
+
+revision = "028_bss_recent_dispute_index"
+down_revision = "027_decision_traces_active_risk_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_bss_dispute_recent",
+            "bss_billing_accounts",
+            ["last_billing_dispute"],
+            postgresql_where="last_billing_dispute IS NOT NULL",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_bss_dispute_recent",
+            table_name="bss_billing_accounts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
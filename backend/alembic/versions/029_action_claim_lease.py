@@ -0,0 +1,31 @@
+"""Add claimed_at lease column to action_executions
+
+Revision ID: 029_action_claim_lease
+Revises: 028_bss_recent_dispute_index
+Create Date: 2026-10-16 16:00:00.000000
+
+Changes:
+  action_executions.claimed_at — new nullable DateTime column. Set when an
+  executor claims an action and renewed by its claim sweep; claims whose
+  lease lapses (the holding process died without releasing them) are taken
+  over by another executor's sweep.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "029_action_claim_lease"
+down_revision = "028_bss_recent_dispute_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nullable, no default: existing claims read as already lapsed
+    op.add_column("action_executions", sa.Column("claimed_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("action_executions", "claimed_at")
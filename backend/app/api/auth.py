@@ -15,6 +15,7 @@ Flow:
    that has tenant_id baked in.  All subsequent API calls use this token.
 """
 
+import asyncio
 from datetime import timedelta
 from typing import Any, List, Optional
 
@@ -369,8 +370,13 @@ async def change_password(
     if not user_orm:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Verify current password
-    if not auth_service.verify_password(body.current_password, user_orm.hashed_password):
+    # bcrypt runs on worker threads so it never blocks the event loop. The
+    # new password is only hashed once the current one checks out, so a
+    # wrong guess costs the server a single bcrypt operation.
+    current_ok = await asyncio.to_thread(
+        auth_service.verify_password, body.current_password, user_orm.hashed_password
+    )
+    if not current_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Current password is incorrect.",
@@ -382,9 +388,12 @@ async def change_password(
             detail="New password must differ from current password.",
         )
 
+    new_hash = await asyncio.to_thread(auth_service.hash_password, body.new_password)
+
     # Update password and clear the forced-change flag
-    user_orm.hashed_password = auth_service.hash_password(body.new_password)
+    user_orm.hashed_password = new_hash
     user_orm.must_change_password = False
     await db.commit()
+    auth_service.invalidate_user(user_orm.username)
 
     return ChangePasswordResponse(message="Password changed successfully.")
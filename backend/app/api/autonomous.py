@@ -30,7 +30,7 @@ from backend.app.schemas.autonomous import (
     ScorecardResponse,
     ValueProtected,
 )
-from backend.app.services.autonomous_action_executor import AutonomousActionExecutor
+from backend.app.services.autonomous_action_executor import get_autonomous_executor
 from backend.app.services.autonomous_shield import AutonomousShieldService
 from backend.app.services.digital_twin import DigitalTwinMock
 from backend.app.services.drift_calibration import DriftCalibrationService
@@ -536,8 +536,8 @@ async def submit_autonomous_action(
             "idempotent": True,
         }
 
-    executor = AutonomousActionExecutor(async_session_maker)
-    # Ensure worker started (idempotent)
+    executor = get_autonomous_executor(async_session_maker)
+    # Ensure workers started (idempotent)
     await executor.start()
 
     action = await executor.submit_action(
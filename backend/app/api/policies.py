@@ -12,6 +12,7 @@ import uuid
 from datetime import datetime
 
 from backend.app.core.database import get_db
+from backend.app.core.responses import ORJSONPydanticResponse
 from backend.app.core.security import get_current_user
 from backend.app.models.policy_orm import PolicyORM, PolicyEvaluationORM, PolicyVersionORM
 from backend.app.schemas.policies import (
@@ -53,7 +54,7 @@ async def create_policy(
     )
     existing = dup_result.scalars().first()
     if existing:
-        return PolicyResponse.from_orm(existing)
+        return PolicyResponse.model_validate(existing)
 
     # Create new policy
     policy_id = str(uuid.uuid4())
@@ -64,7 +65,7 @@ async def create_policy(
         description=policy.description,
         version=1,
         status="active",
-        rules=policy.rules.dict(),
+        rules=policy.rules.model_dump(),
         created_by=policy.created_by or current_user.email,
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
@@ -79,7 +80,7 @@ async def create_policy(
         policy_id=policy_id,
         tenant_id=tenant_id,
         version_number=1,
-        rules=policy.rules.dict(),
+        rules=policy.rules.model_dump(),
         modified_by=policy.created_by or current_user.email,
         modified_at=datetime.utcnow(),
         change_reason="Initial policy creation",
@@ -87,7 +88,7 @@ async def create_policy(
     session.add(version)
     await session.commit()
     
-    return PolicyResponse.from_orm(new_policy)
+    return PolicyResponse.model_validate(new_policy)
 
 
 @router.get("/{tenant_id}", response_model=List[PolicyResponse])
@@ -117,7 +118,7 @@ async def list_policies(
     result = await session.execute(query)
     policies = result.scalars().all()
     
-    return [PolicyResponse.from_orm(p) for p in policies]
+    return [PolicyResponse.model_validate(p) for p in policies]
 
 
 @router.get("/{tenant_id}/{policy_id}", response_model=PolicyResponse)
@@ -144,7 +145,7 @@ async def get_policy(
     if not policy:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Policy not found")
     
-    return PolicyResponse.from_orm(policy)
+    return PolicyResponse.model_validate(policy)
 
 
 @router.patch("/{tenant_id}/{policy_id}", response_model=PolicyResponse)
@@ -193,7 +194,7 @@ async def update_policy(
     if update.description is not None:
         policy.description = update.description
     if update.rules:
-        policy.rules = update.rules.dict()
+        policy.rules = update.rules.model_dump()
         policy.version += 1
     if update.status:
         policy.status = update.status
@@ -201,7 +202,7 @@ async def update_policy(
     policy.updated_at = datetime.utcnow()
     
     await session.commit()
-    return PolicyResponse.from_orm(policy)
+    return PolicyResponse.model_validate(policy)
 
 
 @router.post("/{tenant_id}/evaluate", response_model=PolicyEvaluationResponse)
@@ -257,7 +258,7 @@ async def get_policy_audit_trail(
     limit: int = 100,
     session: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user),
-) -> List[PolicyAuditEntry]:
+):
     """
     P5.1: Retrieve audit trail for a policy.
     
@@ -285,7 +286,7 @@ async def get_policy_audit_trail(
     )
     evaluations = result.scalars().all()
     
-    return [PolicyAuditEntry.from_orm(e) for e in evaluations]
+    return ORJSONPydanticResponse([PolicyAuditEntry.from_orm_trusted(e) for e in evaluations])
 
 
 @router.get("/{tenant_id}/{policy_id}/versions", response_model=List[PolicyVersionResponse])
@@ -319,4 +320,4 @@ async def get_policy_versions(
     )
     versions = result.scalars().all()
     
-    return [PolicyVersionResponse.from_orm(v) for v in versions]
+    return [PolicyVersionResponse.model_validate(v) for v in versions]
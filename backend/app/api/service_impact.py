@@ -17,6 +17,7 @@ from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import async_session_maker, get_db
+from backend.app.core.responses import ORJSONPydanticResponse
 from backend.app.core.security import TMF642_READ, User, get_current_user
 from backend.app.models.decision_trace_orm import DecisionTraceORM
 from backend.app.schemas.service_impact import (
@@ -84,7 +85,7 @@ async def get_impacted_customers(
             unpriced_count += 1
 
         customers.append(
-            CustomerImpact(
+            CustomerImpact.model_construct(
                 customer_id=cid,
                 customer_name=name or "Unknown",
                 customer_external_id=ext_id or str(cid),
@@ -101,13 +102,15 @@ async def get_impacted_customers(
         or None
     )
 
-    return ServiceImpactSummary(
-        total_customers_impacted=len(customers),
-        total_revenue_at_risk=total_revenue,
-        is_estimate=bss_is_estimate,
-        data_source=bss_data_source,
-        unpriced_customer_count=unpriced_count,
-        customers=customers,
+    return ORJSONPydanticResponse(
+        ServiceImpactSummary(
+            total_customers_impacted=len(customers),
+            total_revenue_at_risk=total_revenue,
+            is_estimate=bss_is_estimate,
+            data_source=bss_data_source,
+            unpriced_customer_count=unpriced_count,
+            customers=customers,
+        )
     )
 
 
@@ -191,7 +194,7 @@ async def get_alarm_clusters(
             )
         )
 
-    return clusters
+    return ORJSONPydanticResponse(clusters)
 
 
 @router.get("/noise-wall")
@@ -10,14 +10,17 @@ WS1 — Topology & Impact Analysis.
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Security
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, Security
+from pydantic import TypeAdapter
 from sqlalchemy import bindparam, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import get_db, get_metrics_db
+from backend.app.core.responses import ORJSONPydanticResponse, ndjson_response, wants_ndjson
 from backend.app.core.security import (
     TOPOLOGY_READ,
     TOPOLOGY_READ_FULL,
@@ -26,7 +29,8 @@ from backend.app.core.security import (
 )
 from backend.app.schemas.topology import (
     EntityResponse,
-    ImpactTreeNode,
+    ImpactTreeFlat,
+    ImpactTreeFlatResponse,
     ImpactTreeResponse,
     RelationshipResponse,
     TopologyGraphResponse,
@@ -36,6 +40,10 @@ from backend.app.schemas.topology import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Built once: the list core schemas/serializers are reused across requests.
+_ENTITY_LIST_ADAPTER = TypeAdapter(List[EntityResponse])
+_RELATIONSHIP_LIST_ADAPTER = TypeAdapter(List[RelationshipResponse])
+
 # Simple in-memory rate limiter: {user: (count, window_start)}
 # Protected by _rate_limit_lock for atomic check-and-increment.
 _rate_limit_store: dict = {}
@@ -67,6 +75,7 @@ async def _check_rate_limit(username: str) -> None:
 @router.get("/{tenant_id}", response_model=TopologyGraphResponse)
 async def get_topology_graph(
     tenant_id: str,
+    request: Request,
     entity_type: Optional[str] = Query(
         None, description="Filter by entity type (e.g. SITE, GNODEB, CELL)"
     ),
@@ -84,6 +93,11 @@ async def get_topology_graph(
 
     Entity names and external_ids are resolved from the ``network_entities``
     table so the frontend shows human-readable labels instead of raw UUIDs.
+
+    With ``Accept: application/x-ndjson`` the graph is streamed as NDJSON: a
+    ``{"type": "graph", "tenant_id", "topology_health"}`` line, then one
+    ``"entity"`` line per EntityResponse and one ``"relationship"`` line per
+    RelationshipResponse.
     """
     await _check_rate_limit(current_user.username)
 
@@ -128,7 +142,9 @@ async def get_topology_graph(
         entity_ids_set.add(str(to_id))
         relationships.append(
             {
-                "id": str(rel_id),
+                # model_construct below skips validation, so pass a real UUID
+                # for the UUID-typed field (drivers may hand back text)
+                "id": rel_id if isinstance(rel_id, UUID) else UUID(str(rel_id)),
                 "source_entity_id": str(from_id),
                 "target_entity_id": str(to_id),
                 "relationship_type": rel_type,
@@ -193,8 +209,9 @@ async def get_topology_graph(
                     "tenant_id": tenant_id,
                 }
 
-    entities = [EntityResponse(**e) for e in entity_map.values()]
-    rels = [RelationshipResponse(**r) for r in relationships]
+    # Both lists are assembled above from our own DB rows — skip re-validation.
+    entities = [EntityResponse.model_construct(**e) for e in entity_map.values()]
+    rels = [RelationshipResponse.model_construct(**r) for r in relationships]
 
     # ── 5. Topology health summary ────────────────────────────────────
     # Get total entity count for the tenant (cheap COUNT)
@@ -215,12 +232,28 @@ async def get_topology_graph(
         else 0.0,
     )
 
-    return TopologyGraphResponse(
-        tenant_id=tenant_id,
-        entities=entities,
-        relationships=rels,
-        topology_health=health,
-    )
+    if wants_ndjson(request):
+        def _graph_lines():
+            yield {"type": "graph", "tenant_id": tenant_id, "topology_health": health}
+            for e in entities:
+                yield {"type": "entity", **e.model_dump()}
+            for r in rels:
+                yield {"type": "relationship", **r.model_dump()}
+
+        return ndjson_response(_graph_lines())
+
+    # Serialised straight to bytes by the prebuilt list adapters and stitched
+    # into the TopologyGraphResponse envelope (same field order), so the
+    # (potentially thousands of) entities and relationships are never
+    # re-validated or round-tripped through Python dicts.
+    body = b"".join((
+        b'{"tenant_id":', orjson.dumps(tenant_id),
+        b',"entities":', _ENTITY_LIST_ADAPTER.dump_json(entities),
+        b',"relationships":', _RELATIONSHIP_LIST_ADAPTER.dump_json(rels),
+        b',"topology_health":', health.model_dump_json().encode(),
+        b"}",
+    ))
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{tenant_id}/entity/{entity_id}")
@@ -315,17 +348,23 @@ async def get_entity(
     }
 
 
-@router.get("/{tenant_id}/impact/{entity_id}", response_model=ImpactTreeResponse)
+@router.get(
+    "/{tenant_id}/impact/{entity_id}",
+    response_model=Union[ImpactTreeResponse, ImpactTreeFlatResponse],
+)
 async def get_impact_tree(
     tenant_id: str,
     entity_id: str,
     max_hops: int = Query(default=3, ge=1, le=5),
+    layout: Literal["nodes", "flat"] = Query(default="nodes"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Security(get_current_user, scopes=[TOPOLOGY_READ]),
 ):
     """
     Get the impact tree for an entity (upstream and downstream).
     Requires topology:read scope. max_hops defaults to 3 and is enforced.
+    layout=flat returns each direction as parallel arrays with parent indices
+    (ImpactTreeFlat) instead of one object per node.
     """
 
     # Pre-load a name cache for entities we encounter during traversal.
@@ -354,13 +393,13 @@ async def get_impact_tree(
         return _name_cache[eid]
 
     async def get_neighbours_recursive(
-        eid: str, depth: int, direction: str, visited: set
-    ) -> List[ImpactTreeNode]:
+        eid: str, depth: int, tree: ImpactTreeFlat, parent: int, visited: set
+    ) -> None:
         if depth > max_hops or eid in visited:
-            return []
+            return
         visited.add(eid)
 
-        nodes: List[ImpactTreeNode] = []
+        direction = tree.direction
         if direction == "upstream":
             q = text(
                 "SELECT from_entity_id, from_entity_type, relationship_type FROM topology_relationships WHERE to_entity_id = :eid AND tenant_id = :tid LIMIT 50"
@@ -379,35 +418,28 @@ async def get_impact_tree(
         for next_id, next_type, rel_type in rows:
             nid = str(next_id)
             name, etype, ext_id = await _resolve_name(nid)
-            node = ImpactTreeNode(
-                entity_id=nid,
-                entity_name=name,
-                entity_type=etype,
-                external_id=ext_id,
-                direction=direction,
-                relationship_type=rel_type,
-                depth=depth,
-            )
-            nodes.append(node)
-            nodes.extend(
-                await get_neighbours_recursive(nid, depth + 1, direction, visited)
-            )
-
-        return nodes
+            index = tree.append(nid, name, etype, ext_id, rel_type, depth, parent)
+            await get_neighbours_recursive(nid, depth + 1, tree, index, visited)
 
     # Resolve root entity name
     root_name, root_type, root_ext = await _resolve_name(entity_id)
 
-    upstream = await get_neighbours_recursive(entity_id, 1, "upstream", set())
-    downstream = await get_neighbours_recursive(entity_id, 1, "downstream", set())
-
-    return ImpactTreeResponse(
-        root_entity_id=entity_id,
-        root_entity_name=root_name,
-        root_entity_type=root_type,
-        upstream=upstream,
-        downstream=downstream,
-        total_customers_impacted=len(downstream),
+    upstream = ImpactTreeFlat(direction="upstream")
+    downstream = ImpactTreeFlat(direction="downstream")
+    await get_neighbours_recursive(entity_id, 1, upstream, -1, set())
+    await get_neighbours_recursive(entity_id, 1, downstream, -1, set())
+
+    response_cls = ImpactTreeFlatResponse if layout == "flat" else ImpactTreeResponse
+    return ORJSONPydanticResponse(
+        response_cls.model_construct(
+            root_entity_id=entity_id,
+            root_entity_name=root_name,
+            root_entity_type=root_type,
+            upstream=upstream if layout == "flat" else upstream.to_nodes(),
+            downstream=downstream if layout == "flat" else downstream.to_nodes(),
+            total_customers_impacted=len(downstream),
+            total_revenue_at_risk=None,
+        )
     )
 
 
@@ -46,8 +46,11 @@ class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///./pedkai.db"
     metrics_database_url: str = "sqlite+aiosqlite:///./metrics.db"
     db_ssl_mode: str = "disable"  # "require" for production
-    database_pool_size: int = 5
-    database_max_overflow: int = 10
+    database_pool_size: int = 20  # sized for the autonomous executor's worker shards + concurrent incident handlers
+    database_max_overflow: int = 30
+    database_pool_recycle_seconds: int = 1800  # drop pooled connections before server/proxy idle timeouts
+    database_query_cache_size: int = 1200  # compiled-SQL LRU per engine (SQLAlchemy default 500)
+    database_statement_cache_size: int = 500  # asyncpg prepared statements per connection; 0 behind pgbouncer (transaction mode)
 
     # Gemini LLM
     gemini_api_key: Optional[str] = None
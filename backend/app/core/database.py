@@ -1,8 +1,9 @@
 """Database connection and session management."""
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -25,8 +26,24 @@ class ArchitectureViolationError(RuntimeError):
 
 settings = get_settings()
 
+# JSON/JSONB columns (action results, policy rules, fragment payloads) are
+# encoded with orjson rather than stdlib json. Non-str dict keys are
+# stringified as stdlib json does; numpy scalars/arrays serialise natively.
+_ORJSON_COLUMN_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json_serializer(obj: Any) -> str:
+    return orjson.dumps(obj, option=_ORJSON_COLUMN_OPTIONS).decode()
+
+
+_json_kwargs = {"json_serializer": _json_serializer, "json_deserializer": orjson.loads}
+
 # Create async engine
-engine_kwargs = {"echo": settings.debug}
+engine_kwargs = {
+    "echo": settings.debug,
+    "query_cache_size": settings.database_query_cache_size,
+    **_json_kwargs,
+}
 
 # SSL Configuration
 connect_args = {}
@@ -36,12 +53,22 @@ if settings.db_ssl_mode == "require":
 if connect_args:
     engine_kwargs["connect_args"] = connect_args
 
+# asyncpg: cached prepared statements skip the PREPARE round-trip on reuse.
+# SQLAlchemy's adapter and asyncpg itself each keep a per-connection cache.
+_asyncpg_cache_args = {
+    "prepared_statement_cache_size": settings.database_statement_cache_size,
+    "statement_cache_size": settings.database_statement_cache_size,
+}
+
 if "postgresql" in settings.database_url:
     engine_kwargs.update({
         "pool_size": settings.database_pool_size,
         "max_overflow": settings.database_max_overflow,
+        "pool_recycle": settings.database_pool_recycle_seconds,
         "pool_pre_ping": True, # Resilience fix
     })
+    if "asyncpg" in settings.database_url:
+        engine_kwargs["connect_args"] = {**connect_args, **_asyncpg_cache_args}
 
 engine = create_async_engine(
     settings.database_url,
@@ -56,7 +83,11 @@ async_session_maker = async_sessionmaker(
 )
 
 # Create async engine for metrics
-metrics_kwargs = {"echo": settings.debug}
+metrics_kwargs = {
+    "echo": settings.debug,
+    "query_cache_size": settings.database_query_cache_size,
+    **_json_kwargs,
+}
 
 # SSL Configuration for Metrics
 if connect_args:
@@ -66,8 +97,11 @@ if "postgresql" in settings.metrics_database_url:
     metrics_kwargs.update({
         "pool_size": settings.database_pool_size,
         "max_overflow": settings.database_max_overflow,
+        "pool_recycle": settings.database_pool_recycle_seconds,
         "pool_pre_ping": True, # Resilience fix
     })
+    if "asyncpg" in settings.metrics_database_url:
+        metrics_kwargs["connect_args"] = {**connect_args, **_asyncpg_cache_args}
 
 metrics_engine = create_async_engine(
     settings.metrics_database_url,
@@ -121,6 +155,21 @@ class Base(DeclarativeBase):
             )
 
 
+def loaded_repr(obj: object, *attrs: str) -> str:
+    """Cheap ``repr`` for high-volume ORM rows.
+
+    Reads values straight from the instance ``__dict__`` so neither the
+    instrumented-attribute descriptors nor an expired-attribute refresh (an
+    implicit SELECT, or MissingGreenlet under asyncio) is triggered when a
+    DEBUG logger reprs every row of a large fetch. Unloaded attributes
+    render as ``?``.
+    """
+    state = obj.__dict__
+    return f"{type(obj).__name__}(" + ", ".join(
+        f"{a}={state.get(a, '?')}" for a in attrs
+    ) + ")"
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database sessions."""
     async with async_session_maker() as session:
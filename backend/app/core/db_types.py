@@ -0,0 +1,29 @@
+"""Portable column types shared across ORM models."""
+
+from typing import Optional
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+class HexDigest(TypeDecorator):
+    """
+    Store a hex-encoded digest as raw bytes (BYTEA on Postgres, BLOB on SQLite).
+
+    Python code keeps working with hex strings (``hashlib...hexdigest()``); the
+    column holds half the bytes and compares with memcmp instead of collation.
+    Empty strings are stored as NULL.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if not value:
+            return None
+        return bytes.fromhex(value)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return bytes(value).hex()
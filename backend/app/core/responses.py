@@ -0,0 +1,77 @@
+"""
+Fast JSON responses for large Pydantic payloads.
+
+FastAPI's default path runs every returned model through response_model
+re-validation and ``jsonable_encoder``'s recursive isinstance walk before
+``json.dumps``. For fan-out payloads (topology graphs, impact trees, customer
+lists) that dominates request time. ``ORJSONPydanticResponse`` dumps the model
+once and hands the result to orjson, which serialises UUID/datetime/Enum
+natively.
+
+Usage — keep ``response_model=`` on the route for the OpenAPI schema; returning
+a Response instance directly bypasses FastAPI's re-validation:
+
+    @router.get("/x", response_model=TopologyGraphResponse)
+    async def get_x(...):
+        return ORJSONPydanticResponse(TopologyGraphResponse(...))
+
+Clients that send ``Accept: application/x-ndjson`` can instead be served
+``ndjson_response(...)``: an envelope line followed by one line per row.
+"""
+
+from decimal import Decimal
+from typing import Any, Iterable, Iterator
+
+import orjson
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+# OPT_UTC_Z matches Pydantic's own JSON output for UTC datetimes ("...Z").
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """Serialise the few types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONPydanticResponse(Response):
+    """JSON response rendered with orjson; accepts models, lists of models, or plain data."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            content = content.model_dump()
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """True when the client explicitly asked for newline-delimited JSON."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(lines: Iterable[Any]) -> StreamingResponse:
+    """
+    Stream one orjson-encoded document per line.
+
+    ``lines`` is consumed lazily, so a generator keeps only the current row
+    alive while the body is written.
+    """
+    def _encode() -> Iterator[bytes]:
+        for line in lines:
+            if isinstance(line, BaseModel):
+                line = line.model_dump()
+            yield orjson.dumps(line, default=_default, option=_ORJSON_OPTIONS) + b"\n"
+
+    return StreamingResponse(_encode(), media_type=NDJSON_MEDIA_TYPE)
@@ -64,9 +64,9 @@ async def lifespan(app: FastAPI):
     consumer_task = await start_event_consumer()
 
     # Start autonomous action executor (P5.3)
-    from backend.app.services.autonomous_action_executor import AutonomousActionExecutor
+    from backend.app.services.autonomous_action_executor import get_autonomous_executor
 
-    executor = AutonomousActionExecutor(async_session_maker)
+    executor = get_autonomous_executor(async_session_maker)
     await executor.start()
 
     # Start sleeping cell detector scheduler (P2.4)
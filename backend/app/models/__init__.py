@@ -16,7 +16,7 @@ from backend.app.models.decision_trace import (
     Option,
     SimilarDecisionQuery,
 )
-from backend.app.models.kpi_sample_orm import KpiSampleORM
+from backend.app.models.kpi_sample_orm import KpiSampleBucketORM, KpiSampleORM
 from backend.app.models.network_entity_orm import NetworkEntityORM
 from backend.app.models.tenant_orm import TenantORM
 from backend.app.models.user_tenant_access_orm import UserTenantAccessORM
@@ -75,6 +75,7 @@ __all__ = [
     "SimilarDecisionQuery",
     "NetworkEntityORM",
     "KpiSampleORM",
+    "KpiSampleBucketORM",
     "IncidentAuditEntryORM",
     "ActionExecutionORM",
     "TenantORM",
@@ -32,6 +32,9 @@ class ActionExecutionORM(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     submitted_by = Column(String(256), nullable=True)
     executed_by = Column(String(256), nullable=True)
+    # Claim lease: set when claimed and renewed by the holder's sweep; a
+    # claim not renewed within the lease is taken over by another executor
+    claimed_at = Column(DateTime, nullable=True)
     trace_id = Column(String(128), nullable=True)
     result = Column(JSON, nullable=True)
     success = Column(Boolean, default=False)
@@ -7,6 +7,7 @@ import uuid
 from datetime import datetime, timezone
 from sqlalchemy import Column, String, Text, DateTime, JSON, ForeignKey
 from backend.app.core.database import Base
+from backend.app.core.db_types import HexDigest
 
 
 class IncidentAuditEntryORM(Base):
@@ -31,7 +32,7 @@ class IncidentAuditEntryORM(Base):
     
     # AI Metadata if related to an LLM step
     llm_model_version = Column(String(100), nullable=True)
-    llm_prompt_hash = Column(String(32), nullable=True)
+    llm_prompt_hash = Column(HexDigest, nullable=True)  # hex in Python, bytes on disk
     
     def __repr__(self):
         return f"<IncidentAuditEntry {self.action} by {self.actor} for {self.incident_id}>"
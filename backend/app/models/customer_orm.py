@@ -5,7 +5,7 @@ ORM Models for Phase 14: Customer Experience Intelligence.
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 
 from backend.app.core.database import Base
@@ -27,6 +27,11 @@ class CustomerORM(Base):
     tenant_id = Column(String(100), nullable=False, index=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (
+        # Customer-impact lookup: WHERE tenant_id = ? AND associated_site_id = ANY(?)
+        Index("ix_customers_tenant_site", "tenant_id", "associated_site_id"),
+    )
+
 
 class ProactiveCareORM(Base):
     __tablename__ = "proactive_care_records"
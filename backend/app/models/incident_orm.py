@@ -2,11 +2,16 @@
 ORM Model for Incident Lifecycle.
 
 Stores incidents with full audit trail for the 3 human gate approval steps.
-SQLite-compatible: UUIDs stored as String, no FK constraints.
+SQLite-compatible: primary/entity UUIDs stored as String, no FK constraints.
+decision_trace_id uses the portable Uuid type (native uuid on Postgres,
+CHAR(32) on SQLite) and llm_prompt_hash is stored as raw bytes; both still
+read and write as str at the Python level.
 """
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, Index, String, Text, DateTime, JSON
+from sqlalchemy import Column, Index, String, Text, DateTime, JSON, Uuid
+
+from backend.app.core.db_types import HexDigest
 
 from backend.app.core.database import Base
 
@@ -33,7 +38,7 @@ class IncidentORM(Base):
     entity_external_id = Column(String(255), nullable=True)
 
     # Decision trace reference
-    decision_trace_id = Column(String(36), nullable=True)
+    decision_trace_id = Column(Uuid(as_uuid=False), nullable=True)
 
     # AI reasoning
     reasoning_chain = Column(JSON, nullable=True)  # List[ReasoningStep]
@@ -42,7 +47,7 @@ class IncidentORM(Base):
 
     # LLM audit
     llm_model_version = Column(String(100), nullable=True)
-    llm_prompt_hash = Column(String(32), nullable=True)
+    llm_prompt_hash = Column(HexDigest, nullable=True)  # hex in Python, bytes on disk
 
     # Human Gate 1: Sitrep approval
     sitrep_approved_by = Column(String(255), nullable=True)
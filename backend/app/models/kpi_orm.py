@@ -10,7 +10,7 @@ from uuid import uuid4
 from sqlalchemy import Column, DateTime, Float, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
-from backend.app.core.database import Base
+from backend.app.core.database import Base, loaded_repr
 
 
 class KPIMetricORM(Base):
@@ -50,10 +50,12 @@ class KPIMetricORM(Base):
     __table_args__ = (
         Index("ix_kpi_metrics_timestamp", "timestamp"),
         Index("ix_kpi_metrics_tenant_timestamp", "tenant_id", "timestamp"),
+        # Per-series windows (entity + KPI, newest first) as one index range scan
+        Index("ix_kpi_metrics_entity_kpi_timestamp", "entity_id", "metric_name", "timestamp"),
     )
 
     def __repr__(self) -> str:
-        return f"<KPIMetric(entity={self.entity_id}, metric={self.metric_name}, value={self.value})>"
+        return loaded_repr(self, "entity_id", "metric_name", "value")
 
     @staticmethod
     async def bulk_insert(session, metrics_list: list):
@@ -3,12 +3,18 @@ ORM Models for KPI Samples (Phase 1.3).
 
 Stores structured time-series KPI measurements for network entities.
 Enables efficient querying of historical KPI values for impact analysis and anomaly detection.
+
+Two layouts coexist:
+- ``kpi_samples``: one row per sample (legacy, simple point lookups).
+- ``kpi_sample_buckets``: one row per (tenant, entity, metric, minute) holding
+  the minute's samples as parallel arrays ("vertical" storage). Per-row heap
+  header and WAL overhead is paid once per bucket instead of once per sample.
 """
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Float, DateTime, Index, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from backend.app.core.database import Base
+from sqlalchemy import Column, String, Float, DateTime, Index, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from backend.app.core.database import Base, loaded_repr
 
 
 class KpiSampleORM(Base):
@@ -74,11 +80,79 @@ class KpiSampleORM(Base):
     
     # Composite indexes for efficient time-series range queries
     __table_args__ = (
-        # Primary query pattern: (entity, metric, time DESC) for recent values
-        Index('ix_kpi_entity_metric_time', 'entity_id', 'metric_name', 'timestamp'),
+        # Primary query pattern: (entity, metric, time DESC) for recent values.
+        # INCLUDE(value) makes it covering, so "last N samples" reads are index-only scans.
+        Index(
+            'ix_kpi_entity_metric_time', 'entity_id', 'metric_name', 'timestamp',
+            postgresql_include=['value'],
+        ),
         # Aggregation pattern: tenant filtering first for multi-tenancy
         Index('ix_kpi_tenant_entity_metric', 'tenant_id', 'entity_id', 'metric_name'),
     )
     
     def __repr__(self) -> str:
-        return f"KpiSampleORM(entity={self.entity_id}, metric={self.metric_name}, value={self.value}, ts={self.timestamp})"
+        return loaded_repr(self, "entity_id", "metric_name", "value", "timestamp")
+
+
+class KpiSampleBucketORM(Base):
+    """
+    One minute of KPI samples for a single (entity, metric) pair.
+
+    ``values[i]`` was measured at ``bucket_start + ts_offsets_ms[i]`` milliseconds.
+    Rows are written by ``KpiSampleBucketBuffer`` (services/kpi_sample_buckets.py)
+    which accumulates samples in-process and flushes one row per key.
+
+    Read patterns:
+    - Expand:    ``SELECT ... FROM kpi_sample_buckets, unnest(values, ts_offsets_ms)``
+    - Aggregate: ``(SELECT AVG(v) FROM unnest(values) v)`` — evaluated inside Postgres.
+    """
+    __tablename__ = "kpi_sample_buckets"
+
+    # Natural primary key: (tenant, entity, metric, minute)
+    tenant_id = Column(String(100), primary_key=True)
+    entity_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("network_entities.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    metric_name = Column(String(100), primary_key=True)
+    # UTC minute boundary (seconds/microseconds truncated)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+
+    # Parallel arrays — same length, same order
+    values = Column(ARRAY(Float), nullable=False)
+    ts_offsets_ms = Column(ARRAY(Integer), nullable=False)
+
+    # Origin system identifier (see KpiSampleORM.source)
+    source = Column(String(50), nullable=False)
+
+    __table_args__ = (
+        # Time-range scans across all entities of a tenant
+        Index('ix_kpi_bucket_tenant_start', 'tenant_id', 'bucket_start'),
+    )
+
+    def __repr__(self) -> str:
+        return loaded_repr(self, "entity_id", "metric_name", "bucket_start")
+
+    @staticmethod
+    async def bulk_insert(session, buckets: list):
+        """
+        Insert flushed buckets, appending to any row that already exists for the same minute
+        (e.g. a second flush for a late-arriving sample).
+        """
+        from sqlalchemy.dialects.postgresql import insert
+
+        if not buckets:
+            return
+
+        stmt = insert(KpiSampleBucketORM).values(buckets)
+        table = KpiSampleBucketORM.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tenant_id", "entity_id", "metric_name", "bucket_start"],
+            set_={
+                "values": table.c["values"].concat(stmt.excluded["values"]),
+                "ts_offsets_ms": table.c.ts_offsets_ms.concat(stmt.excluded.ts_offsets_ms),
+            },
+        )
+
+        await session.execute(stmt)
@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from sqlalchemy import Column, DateTime, Float, Index, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
-from backend.app.core.database import Base
+from backend.app.core.database import Base, loaded_repr
 
 
 class NetworkEntityORM(Base):
@@ -91,4 +91,4 @@ class NetworkEntityORM(Base):
     updated_at = Column(DateTime, nullable=True)  # Present in DB, was missing from ORM
 
     def __repr__(self) -> str:
-        return f"NetworkEntityORM(id={self.id}, type={self.entity_type}, name={self.name}, tenant_id={self.tenant_id})"
+        return loaded_repr(self, "id", "entity_type", "name", "tenant_id")
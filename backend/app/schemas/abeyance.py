@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ---- Enums (LLD §5, §8, §13) ----
@@ -225,8 +225,7 @@ class AbeyanceFragmentResponse(BaseModel):
     mask_topological: Optional[bool] = None
     mask_operational: Optional[bool] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AbeyanceFragmentSummary(BaseModel):
@@ -244,8 +243,7 @@ class AbeyanceFragmentSummary(BaseModel):
     mask_topological: Optional[bool] = None
     mask_operational: Optional[bool] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SnapHistoryEntry(BaseModel):
@@ -268,8 +266,7 @@ class SnapHistoryEntry(BaseModel):
     masks_active: Optional[dict] = None
     evidence_sufficiency: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AccumulationEdgeResponse(BaseModel):
@@ -281,8 +278,7 @@ class AccumulationEdgeResponse(BaseModel):
     strongest_failure_mode: Optional[str] = None
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AccumulationClusterResponse(BaseModel):
@@ -305,8 +301,7 @@ class ShadowEntityResponse(BaseModel):
     first_seen: Optional[datetime] = None
     last_evidence: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ShadowRelationshipResponse(BaseModel):
@@ -320,8 +315,7 @@ class ShadowRelationshipResponse(BaseModel):
     exported_to_cmdb: bool = False
     cmdb_reference_tag: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ShadowNeighbourhoodResponse(BaseModel):
@@ -351,8 +345,7 @@ class DiscoveryLedgerResponse(BaseModel):
     discovery_confidence: float = 0.0
     status: str = "ACTIVE"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ValueEventResponse(BaseModel):
@@ -366,8 +359,7 @@ class ValueEventResponse(BaseModel):
     attributed_value_currency: Optional[float] = None
     attribution_rationale: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ValueReportResponse(BaseModel):
@@ -417,8 +409,7 @@ class DiscoveryLoopResponse(BaseModel):
     fragment_id: str
     stages: dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DiscoveryBackgroundResponse(BaseModel):
@@ -0,0 +1,21 @@
+"""
+Shared schema helpers.
+"""
+from typing import Any
+
+
+class TrustedFromORM:
+    """
+    Mixin for response schemas built from rows Pedkai itself wrote.
+
+    ``from_orm_trusted`` copies attributes straight into ``model_construct``,
+    skipping Pydantic validation. Only use it for data read back from our own
+    database on fan-out read paths; inbound payloads (``CustomerCreate``,
+    ``IncidentCreate``, ``PolicyCreate``, ``PolicyEvaluationRequest``, ...) must
+    still go through normal validation.
+    """
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        data = {name: getattr(obj, name, None) for name in cls.model_fields}
+        return cls.model_construct(**data)
@@ -4,7 +4,9 @@ Pydantic Schemas for Phase 14: Customer Experience Intelligence.
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.app.schemas.base import TrustedFromORM
 
 class CustomerBase(BaseModel):
     external_id: str
@@ -15,15 +17,14 @@ class CustomerBase(BaseModel):
 class CustomerCreate(CustomerBase):
     pass
 
-class CustomerSchema(CustomerBase):
+class CustomerSchema(TrustedFromORM, CustomerBase):
     id: UUID
     tenant_id: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
-class ProactiveCareSchema(BaseModel):
+class ProactiveCareSchema(TrustedFromORM, BaseModel):
     id: UUID
     customer_id: UUID
     anomaly_id: Optional[UUID] = None
@@ -32,8 +33,7 @@ class ProactiveCareSchema(BaseModel):
     message_content: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CXImpactAnalysis(BaseModel):
     anomaly_id: UUID
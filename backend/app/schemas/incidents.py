@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class IncidentStatus(str, Enum):
@@ -83,6 +83,8 @@ class ReasoningStep(BaseModel):
     confidence: float = Field(0.0, ge=0.0, le=1.0)
     source: Optional[str] = None  # e.g., "topology_graph", "kpi_data", "decision_memory"
 
+    model_config = ConfigDict(frozen=True)
+
 
 class IncidentCreate(BaseModel):
     tenant_id: str
@@ -119,8 +121,7 @@ class IncidentResponse(BaseModel):
     ai_generated: bool = False
     ai_watermark: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ApprovalRequest(BaseModel):
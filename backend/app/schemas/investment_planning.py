@@ -6,6 +6,8 @@ from typing import List, Dict, Any, Optional
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field
 
+from backend.app.schemas.base import TrustedFromORM
+
 class SitePlacement(BaseModel):
     name: str
     lat: float
@@ -19,7 +21,7 @@ class DensificationCreate(BaseModel):
     target_kpi: Optional[str] = "prb_utilization"
     parameters: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
-class DensificationSchema(DensificationCreate):
+class DensificationSchema(TrustedFromORM, DensificationCreate):
     id: UUID
     tenant_id: str
     status: str
@@ -27,7 +29,7 @@ class DensificationSchema(DensificationCreate):
     
     model_config = ConfigDict(from_attributes=True)
 
-class InvestmentPlanSchema(BaseModel):
+class InvestmentPlanSchema(TrustedFromORM, BaseModel):
     id: UUID
     request_id: UUID
     total_estimated_cost: float
@@ -6,9 +6,11 @@ Pydantic models for Policy API requests/responses.
 
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
+from backend.app.schemas.base import TrustedFromORM
+
 
 class ActionDecisionEnum(str, Enum):
     """Decision outcomes for policy evaluation"""
@@ -20,7 +22,7 @@ class ActionDecisionEnum(str, Enum):
 class PolicyRules(BaseModel):
     """Policy rule constraints for autonomous actions"""
     allowed_actions: List[str] = Field(
-        default=["cell_failover", "connection_throttle", "alarm_silence"],
+        default_factory=lambda: ["cell_failover", "connection_throttle", "alarm_silence"],
         description="Action types this policy permits"
     )
     blast_radius_limit: int = Field(default=100, description="Max entities affected by single action")
@@ -28,8 +30,8 @@ class PolicyRules(BaseModel):
     min_success_rate: float = Field(default=0.90, description="Min historical success rate")
     confirmation_window_sec: int = Field(default=30, description="Seconds before auto-execute")
     auto_rollback_threshold_pct: float = Field(default=10.0, description="Trigger rollback if KPI degrades >X%")
-    allowed_entity_types: List[str] = Field(default=["CELL", "SECTOR"], description="Target entity types")
-    restricted_vendors: List[str] = Field(default=[], description="Vendors to exclude from autonomy")
+    allowed_entity_types: List[str] = Field(default_factory=lambda: ["CELL", "SECTOR"], description="Target entity types")
+    restricted_vendors: List[str] = Field(default_factory=list, description="Vendors to exclude from autonomy")
 
 
 class PolicyCreate(BaseModel):
@@ -50,7 +52,7 @@ class PolicyUpdate(BaseModel):
     change_reason: Optional[str] = None
 
 
-class PolicyResponse(BaseModel):
+class PolicyResponse(TrustedFromORM, BaseModel):
     """Response containing policy details"""
     id: str
     tenant_id: str
@@ -63,8 +65,7 @@ class PolicyResponse(BaseModel):
     updated_at: datetime
     created_by: Optional[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PolicyEvaluationRule(BaseModel):
@@ -93,11 +94,10 @@ class PolicyEvaluationResponse(BaseModel):
     trace_id: Optional[str] = None
     recommended_confirmation_window_sec: int = 30
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class PolicyAuditEntry(BaseModel):
+class PolicyAuditEntry(TrustedFromORM, BaseModel):
     """Single entry in policy evaluation audit trail"""
     id: str
     policy_id: str
@@ -109,8 +109,7 @@ class PolicyAuditEntry(BaseModel):
     matched_rules: Dict[str, Any]
     trace_id: Optional[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PolicyVersionResponse(BaseModel):
@@ -121,5 +120,4 @@ class PolicyVersionResponse(BaseModel):
     modified_at: datetime
     change_reason: Optional[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -6,7 +6,7 @@ Shared contract used by: WS4 (correlation API), WS3 (frontend).
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AlarmCluster(BaseModel):
@@ -22,6 +22,8 @@ class AlarmCluster(BaseModel):
     ai_generated: bool = False
     ai_watermark: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CustomerImpact(BaseModel):
     """A customer impacted by a service issue."""
@@ -39,6 +41,8 @@ class CustomerImpact(BaseModel):
     complaint_count: int = 0
     priority_score: Optional[float] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ServiceImpactSummary(BaseModel):
     """Summary of service impact for a cluster or incident."""
@@ -6,10 +6,12 @@ Shared contract used by: WS1 (topology API), WS3 (frontend), WS4 (correlation).
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from backend.app.schemas.base import TrustedFromORM
 
-class EntityResponse(BaseModel):
+
+class EntityResponse(TrustedFromORM, BaseModel):
     """A single network entity in the topology graph."""
     id: str | UUID
     external_id: str
@@ -19,11 +21,11 @@ class EntityResponse(BaseModel):
     properties: Optional[Dict[str, Any]] = None
     last_synced_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    # Output-only and built in large lists — immutable once constructed.
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
-class RelationshipResponse(BaseModel):
+class RelationshipResponse(TrustedFromORM, BaseModel):
     """A relationship between two entities."""
     id: UUID
     source_entity_id: str | UUID
@@ -31,8 +33,7 @@ class RelationshipResponse(BaseModel):
     relationship_type: str
     properties: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TopologyHealth(BaseModel):
@@ -62,9 +63,11 @@ class ImpactTreeNode(BaseModel):
     direction: str  # "upstream" or "downstream"
     relationship_type: str
     depth: int
-    children: Optional[List["ImpactTreeNode"]] = None
+    children: Optional[tuple["ImpactTreeNode", ...]] = None
     revenue_at_risk: Optional[float] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ImpactTreeResponse(BaseModel):
     """Impact analysis result."""
@@ -77,6 +80,79 @@ class ImpactTreeResponse(BaseModel):
     total_revenue_at_risk: Optional[float] = None
 
 
+class ImpactTreeFlat(BaseModel):
+    """
+    One direction of an impact tree as parallel arrays (one slot per node).
+
+    Nodes are in traversal (pre-order) order; ``parents[i]`` is the index of
+    node i's parent, or -1 for nodes hanging directly off the root entity.
+    Avoids one model instance per node for large trees.
+    """
+    direction: str  # "upstream" or "downstream"
+    entity_ids: List[str] = Field(default_factory=list)
+    entity_names: List[str] = Field(default_factory=list)
+    entity_types: List[str] = Field(default_factory=list)
+    external_ids: List[str] = Field(default_factory=list)
+    relationship_types: List[str] = Field(default_factory=list)
+    depths: List[int] = Field(default_factory=list)
+    parents: List[int] = Field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def append(
+        self,
+        entity_id: str,
+        entity_name: str,
+        entity_type: str,
+        external_id: str,
+        relationship_type: str,
+        depth: int,
+        parent: int,
+    ) -> int:
+        """Add a node and return its index."""
+        self.entity_ids.append(entity_id)
+        self.entity_names.append(entity_name)
+        self.entity_types.append(entity_type)
+        self.external_ids.append(external_id)
+        self.relationship_types.append(relationship_type)
+        self.depths.append(depth)
+        self.parents.append(parent)
+        return len(self.entity_ids) - 1
+
+    def children_of(self, index: int) -> List[int]:
+        """Indices of the direct children of node ``index`` (-1 for the root)."""
+        return [i for i, p in enumerate(self.parents) if p == index]
+
+    def to_nodes(self) -> List[ImpactTreeNode]:
+        """Legacy per-node view, in the same order as the arrays."""
+        return [
+            ImpactTreeNode.model_construct(
+                entity_id=self.entity_ids[i],
+                entity_name=self.entity_names[i],
+                entity_type=self.entity_types[i],
+                external_id=self.external_ids[i],
+                direction=self.direction,
+                relationship_type=self.relationship_types[i],
+                depth=self.depths[i],
+                children=None,
+                revenue_at_risk=None,
+            )
+            for i in range(len(self.entity_ids))
+        ]
+
+
+class ImpactTreeFlatResponse(BaseModel):
+    """Impact analysis result with each direction in flat array layout."""
+    root_entity_id: str | UUID
+    root_entity_name: str
+    root_entity_type: str
+    upstream: ImpactTreeFlat
+    downstream: ImpactTreeFlat
+    total_customers_impacted: int = 0
+    total_revenue_at_risk: Optional[float] = None
+
+
 # Rebuild forward refs
 TopologyGraphResponse.model_rebuild()
 ImpactTreeNode.model_rebuild()
@@ -4,10 +4,11 @@ Queries decision traces without embeddings and populates them.
 """
 import asyncio
 import argparse
-from typing import List
+from collections import deque
+from typing import Deque, List
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import async_session_maker
@@ -17,58 +18,110 @@ from backend.app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
-async def backfill_embeddings(batch_size: int = 50, dry_run: bool = False):
-    """Backfill missing embeddings for decision traces."""
+async def _embed_batch(embedding_service, batch) -> List:
+    """Build decision texts for a batch of rows and embed them in one provider call."""
+    texts = embedding_service.create_decision_text_batch(batch)
+    return await embedding_service.generate_embeddings(texts)
+
+
+async def _fetch_batch(session, batch_size: int, after_id) -> List:
+    """Next page of records missing embeddings, keyset-paginated on id."""
+    stmt = (
+        select(
+            DecisionTraceORM.id,
+            DecisionTraceORM.trigger_description,
+            DecisionTraceORM.decision_summary,
+            DecisionTraceORM.tradeoff_rationale,
+            DecisionTraceORM.action_taken,
+        )
+        .where(DecisionTraceORM.embedding.is_(None))
+        .order_by(DecisionTraceORM.id)
+        .limit(batch_size)
+    )
+    if after_id is not None:
+        stmt = stmt.where(DecisionTraceORM.id > after_id)
+    result = await session.execute(stmt)
+    return result.all()
+
+
+async def backfill_embeddings(batch_size: int = 50, dry_run: bool = False, concurrency: int = 16):
+    """
+    Backfill missing embeddings for decision traces.
+
+    Records are read one keyset page at a time, so at most ``concurrency``
+    batches are held in memory regardless of table size. Up to that many
+    batches have embedding requests in flight at once; results are written and
+    committed in batch order as each one completes.
+    """
     embedding_service = get_embedding_service()
+    logger.info(f"Starting backfill (batch_size={batch_size}, concurrency={concurrency}, dry_run={dry_run})...")
     
     async with async_session_maker() as session:
-        # Find records with missing embeddings
-        stmt = select(DecisionTraceORM).where(DecisionTraceORM.embedding.is_(None))
-        result = await session.execute(stmt)
-        records = result.scalars().all()
-        
-        total = len(records)
-        if total == 0:
+        seen = 0
+        count = 0
+        written = 0
+        batches_written = 0
+        in_flight: Deque = deque()
+
+        async def _write_oldest():
+            nonlocal count, written, batches_written
+            batch, task = in_flight.popleft()
+            embeddings = await task
+
+            # ORM bulk UPDATE by primary key: one executemany per batch
+            params = [
+                {
+                    "id": record.id,
+                    "embedding": embedding,
+                    "embedding_provider": embedding_service.provider,
+                    "embedding_model": embedding_service.model_name,
+                }
+                for record, embedding in zip(batch, embeddings)
+                if embedding
+            ]
+            if params:
+                await session.execute(update(DecisionTraceORM), params)
+                count += len(params)
+
+            await session.commit()
+            written += len(batch)
+            batches_written += 1
+            logger.info(f"Committed batch {batches_written}. Total processed: {written}")
+
+        try:
+            after_id = None
+            while True:
+                batch = await _fetch_batch(session, batch_size, after_id)
+                if not batch:
+                    break
+                after_id = batch[-1].id
+                seen += len(batch)
+
+                if dry_run:
+                    count += len(batch)
+                    logger.info(f"Dry run: Would have processed {len(batch)} records. Total: {seen}")
+                    continue
+
+                in_flight.append((batch, asyncio.create_task(_embed_batch(embedding_service, batch))))
+                if len(in_flight) >= concurrency:
+                    await _write_oldest()
+            while in_flight:
+                await _write_oldest()
+        finally:
+            for _, task in in_flight:
+                task.cancel()
+
+        if seen == 0:
             logger.info("No records found missing embeddings.")
             return
 
-        logger.info(f"Found {total} records missing embeddings. Starting backfill (batch_size={batch_size}, dry_run={dry_run})...")
-        
-        count = 0
-        for i in range(0, total, batch_size):
-            batch = records[i:i+batch_size]
-            
-            for record in batch:
-                # Prepare text for embedding
-                text = embedding_service.create_decision_text(
-                    trigger_description=record.trigger_description or "",
-                    decision_summary=record.decision_summary or "",
-                    tradeoff_rationale=record.tradeoff_rationale or "",
-                    action_taken=record.action_taken or ""
-                )
-                
-                if not dry_run:
-                    embedding = await embedding_service.generate_embedding(text)
-                    if embedding:
-                        record.embedding = embedding
-                        record.embedding_provider = embedding_service.provider
-                        record.embedding_model = embedding_service.model_name
-                        count += 1
-                else:
-                    count += 1
-            
-            if not dry_run:
-                await session.commit()
-                logger.info(f"Committed batch {i//batch_size + 1}. Total processed: {min(i+batch_size, total)}/{total}")
-            else:
-                logger.info(f"Dry run: Would have processed batch {i//batch_size + 1}. Total: {min(i+batch_size, total)}/{total}")
-
-        logger.info(f"Backfill complete. Processed {count} records.")
+        logger.info(f"Backfill complete. Processed {count} of {seen} records.")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Backfill missing embeddings.")
     parser.add_argument("--batch-size", type=int, default=50, help="Batch size for processing.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Maximum batches with embedding requests in flight.")
     parser.add_argument("--dry-run", action="store_true", help="Perform a dry run without committing changes.")
     args = parser.parse_args()
     
-    asyncio.run(backfill_embeddings(batch_size=args.batch_size, dry_run=args.dry_run))
+    asyncio.run(backfill_embeddings(batch_size=args.batch_size, dry_run=args.dry_run, concurrency=args.concurrency))
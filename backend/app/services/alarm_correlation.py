@@ -8,10 +8,13 @@ and business impact (revenue-at-risk, emergency service detection).
 
 Used by: WS4 (service_impact API router).
 """
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select, text
 from contextlib import asynccontextmanager
@@ -21,8 +24,148 @@ from backend.app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba not available — using NumPy path for alarm cluster merging")
+
 # Temporal clustering window: alarms within this window are candidates for grouping
 TEMPORAL_WINDOW_MINUTES = 5
+_WINDOW_US = TEMPORAL_WINDOW_MINUTES * 60 * 1_000_000
+
+# Severity rank used to pick a cluster's headline severity (higher wins)
+_SEVERITY_RANK = {"critical": 4, "major": 3, "minor": 2, "warning": 1}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NO_TIME_US = np.iinfo(np.int64).max  # sort key for alarms without a timestamp
+_ONE_US = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO-8601 string (``Z`` suffix accepted), or None if malformed.
+
+    Memoised: alarm storms repeat the same raised_at strings many times and the
+    parsed datetimes are immutable, so sharing them is safe.
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _epoch_us(dt: datetime) -> int:
+    """Exact integer microseconds since the epoch (naive datetimes treated as UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_US
+
+
+def _merge_labels(
+    min_us: np.ndarray, max_us: np.ndarray, has_time: np.ndarray, window_us: int
+) -> np.ndarray:
+    """
+    Greedy same-type merge kernel: each unassigned cluster i seeds a group and
+    absorbs every unassigned later cluster whose time range overlaps i's range
+    within the window. Returns the seed index for every cluster.
+
+    Plain loops so it compiles under numba; used only when numba is installed.
+    """
+    n = min_us.shape[0]
+    labels = np.full(n, -1, dtype=np.int64)
+    for i in range(n):
+        if labels[i] != -1:
+            continue
+        labels[i] = i
+        if not has_time[i]:
+            continue
+        lo = min_us[i] - window_us
+        hi = max_us[i] + window_us
+        for j in range(i + 1, n):
+            if labels[j] == -1 and has_time[j] and lo <= max_us[j] and min_us[j] <= hi:
+                labels[j] = i
+    return labels
+
+
+def _chain_starts(
+    sorted_entity: np.ndarray, sorted_time: np.ndarray, window_us: int, no_time: int
+) -> np.ndarray:
+    """
+    Per-entity temporal chaining kernel over alarms sorted by (entity, time).
+
+    Marks the alarms that open a new proto-cluster: the first alarm of each
+    entity, and any timed alarm more than ``window_us`` after the entity's last
+    timed alarm. Untimed alarms (``no_time``) always chain onto the current
+    cluster. Plain loops so it compiles under numba; used only when numba is
+    installed.
+    """
+    n = sorted_time.shape[0]
+    starts = np.zeros(n, dtype=np.bool_)
+    last = no_time
+    for k in range(n):
+        t = sorted_time[k]
+        if k == 0 or sorted_entity[k] != sorted_entity[k - 1]:
+            starts[k] = True
+            last = t
+            continue
+        if t != no_time and last != no_time and t - last > window_us:
+            starts[k] = True
+        if t != no_time:
+            last = t
+    return starts
+
+
+class _ProtoCluster:
+    """
+    Alarm indices of one cluster plus the aggregates Step 5 reports.
+
+    Severity and emergency flag are computed once when a per-entity
+    proto-cluster closes; cross-entity merges then combine aggregates instead
+    of rescanning alarms. Ties resolve to the earliest member, as a scan of the
+    concatenated members would.
+    """
+
+    __slots__ = ("members", "rank", "severity", "is_emergency", "entity_counts")
+
+    def __init__(self, members: List[int], alarms: List[Dict[str, Any]]):
+        self.members = members
+        self.rank = -1
+        self.severity = "minor"
+        self.is_emergency = False
+        for i in members:
+            a = alarms[i]
+            severity = a.get("severity", "minor")
+            rank = _SEVERITY_RANK.get(severity, 0)
+            if rank > self.rank:
+                self.rank = rank
+                self.severity = severity
+            if not self.is_emergency and (
+                a.get("entity_type") == "EMERGENCY_SERVICE" or a.get("is_emergency_service")
+            ):
+                self.is_emergency = True
+        # Proto-clusters never span entities
+        eid = alarms[members[0]].get("entity_id")
+        self.entity_counts: Dict[Any, int] = {eid: len(members)} if eid else {}
+
+    def absorb(self, other: "_ProtoCluster") -> None:
+        """Append ``other``'s alarms and fold in its aggregates."""
+        self.members.extend(other.members)
+        if other.rank > self.rank:
+            self.rank = other.rank
+            self.severity = other.severity
+        self.is_emergency = self.is_emergency or other.is_emergency
+        counts = self.entity_counts
+        for eid, count in other.entity_counts.items():
+            counts[eid] = counts.get(eid, 0) + count
+
+
+if NUMBA_AVAILABLE:
+    # cache=True persists the compiled kernels so workers skip the cold compile
+    _merge_labels = njit(cache=True)(_merge_labels)
+    _chain_starts = njit(cache=True)(_chain_starts)
 
 
 class AlarmCorrelationService:
@@ -38,178 +181,165 @@ class AlarmCorrelationService:
         self.session_factory = session_factory
 
     @asynccontextmanager
-    async def _get_session(self, session: Optional[AsyncSession] = None):
+    async def _get_session(self, session: Optional[AsyncSession] = None, *, commit: bool = False):
+        # Read paths skip the empty COMMIT round-trip; writers pass commit=True.
+        # The session context manager closes the session on exit.
         if session:
             yield session
         else:
             async with self.session_factory() as new_session:
                 try:
                     yield new_session
-                    await new_session.commit()
+                    if commit:
+                        await new_session.commit()
                 except Exception:
                     await new_session.rollback()
                     raise
-                finally:
-                    await new_session.close()
 
     def correlate_alarms(self, alarms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Optimized O(n log n) alarm correlation using sorting and spatial partitioning.
 
         Strategy (replaces O(n²) nested loop):
-        1. Parse timestamps and normalize alarms (O(n))
-        2. Group by entity_id (O(n))
-        3. Sort within each group by raised_at (O(k log k) per group)
+        1. Parse timestamps once into columnar arrays (entity code, epoch µs) (O(n);
+           vectorised datetime64 parse for uniform UTC ISO strings)
+        2-3. Group by entity_id and sort by raised_at with one stable lexsort (O(n log n))
         4. Merge temporally adjacent alarms within same entity (O(k) per group)
-        5. Cross-entity merge for same alarm_type with temporal overlap (O(m log m) where m = num groups)
+        5. Cross-entity merge for same alarm_type with temporal overlap
+           (per-cluster time ranges held in NumPy arrays; one vectorised sweep per cluster)
 
         Returns list of cluster dicts with same format as before.
         """
         if not alarms:
             return []
 
-        # Step 0: Parse all timestamps and normalize
-        normalized_alarms = []
-        for alarm in alarms:
-            time = self._parse_time(alarm.get("raised_at"))
-            normalized_alarms.append((alarm, time))
-
-        # Step 1: Group by entity_id (O(n))
-        entity_groups: Dict[Any, List[tuple]] = {}
-        for alarm, time in normalized_alarms:
-            entity_id = alarm.get("entity_id")
-            if entity_id not in entity_groups:
-                entity_groups[entity_id] = []
-            entity_groups[entity_id].append((alarm, time))
-
-        # Step 2: Sort within each group by raised_at (O(k log k))
-        for entity_id in entity_groups:
-            entity_groups[entity_id].sort(
-                key=lambda x: x[1] if x[1] else datetime.max
+        # Step 0: Parse all timestamps once and build columnar sort keys.
+        # Entity codes are assigned in first-seen order so groups come out in
+        # input order; untimed alarms sort after timed ones within an entity.
+        n = len(alarms)
+        time_col = self._time_column([a.get("raised_at") for a in alarms])
+        entity_codes: Dict[Any, int] = {}
+        entity_col = np.fromiter(
+            (entity_codes.setdefault(a.get("entity_id"), len(entity_codes)) for a in alarms),
+            dtype=np.int64,
+            count=n,
+        )
+
+        # Steps 1-2: Group by entity_id and sort by raised_at in one stable
+        # columnar sort, then split at entity boundaries.
+        order = np.lexsort((time_col, entity_col))
+
+        # Step 3: Create initial clusters within each entity using temporal window.
+        # Clusters hold alarm indices so later steps read the parsed columns, and
+        # are bucketed by alarm_type (that of their first alarm) as they close,
+        # with their severity/emergency aggregates computed at that point.
+        type_groups: Dict[Optional[str], List[_ProtoCluster]] = defaultdict(list)
+        sorted_entity = entity_col[order]
+        sorted_time = time_col[order]
+        if NUMBA_AVAILABLE:
+            # Compiled chaining pass marks cluster starts in one loop.
+            starts = _chain_starts(sorted_entity, sorted_time, _WINDOW_US, _NO_TIME_US)
+        else:
+            # Within an entity, timed alarms are ascending and untimed ones come
+            # last, so a timed alarm's predecessor is the entity's last timed
+            # alarm: a gap over the window (no abs needed) opens a new cluster.
+            # Untimed alarms always chain on.
+            starts = np.empty(n, dtype=np.bool_)
+            starts[0] = True
+            starts[1:] = (sorted_entity[1:] != sorted_entity[:-1]) | (
+                (sorted_time[1:] != _NO_TIME_US)
+                & (np.diff(sorted_time) > _WINDOW_US)
             )
-
-        # Step 3: Create initial clusters within each entity using temporal window
-        proto_clusters: List[List[Dict[str, Any]]] = []
-        for entity_id, group in entity_groups.items():
-            current_cluster: List[Dict[str, Any]] = []
-            last_time: Optional[datetime] = None
-
-            for alarm, time in group:
-                if not current_cluster:
-                    # Start new cluster
-                    current_cluster = [alarm]
-                    last_time = time
-                else:
-                    # Check if within temporal window
-                    within_window = False
-                    if time and last_time:
-                        diff = abs((time - last_time).total_seconds())
-                        within_window = diff <= TEMPORAL_WINDOW_MINUTES * 60
-                    elif not time or not last_time:
-                        # If no time data, keep clustering
-                        within_window = True
-
-                    if within_window:
-                        current_cluster.append(alarm)
-                        if time:
-                            last_time = time
-                    else:
-                        # Finalize current cluster and start new one
-                        if current_cluster:
-                            proto_clusters.append(current_cluster)
-                        current_cluster = [alarm]
-                        last_time = time
-
-            # Add final cluster
-            if current_cluster:
-                proto_clusters.append(current_cluster)
+        for c in np.split(order, np.flatnonzero(starts)[1:]):
+            cluster = c.tolist()
+            type_groups[alarms[cluster[0]].get("alarm_type")].append(_ProtoCluster(cluster, alarms))
 
         # Step 4: Merge proto-clusters across entities with same alarm_type and temporal overlap
-        # Group proto-clusters by alarm_type
-        type_groups: Dict[Optional[str], List[List[Dict[str, Any]]]] = {}
-        for cluster in proto_clusters:
-            alarm_type = cluster[0].get("alarm_type") if cluster else None
-            if alarm_type not in type_groups:
-                type_groups[alarm_type] = []
-            type_groups[alarm_type].append(cluster)
-
-        # Merge clusters of same type with temporal overlap
-        final_clusters: List[List[Dict[str, Any]]] = []
-        processed_clusters: set = set()
+
+        # Merge clusters of same type with temporal overlap.
+        # Each proto-cluster's time range is computed once into SoA arrays, so
+        # testing cluster i against every later cluster j is one vectorised
+        # comparison over the epoch-µs column parsed in Step 0.
+        # Seeds absorb later clusters in place; each proto-cluster is consumed once.
+        final_clusters: List[_ProtoCluster] = []
 
         for alarm_type, type_clusters in type_groups.items():
+            # Only attempt cross-entity merge if alarm_type is defined
+            # (i.e., NOT None). This preserves entity boundaries when alarm_type info is missing.
+            if alarm_type is None:
+                final_clusters.extend(type_clusters)
+                continue
+
+            min_us, max_us, has_time = self._time_bounds(
+                [c.members for c in type_clusters], time_col
+            )
+
+            if NUMBA_AVAILABLE:
+                labels = _merge_labels(min_us, max_us, has_time, _WINDOW_US)
+                # A seed's label is its own index and precedes every cluster it absorbs
+                for k, label in enumerate(labels.tolist()):
+                    if label == k:
+                        final_clusters.append(type_clusters[k])
+                    else:
+                        type_clusters[label].absorb(type_clusters[k])
+                continue
+
+            # Timed clusters sorted by start time. Any j overlapping i has
+            # min_j in [min_i - window - max_span, max_i + window], so two
+            # binary searches bound the candidates to a narrow slice.
+            timed = np.flatnonzero(has_time)
+            by_start = timed[np.argsort(min_us[timed], kind="stable")]
+            sorted_min = min_us[by_start]
+            max_span = int((max_us[timed] - min_us[timed]).max()) if timed.size else 0
+
+            # Bitmap of clusters already absorbed into an earlier merge
+            assigned = np.zeros(len(type_clusters), dtype=np.bool_)
             for i, cluster_i in enumerate(type_clusters):
-                cluster_key_i = (alarm_type, i)
-                if cluster_key_i in processed_clusters:
+                if assigned[i]:
                     continue
 
                 # Start with cluster_i
-                merged = list(cluster_i)
-                processed_clusters.add(cluster_key_i)
-
-                # Only attempt cross-entity merge if alarm_type is defined
-                # (i.e., NOT None). This preserves entity boundaries when alarm_type info is missing.
-                if alarm_type is not None:
-                    # Get time range of cluster_i
-                    times_i = [self._parse_time(a.get("raised_at")) for a in cluster_i]
-                    times_i = [t for t in times_i if t is not None]
-
-                    if times_i:
-                        min_time_i = min(times_i)
-                        max_time_i = max(times_i)
-
-                        # Try to merge other clusters of same type with temporal overlap
-                        for j, cluster_j in enumerate(type_clusters):
-                            cluster_key_j = (alarm_type, j)
-                            if cluster_key_j in processed_clusters or j <= i:
-                                continue
-
-                            times_j = [self._parse_time(a.get("raised_at")) for a in cluster_j]
-                            times_j = [t for t in times_j if t is not None]
-
-                            if times_j:
-                                min_time_j = min(times_j)
-                                max_time_j = max(times_j)
-
-                                # Check for temporal overlap within extended window
-                                window_delta = timedelta(minutes=TEMPORAL_WINDOW_MINUTES)
-                                if (min_time_i <= max_time_j + window_delta and
-                                    min_time_j <= max_time_i + window_delta):
-                                    merged.extend(cluster_j)
-                                    processed_clusters.add(cluster_key_j)
-
-                if merged:
-                    final_clusters.append(merged)
-
-        # Step 5: Convert to output format
+                merged = cluster_i
+                assigned[i] = True
+
+                if has_time[i]:
+                    lo = np.searchsorted(sorted_min, min_us[i] - _WINDOW_US - max_span, side="left")
+                    hi = np.searchsorted(sorted_min, max_us[i] + _WINDOW_US, side="right")
+                    cand = by_start[lo:hi]
+                    # Temporal overlap within extended window, against unassigned clusters j > i only
+                    cand = cand[
+                        (cand > i)
+                        & ~assigned[cand]
+                        & (min_us[i] <= max_us[cand] + _WINDOW_US)
+                    ]
+                    # Absorb in original cluster order, as the seed-range merge always has
+                    absorbed = np.sort(cand)
+                    for j in absorbed.tolist():
+                        merged.absorb(type_clusters[j])
+                    assigned[absorbed] = True
+
+                final_clusters.append(merged)
+
+        # Step 5: Convert to output format from the aggregates carried through
+        # Steps 3-4; alarms are not rescanned.
+        created_at = datetime.now(timezone.utc).isoformat()
         clusters: List[Dict[str, Any]] = []
-        for cluster_alarms in final_clusters:
-            if not cluster_alarms:
-                continue
+        for cluster in final_clusters:
+            # Emergency service clusters are always critical
+            is_emergency = cluster.is_emergency
+            cluster_severity = "critical" if is_emergency else cluster.severity
 
-            # Determine cluster severity
-            severities = [a.get("severity", "minor") for a in cluster_alarms]
-            cluster_severity = self._highest_severity(severities)
-
-            # Check for emergency service
-            is_emergency = any(
-                a.get("entity_type") == "EMERGENCY_SERVICE" or a.get("is_emergency_service")
-                for a in cluster_alarms
-            )
-            if is_emergency:
-                cluster_severity = "critical"
-
-            # Determine root cause entity (most frequent entity in cluster)
-            entity_ids = [a.get("entity_id") for a in cluster_alarms if a.get("entity_id")]
-            root_entity_id = max(set(entity_ids), key=entity_ids.count) if entity_ids else None
+            # Root cause entity: most frequent in cluster (first seen wins ties)
+            entity_counts = cluster.entity_counts
+            root_entity_id = max(entity_counts, key=entity_counts.__getitem__) if entity_counts else None
 
             clusters.append({
-                "alarm_count": len(cluster_alarms),
-                "alarms": cluster_alarms,
+                "alarm_count": len(cluster.members),
+                "alarms": [alarms[i] for i in cluster.members],
                 "severity": cluster_severity,
                 "is_emergency_service": is_emergency,
                 "root_cause_entity_id": root_entity_id,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": created_at,
             })
 
         return clusters
@@ -236,13 +366,18 @@ class AlarmCorrelationService:
         try:
             async with self._get_session(session) as s:
                 # Finding S-1 Fix: Enforce tenant isolation
+                # ANY(:site_ids) with a list bind keeps one statement text (and one
+                # prepared plan) regardless of how many sites are passed. Served by
+                # ix_customers_tenant_site (tenant_id, associated_site_id).
+                # Clusters repeat entity ids once per alarm; bind each site once.
+                site_ids = list(dict.fromkeys(cluster_entity_ids))
                 query = text("""
                     SELECT c.id, c.name, c.external_id, c.tenant_id
                     FROM customers c
-                    WHERE c.associated_site_id IN :site_ids
-                    AND c.tenant_id = :tid
+                    WHERE c.tenant_id = :tid
+                    AND c.associated_site_id = ANY(:site_ids)
                 """)
-                result = await s.execute(query, {"site_ids": tuple(cluster_entity_ids), "tid": tenant_id})
+                result = await s.execute(query, {"site_ids": site_ids, "tid": tenant_id})
                 rows = result.fetchall()
                 for row in rows:
                     impacted_customers.append({
@@ -261,13 +396,65 @@ class AlarmCorrelationService:
         if isinstance(time_val, datetime):
             return time_val
         if isinstance(time_val, str):
-            try:
-                return datetime.fromisoformat(time_val.replace("Z", "+00:00"))
-            except ValueError:
-                return None
+            return _parse_iso(time_val)
         return None
 
-    def _highest_severity(self, severities: List[str]) -> str:
-        """Return the highest severity from a list."""
-        order = {"critical": 4, "major": 3, "minor": 2, "warning": 1}
-        return max(severities, key=lambda s: order.get(s, 0), default="minor")
+    def _time_column(self, values: List[Any]) -> np.ndarray:
+        """
+        raised_at values as int64 epoch microseconds (``_NO_TIME_US`` if missing
+        or unparseable).
+
+        Feeds that send uniform UTC ISO strings ("...Z" / "...+00:00") are parsed
+        in one vectorised datetime64 conversion; anything else (datetimes, other
+        offsets, malformed strings) goes through _parse_time per value.
+        """
+        if values and all(isinstance(v, str) for v in values):
+            stripped = []
+            for v in values:
+                if v.endswith("Z"):
+                    stripped.append(v[:-1])
+                elif v.endswith("+00:00"):
+                    stripped.append(v[:-6])
+                else:
+                    break
+            else:
+                try:
+                    parsed = np.array(stripped, dtype="datetime64[us]")
+                except ValueError:
+                    parsed = None
+                if parsed is not None and not np.isnat(parsed).any():
+                    return parsed.view(np.int64)
+
+        return np.fromiter(
+            (
+                _epoch_us(t) if t is not None else _NO_TIME_US
+                for t in map(self._parse_time, values)
+            ),
+            dtype=np.int64,
+            count=len(values),
+        )
+
+    @staticmethod
+    def _time_bounds(
+        clusters: List[List[int]], time_col: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-cluster (min, max) raised_at as int64 epoch microseconds, plus a mask
+        of clusters that carry at least one parseable timestamp.
+
+        ``time_col`` holds each alarm's epoch µs (``_NO_TIME_US`` if untimed).
+        Proto-clusters list their alarms in ascending time with untimed ones
+        last, so the bounds are the first and last timed members.
+        """
+        n = len(clusters)
+        min_us = np.zeros(n, dtype=np.int64)
+        max_us = np.zeros(n, dtype=np.int64)
+        has_time = np.zeros(n, dtype=np.bool_)
+        for k, cluster in enumerate(clusters):
+            stamps = time_col[cluster]
+            timed = stamps[stamps != _NO_TIME_US]
+            if timed.size:
+                min_us[k] = timed[0]
+                max_us[k] = timed[-1]
+                has_time[k] = True
+        return min_us, max_us, has_time
@@ -1,6 +1,12 @@
+import asyncio
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import bcrypt
 from sqlalchemy import delete, select
@@ -15,20 +21,69 @@ from backend.app.models.user_tenant_access_orm import UserTenantAccessORM
 logger = get_logger(__name__)
 
 
+# bcrypt cost factor. Production must keep the default of 12 or higher; test
+# and dev environments may set BCRYPT_ROUNDS=4 to make hashing near-instant.
+_BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+
 def hash_password(plain: str) -> str:
     """Hash a password using direct bcrypt for Python 3.14 compatibility."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(plain.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
 
+# Bounded memo of recently *verified* (password, hash) pairs so client
+# retries and repeat logins skip the ~100ms checkpw. Failed checks are never
+# memoised: a fast wrong-password reply would show that the username exists
+# (unknown users always pay the full dummy check) and would make repeated
+# guesses free. Keys are salted BLAKE2b digests; plaintext is never stored.
+_VERIFY_CACHE_SIZE = 1024
+_VERIFY_CACHE_SALT = os.urandom(16)
+_verify_cache: "OrderedDict[bytes, None]" = OrderedDict()
+_verify_cache_lock = threading.Lock()  # verify_password runs on worker threads
+
+
+def _verify_cache_key(plain: bytes, hashed: bytes) -> bytes:
+    return hashlib.blake2b(plain + b"|" + hashed, digest_size=16, key=_VERIFY_CACHE_SALT).digest()
+
+
+# Verified against when the user is missing or ineligible; computed once at
+# import at the configured cost so it takes as long as a real hash.
+_DUMMY_HASH = hash_password("pedkai-dummy-password")
+_DUMMY_HASH_BYTES = _DUMMY_HASH.encode("utf-8")
+
+
+def _dummy_verify(plain: str) -> None:
+    """Full-cost bcrypt check against the dummy hash.
+
+    Deliberately bypasses the verify memo: every missing user shares one
+    dummy hash, so a memo hit would answer in ~0ms and reveal that the
+    username does not exist.
+    """
+    bcrypt.checkpw(plain.encode("utf-8"), _DUMMY_HASH_BYTES)
+
+
 def verify_password(plain: str, hashed: str) -> bool:
     """Verify a password against a hash using direct bcrypt."""
+    plain_b = plain.encode("utf-8")
+    hashed_b = hashed.encode("utf-8")
+    key = _verify_cache_key(plain_b, hashed_b)
+    with _verify_cache_lock:
+        if key in _verify_cache:
+            _verify_cache.move_to_end(key)
+            return True
     try:
-        return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+        ok = bcrypt.checkpw(plain_b, hashed_b)
     except Exception as e:
         logger.error(f"Password verification error: {e}")
         return False
+    if ok:
+        with _verify_cache_lock:
+            _verify_cache[key] = None
+            if len(_verify_cache) > _VERIFY_CACHE_SIZE:
+                _verify_cache.popitem(last=False)
+    return ok
 
 
 async def get_user_by_username(
@@ -55,12 +110,89 @@ async def get_user_by_username(
     return result.scalar_one_or_none()
 
 
+async def get_users_by_usernames(
+    db: AsyncSession, usernames: List[str], tenant_id: Optional[str] = None
+) -> Dict[str, UserORM]:
+    """Resolve several usernames in one query, keyed by username.
+
+    Missing usernames are simply absent from the result.  The same tenant
+    scoping caveat as :func:`get_user_by_username` applies when *tenant_id*
+    is omitted.
+    """
+    if not usernames:
+        return {}
+    stmt = select(UserORM).where(UserORM.username.in_(usernames))
+    if tenant_id:
+        stmt = stmt.where(UserORM.tenant_id == tenant_id)
+    result = await db.execute(stmt)
+    return {u.username: u for u in result.scalars()}
+
+
+# ---------------------------------------------------------------------------
+# Login lookup cache
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class UserData:
+    """Detached snapshot of the ``users`` columns needed to authenticate."""
+    id: str
+    username: str
+    hashed_password: str
+    is_active: bool
+    role: str
+    tenant_id: str
+    must_change_password: bool
+
+    @classmethod
+    def from_orm(cls, user: UserORM) -> "UserData":
+        return cls(
+            id=user.id,
+            username=user.username,
+            hashed_password=user.hashed_password,
+            is_active=bool(user.is_active),
+            role=user.role,
+            tenant_id=user.tenant_id,
+            must_change_password=bool(user.must_change_password),
+        )
+
+
+# Short-TTL cache of login lookups keyed by (tenant_id, username); tenant_id
+# is None for the global admin lookup. Snapshots rather than ORM rows so no
+# entry is bound to a closed session. Only hits are cached. Entries may be
+# up to _USER_CACHE_TTL_S stale unless a writer calls invalidate_user().
+_USER_CACHE_TTL_S = 30.0
+_user_cache: Dict[Tuple[Optional[str], str], Tuple[float, UserData]] = {}
+
+
+def invalidate_user(username: str) -> None:
+    """Drop cached login data for *username* (all tenants)."""
+    for key in [k for k in _user_cache if k[1] == username]:
+        _user_cache.pop(key, None)
+
+
+async def _get_user_data(
+    db: AsyncSession, username: str, tenant_id: Optional[str] = None
+) -> Optional[UserData]:
+    key = (tenant_id or None, username)
+    now = time.monotonic()
+    cached = _user_cache.get(key)
+    if cached is not None and now - cached[0] < _USER_CACHE_TTL_S:
+        return cached[1]
+    user = await get_user_by_username(db, username, tenant_id=tenant_id)
+    if user is None:
+        _user_cache.pop(key, None)
+        return None
+    data = UserData.from_orm(user)
+    _user_cache[key] = (now, data)
+    return data
+
+
 async def authenticate_user(
     db: AsyncSession,
     username: str,
     password: str,
     tenant_id: Optional[str] = None,
-) -> Optional[UserORM]:
+) -> Optional[UserData]:
     """Authenticate a user by credentials.
 
     If *tenant_id* is supplied, the user is looked up by the composite
@@ -68,14 +200,20 @@ async def authenticate_user(
     login), the lookup is by username alone — but authentication only
     succeeds if the matched user has the ``admin`` role.  This prevents
     non-admin users from logging in without specifying a tenant.
+
+    Returns a detached :class:`UserData` snapshot, served from a short-TTL
+    cache on repeat logins.
     """
-    user = await get_user_by_username(db, username, tenant_id=tenant_id)
-    if not user or not user.is_active:
-        return None
+    user = await _get_user_data(db, username, tenant_id=tenant_id)
     # When no tenant_id is provided, only platform admins may authenticate.
-    if tenant_id is None and user.role != Role.ADMIN:
+    if not user or not user.is_active or (tenant_id is None and user.role != Role.ADMIN):
+        # Burn the same bcrypt cost as a real check so response time does not
+        # reveal whether the username exists.
+        await asyncio.to_thread(_dummy_verify, password)
         return None
-    if not verify_password(password, user.hashed_password):
+    # bcrypt is deliberately slow; run it on a worker thread so concurrent
+    # requests are not stalled behind each login.
+    if not await asyncio.to_thread(verify_password, password, user.hashed_password):
         return None
     return user
 
@@ -268,7 +406,7 @@ async def create_user_for_tenant(
 
     user = UserORM(
         username=username,
-        hashed_password=hash_password(password),
+        hashed_password=await asyncio.to_thread(hash_password, password),
         role=tenant_role,   # global default = the role they're being created with
         tenant_id=tenant_id,  # home tenant (part of composite unique with username)
         is_active=True,
@@ -339,6 +477,7 @@ async def set_user_active(db: AsyncSession, user_id: str, *, active: bool) -> bo
         return False
     user.is_active = active  # type: ignore[assignment]
     await db.commit()
+    invalidate_user(user.username)
     state = "activated" if active else "deactivated"
     logger.info(f"User {user_id} ({user.username}) {state}")
     return True
@@ -354,8 +493,9 @@ async def reset_user_password(
     user = await get_user_by_id(db, user_id)
     if user is None:
         return False
-    user.hashed_password = hash_password(new_password)  # type: ignore[assignment]
+    user.hashed_password = await asyncio.to_thread(hash_password, new_password)  # type: ignore[assignment]
     await db.commit()
+    invalidate_user(user.username)
     logger.info(f"Password reset for user {user_id} ({user.username})")
     return True
 
@@ -430,8 +570,8 @@ async def seed_default_users(db: AsyncSession) -> None:
 
         admin_user = UserORM(
             username="pedkai_admin",
-            hashed_password=hash_password(
-                os.getenv("PEDKAI_ADMIN_PASSWORD", "CHANGE_ME")
+            hashed_password=await asyncio.to_thread(
+                hash_password, os.getenv("PEDKAI_ADMIN_PASSWORD", "CHANGE_ME")
             ),
             role=Role.ADMIN,
             tenant_id=first_tenant_id,  # Legacy NOT NULL column; user_tenant_access is authoritative
@@ -450,15 +590,17 @@ async def seed_default_users(db: AsyncSession) -> None:
     tenants = list(existing_tenants.scalars().all())
 
     if tenants:
-        # Ensure access rows exist for pedkai_admin to all tenants
-        for tenant in tenants:
-            exists = await db.execute(
-                select(UserTenantAccessORM).where(
-                    UserTenantAccessORM.user_id == admin_user.id,
-                    UserTenantAccessORM.tenant_id == tenant.id,
-                )
+        # Ensure access rows exist for pedkai_admin to all tenants; one query
+        # for the existing grants rather than one per tenant.
+        granted = await db.execute(
+            select(UserTenantAccessORM.tenant_id).where(
+                UserTenantAccessORM.user_id == admin_user.id,
+                UserTenantAccessORM.tenant_id.in_([t.id for t in tenants]),
             )
-            if not exists.scalar_one_or_none():
+        )
+        granted_ids = set(granted.scalars())
+        for tenant in tenants:
+            if tenant.id not in granted_ids:
                 db.add(
                     UserTenantAccessORM(
                         user_id=admin_user.id,
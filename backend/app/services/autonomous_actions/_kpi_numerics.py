@@ -0,0 +1,50 @@
+"""
+Scalar kernels for post-execution KPI validation.
+
+Run once per streamed KPI sample while an action is being validated. Plain
+float arithmetic so they compile under numba when it is installed and run
+unchanged as Python otherwise.
+"""
+
+from backend.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba not available — KPI validation kernels run as Python")
+
+
+def update_ewma(prev: float, sample: float, alpha: float) -> float:
+    """Fold ``sample`` into the running EWMA; a NaN ``prev`` means no samples yet."""
+    if prev != prev:
+        return sample
+    return alpha * sample + (1.0 - alpha) * prev
+
+
+def degradation_pct(baseline: float, current: float) -> float:
+    """Drop of ``current`` below ``baseline`` in percent (negative = improvement)."""
+    return (baseline - current) / baseline * 100.0
+
+
+def check_degradation(baseline: float, current: float, thresh_pct: float) -> bool:
+    """True when ``current`` has fallen more than ``thresh_pct`` below ``baseline``."""
+    if baseline <= 0.0:
+        return False
+    return degradation_pct(baseline, current) > thresh_pct
+
+
+if NUMBA_AVAILABLE:
+    # cache=True persists the compiled kernels so workers skip the cold compile
+    update_ewma = njit(cache=True, nogil=True)(update_ewma)
+    degradation_pct = njit(cache=True, nogil=True)(degradation_pct)
+    check_degradation = njit(cache=True, nogil=True)(check_degradation)
+
+
+def warmup() -> None:
+    """Trigger compilation (or the cache load) outside the validation path."""
+    update_ewma(float("nan"), 1.0, 0.5)
+    check_degradation(1.0, 1.0, 10.0)
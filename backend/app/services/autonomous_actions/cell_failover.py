@@ -4,8 +4,8 @@ Cell Failover Action (P5.7)
 Identifies target cell and invokes Netconf adapter via executor pipeline.
 """
 from typing import Dict, Any, Optional, List
-from backend.app.services.netconf_adapter import NetconfSession
-from backend.app.services.digital_twin import DigitalTwinMock
+from backend.app.services.netconf_adapter import get_netconf_pool
+from backend.app.services.digital_twin import DigitalTwinMock, Prediction
 from backend.app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -16,22 +16,24 @@ class CellFailoverAction:
 
     def __init__(self, session_factory=None):
         self.session_factory = session_factory
+        self._twin = DigitalTwinMock(session_factory)
+
+    async def estimate_impact_as_prediction(self, db_session, source_cell: str, target_cell: Optional[str]) -> Prediction:
+        """Twin prediction for this failover, in the same shape as ``DigitalTwinMock.predict``."""
+        return await self._twin.predict(db_session, action_type="cell_failover", entity_id=source_cell, parameters={"target_cell": target_cell})
 
     async def estimate_impact(self, db_session, source_cell: str, target_cell: str) -> Dict[str, Any]:
-        dt = DigitalTwinMock(self.session_factory)
-        pred = await dt.predict(db_session, action_type="cell_failover", entity_id=source_cell, parameters={"target_cell": target_cell})
+        pred = await self.estimate_impact_as_prediction(db_session, source_cell, target_cell)
         return {"risk_score": pred.risk_score, "impact_delta": pred.impact_delta, "confidence_interval": pred.confidence_interval}
 
     async def validate_and_execute(self, db_session, device_host: str, source_cell: str, target_cell: str, dry_run: bool = True) -> Dict[str, Any]:
-        # Connect to device (PoC: host string encodes vendor)
-        session = NetconfSession(host=device_host)
-        session.connect(use_mock=True)
-        # Validate operation
-        validation = session.validate("cell_failover", {"target_cell": target_cell})
-        if not validation.get("valid"):
-            return {"success": False, "message": "validation_failed", "details": validation}
-        if dry_run:
-            return {"success": True, "message": "dry_run_ok", "details": validation}
-        # Execute
-        result = session.execute("cell_failover", {"target_cell": target_cell})
-        return result
+        # Pooled, already-connected session (PoC: host string encodes vendor)
+        async with get_netconf_pool().acquire(device_host) as session:
+            # Validate operation
+            validation = session.validate("cell_failover", {"target_cell": target_cell})
+            if not validation.get("valid"):
+                return {"success": False, "message": "validation_failed", "details": validation}
+            if dry_run:
+                return {"success": True, "message": "dry_run_ok", "details": validation}
+            # Execute
+            return await session.execute("cell_failover", {"target_cell": target_cell})
@@ -9,13 +9,18 @@ All recommended actions require human review and a formal change request.
 
 Used by: WS5 (autonomous API router).
 """
+import re
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from backend.app.schemas.autonomous import (
     DriftPrediction,
@@ -23,16 +28,391 @@ from backend.app.schemas.autonomous import (
     ChangeRequestOutput,
     ValueProtected,
 )
-from backend.app.services.drift_calibration import DriftCalibrationService
 from backend.app.core.config import get_settings
 from backend.app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+    logger.info("numba not available — using NumPy path for drift detection")
+
 # Drift thresholds
 DRIFT_THRESHOLD_PCT = 0.15  # 15% deviation from baseline triggers detection
 HIGH_CONFIDENCE_THRESHOLD = 0.7
 
+# Tracked-drift Kalman filter, in units of relative deviation from baseline
+KALMAN_PROCESS_VAR = 1e-4      # Q: how fast true drift may wander per sample
+KALMAN_MEASUREMENT_VAR = 1e-2  # R: ~10% sample noise around the true drift
+KALMAN_INNOVATION_GATE = 3.84  # chi-square, 1 dof, 95%
+# New series start at "no drift" with about the steady-state variance for the
+# Q and R above, so their first sample is weighed like any later one
+KALMAN_PRIOR_VAR = 1e-3
+KALMAN_MAX_SERIES = 65536      # least recently updated series are evicted past this
+
+# "... to 12.5%" in DriftCalibrationService recommendations
+_CALIB_PCT_RE = re.compile(r"to\s+([0-9]+\.?[0-9]*)%")
+
+
+# Metric keyword → playbook category, first match wins (order matters:
+# "error_load" is a load metric)
+_METRIC_CATEGORY_KEYWORDS = (
+    ("load", ("prb", "utilization", "load")),
+    ("latency", ("latency", "rtt")),
+    ("error", ("error", "fail")),
+)
+
+# category → (action template, benefit, risk, magnitude above which the
+# priority is critical rather than high; None = always medium)
+_PREVENTIVE_PLAYBOOK = {
+    "load": (
+        "Review PRB allocation on {entity}. Current utilization is {pct}% above baseline.",
+        "Prevent congestion-related service degradation",
+        "Continued drift may cause dropped calls and increased latency",
+        0.3,
+    ),
+    "latency": (
+        "Investigate routing path for {entity}. Latency is {pct}% above baseline.",
+        "Restore SLA-compliant response times",
+        "Latency breach may trigger SLA penalties",
+        float("inf"),  # always high
+    ),
+    "error": (
+        "Check hardware health and logs for {entity}. Error rate is {pct}% above baseline.",
+        "Prevent service outage",
+        "Unchecked error rate may indicate imminent hardware failure",
+        0.5,
+    ),
+    "other": (
+        "Monitor {metric} on {entity}. Deviation is {pct}% from baseline.",
+        "Early detection of potential service degradation",
+        "Continued drift may impact service quality",
+        None,
+    ),
+}
+
+
+# Change-request body filled in by generate_change_request
+_CR_DESCRIPTION_TPL = (
+    "Pedkai has detected a KPI drift and recommends the following action:\n\n"
+    "**Action**: {action}\n\n"
+    "**Expected Benefit**: {benefit}\n\n"
+    "**Risk if Ignored**: {risk}\n\n"
+    "**Priority**: {priority}\n\n"
+    "This change request was generated by Pedkai Autonomous Shield. "
+    "A qualified engineer must review, approve, and execute this change."
+)
+
+
+@lru_cache(maxsize=None)
+def _default_drift_frac() -> float:
+    """Configured drift threshold as a fraction (settings hold percent, eg 15.0 → 0.15)."""
+    return float(get_settings().drift_threshold_pct) / 100.0
+
+
+# int8 codes for DriftBatch.category, in playbook order
+METRIC_CATEGORIES = tuple(_PREVENTIVE_PLAYBOOK)
+_CATEGORY_CODE = {name: code for code, name in enumerate(METRIC_CATEGORIES)}
+
+
+@lru_cache(maxsize=1024)
+def _metric_category(metric_name: str) -> str:
+    """Classify a KPI name once; the set of metric names is small and stable."""
+    metric = metric_name.lower()
+    for category, keywords in _METRIC_CATEGORY_KEYWORDS:
+        if any(k in metric for k in keywords):
+            return category
+    return "other"
+
+
+def _drift_kernel(cur, base, thr):
+    """
+    Per-row loop form of ``drift_arrays`` (same formulas, same -1 sentinel).
+
+    Plain loops so it compiles under numba; used only when numba is installed.
+    """
+    n = cur.shape[0]
+    mag = np.empty(n)
+    conf = np.empty(n)
+    minutes = np.empty(n, np.int64)
+    for i in prange(n):
+        b = abs(base[i])
+        m = 0.0 if b == 0.0 else abs(cur[i] - base[i]) / b
+        c = min(0.95, m * 2.5)
+        mag[i] = m
+        conf[i] = c
+        if m > thr and c > 0.3:
+            minutes[i] = max(15, int(60.0 / max(m, 0.01)))
+        else:
+            minutes[i] = -1
+    return mag, conf, minutes
+
+
+if NUMBA_AVAILABLE:
+    # cache=True persists the compiled kernel so workers skip the cold compile;
+    # no fastmath, so results stay bit-identical to the NumPy/scalar paths
+    _drift_kernel = njit(cache=True, parallel=True)(_drift_kernel)
+
+
+def drift_arrays(
+    current: np.ndarray, baseline: np.ndarray, threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorised core of ``detect_drift`` over aligned float64 arrays.
+
+    Returns ``(magnitude, confidence, minutes_to_breach)``; minutes is -1 for
+    rows that do not cross ``threshold`` (no breach predicted). A zero
+    baseline yields zero magnitude and confidence, as in the scalar path.
+    """
+    cur = np.asarray(current, dtype=np.float64)
+    base = np.asarray(baseline, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _drift_kernel(cur, base, threshold)
+    nonzero = base != 0
+    mag = np.zeros_like(base)
+    np.divide(np.abs(cur - base), np.abs(base), out=mag, where=nonzero)
+    conf = np.minimum(0.95, mag * 2.5)
+    breach = (mag > threshold) & (conf > 0.3)
+    minutes = np.full(base.shape, -1, dtype=np.int64)
+    minutes[breach] = np.maximum(15, (60.0 / np.maximum(mag[breach], 0.01)).astype(np.int64))
+    return mag, conf, minutes
+
+
+def _kalman_kernel(x, p, slots, z, q, r, x_hat, nis):
+    """
+    One random-walk (A=1) Kalman update per sample, in sample order.
+
+    ``x``/``p`` hold the state of every tracked series (SoA). Writes the
+    posterior estimate and the normalised innovation squared per sample.
+    A NaN sample leaves its series untouched.
+    """
+    for i in range(slots.shape[0]):
+        k = slots[i]
+        zi = z[i]
+        if zi != zi:
+            x_hat[i] = x[k]
+            nis[i] = 0.0
+            continue
+        p_pred = p[k] + q
+        s = p_pred + r
+        innov = zi - x[k]
+        gain = p_pred / s
+        x[k] = x[k] + gain * innov
+        p[k] = (1.0 - gain) * p_pred
+        x_hat[i] = x[k]
+        nis[i] = innov * innov / s
+
+
+if NUMBA_AVAILABLE:
+    # Sequential on purpose: a batch may hold several samples of one series
+    _kalman_kernel = njit(cache=True)(_kalman_kernel)
+
+
+_kernel_warm = False
+
+
+def _warm_drift_kernel() -> None:
+    """Compile (or load the cached) kernels once per process, off the hot path."""
+    global _kernel_warm
+    if NUMBA_AVAILABLE and not _kernel_warm:
+        _drift_kernel(np.ones(1), np.ones(1), 0.15)
+        _kalman_kernel(
+            np.zeros(1), np.full(1, KALMAN_PRIOR_VAR), np.zeros(1, np.int64), np.ones(1),
+            KALMAN_PROCESS_VAR, KALMAN_MEASUREMENT_VAR, np.empty(1), np.empty(1),
+        )
+    _kernel_warm = True
+
+
+class _KalmanBank:
+    """
+    Per-(entity, KPI) scalar Kalman filters for drift tracking.
+
+    State lives in parallel float64 arrays indexed by a slot per series, so a
+    whole tick of samples is filtered in one kernel call. Past ``max_series``
+    the least recently updated series give up their slots.
+    """
+
+    def __init__(
+        self,
+        process_var: float = KALMAN_PROCESS_VAR,
+        measurement_var: float = KALMAN_MEASUREMENT_VAR,
+        prior_var: float = KALMAN_PRIOR_VAR,
+        capacity: int = 1024,
+        max_series: int = KALMAN_MAX_SERIES,
+    ):
+        self.process_var = process_var
+        self.measurement_var = measurement_var
+        self.prior_var = prior_var
+        self.max_series = max_series
+        self._slots: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._allocated = 0
+        self._x = np.zeros(capacity)
+        self._p = np.full(capacity, prior_var)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _slots_for(self, keys: Sequence[Tuple[str, str]]) -> np.ndarray:
+        index = self._slots
+        out = np.empty(len(keys), dtype=np.int64)
+        hits = set()
+        new: Dict[Tuple[str, str], List[int]] = {}
+        for i, key in enumerate(keys):
+            slot = index.get(key)
+            if slot is None:
+                new.setdefault(key, []).append(i)
+                continue
+            if key not in hits:
+                index.move_to_end(key)
+                hits.add(key)
+            out[i] = slot
+        if not new:
+            return out
+
+        # Evict from the LRU end, never a series sampled in this batch
+        n_evict = min(
+            max(len(index) + len(new) - self.max_series, 0),
+            len(index) - len(hits),
+            len(new),
+        )
+        free = [index.popitem(last=False)[1] for _ in range(n_evict)]
+        needed = self._allocated + len(new) - len(free)
+        if needed > self._x.shape[0]:
+            grow = max(2 * self._x.shape[0], needed) - self._x.shape[0]
+            self._x = np.concatenate([self._x, np.zeros(grow)])
+            self._p = np.concatenate([self._p, np.full(grow, self.prior_var)])
+        for key, positions in new.items():
+            if free:
+                slot = free.pop()
+            else:
+                slot = self._allocated
+                self._allocated += 1
+            self._x[slot] = 0.0
+            self._p[slot] = self.prior_var
+            index[key] = slot
+            out[positions] = slot
+        return out
+
+    def update(
+        self, keys: Sequence[Tuple[str, str]], samples: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fold one sample per key; returns (filtered estimate, normalised innovation²)."""
+        z = np.asarray(samples, dtype=np.float64)
+        slots = self._slots_for(keys)
+        x_hat = np.empty(z.shape[0])
+        nis = np.empty(z.shape[0])
+        _kalman_kernel(
+            self._x, self._p, slots, z,
+            self.process_var, self.measurement_var, x_hat, nis,
+        )
+        return x_hat, nis
+
+
+# Global Cache for Singleton
+_kalman_bank: Optional[_KalmanBank] = None
+
+
+def get_kalman_bank() -> _KalmanBank:
+    """Process-wide filter bank; shield services are built per request."""
+    global _kalman_bank
+    if _kalman_bank is None:
+        _kalman_bank = _KalmanBank()
+    return _kalman_bank
+
+
+def _object_array(values: Sequence[Any]) -> np.ndarray:
+    out = np.empty(len(values), dtype=object)
+    out[:] = values
+    return out
+
+
+@dataclass
+class DriftBatch:
+    """
+    Breaching drift rows as parallel arrays.
+
+    Internal scoring (top-k, per-category counts, calibration) works on the
+    arrays directly; DriftPrediction models are only built at the API
+    boundary via ``to_models()``.
+    """
+    entity_ids: np.ndarray        # object
+    entity_names: np.ndarray      # object
+    metric_names: np.ndarray      # object
+    current: np.ndarray           # float64
+    baseline: np.ndarray          # float64
+    magnitude: np.ndarray         # float64
+    confidence: np.ndarray        # float64
+    minutes_to_breach: np.ndarray  # int64
+    category: np.ndarray          # int8, index into METRIC_CATEGORIES
+    detected_at: datetime
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: np.ndarray,
+        entity_ids: Sequence[UUID],
+        entity_names: Sequence[str],
+        metric_names: Sequence[str],
+        current: np.ndarray,
+        baseline: np.ndarray,
+        magnitude: np.ndarray,
+        confidence: np.ndarray,
+        minutes_to_breach: np.ndarray,
+        detected_at: datetime,
+    ) -> "DriftBatch":
+        """Gather ``rows`` of the full input columns into a batch."""
+        idx = rows.tolist()
+        metrics = [metric_names[i] for i in idx]
+        return cls(
+            entity_ids=_object_array([entity_ids[i] for i in idx]),
+            entity_names=_object_array([entity_names[i] for i in idx]),
+            metric_names=_object_array(metrics),
+            current=current[rows],
+            baseline=baseline[rows],
+            magnitude=magnitude[rows],
+            confidence=confidence[rows],
+            minutes_to_breach=minutes_to_breach[rows],
+            category=np.fromiter(
+                (_CATEGORY_CODE[_metric_category(m)] for m in metrics),
+                dtype=np.int8, count=len(metrics),
+            ),
+            detected_at=detected_at,
+        )
+
+    def __len__(self) -> int:
+        return self.magnitude.shape[0]
+
+    def to_models(self) -> List[DriftPrediction]:
+        """Materialise one DriftPrediction per row."""
+        now = self.detected_at
+        # Minutes-to-breach takes few distinct values; build each breach time once
+        breach_at: Dict[int, datetime] = {}
+        for m in np.unique(self.minutes_to_breach).tolist():
+            breach_at[m] = now + timedelta(minutes=m)
+        minutes = self.minutes_to_breach.tolist()
+        current = self.current.tolist()
+        baseline = self.baseline.tolist()
+        magnitude = self.magnitude.tolist()
+        confidence = self.confidence.tolist()
+        return [
+            DriftPrediction.model_construct(
+                entity_id=self.entity_ids[i],
+                entity_name=self.entity_names[i],
+                metric_name=self.metric_names[i],
+                current_value=current[i],
+                baseline_value=baseline[i],
+                drift_magnitude=round(magnitude[i], 4),
+                predicted_breach_time=breach_at[minutes[i]],
+                confidence=round(confidence[i], 3),
+                detected_at=now,
+            )
+            for i in range(len(self))
+        ]
+
 
 class AutonomousShieldService:
     """
@@ -45,10 +425,9 @@ class AutonomousShieldService:
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
         self.session_factory = session_factory
         self.settings = get_settings()
-        # settings.drift_threshold_pct is expressed as percent (eg 15.0)
-        # convert to fractional form for internal comparisons (0.15)
-        self.drift_threshold_pct = float(self.settings.drift_threshold_pct) / 100.0
+        self.drift_threshold_pct = _default_drift_frac()
         self._calibrated_for_tenant: dict[str, float] = {}
+        _warm_drift_kernel()
 
     @asynccontextmanager
     async def _get_session(self, session: Optional[AsyncSession] = None):
@@ -72,12 +451,17 @@ class AutonomousShieldService:
         metric_name: str,
         current_value: float,
         baseline_value: float,
+        detected_at: Optional[datetime] = None,
     ) -> DriftPrediction:
         """
         Detect KPI drift and predict breach time.
 
         Returns a DriftPrediction with confidence score and predicted breach time.
+        ``detected_at`` lets a caller scoring one window stamp every prediction
+        with the same instant; it defaults to now.
         """
+        if detected_at is None:
+            detected_at = datetime.now(timezone.utc)
         if baseline_value == 0:
             drift_magnitude = 0.0
             confidence = 0.0
@@ -91,18 +475,84 @@ class AutonomousShieldService:
         if drift_magnitude > self.drift_threshold_pct and confidence > 0.3:
             # Simple linear extrapolation: if 15% drift now, breach at 100% in ~6x the current window
             minutes_to_breach = max(15, int(60 / max(drift_magnitude, 0.01)))
-            predicted_breach_time = datetime.now(timezone.utc) + timedelta(minutes=minutes_to_breach)
+            predicted_breach_time = detected_at + timedelta(minutes=minutes_to_breach)
 
-        return DriftPrediction(
+        # Fields are computed here with their final types, so skip validation
+        return DriftPrediction.model_construct(
             entity_id=entity_id,
             entity_name=entity_name,
             metric_name=metric_name,
-            current_value=current_value,
-            baseline_value=baseline_value,
+            current_value=float(current_value),
+            baseline_value=float(baseline_value),
             drift_magnitude=round(drift_magnitude, 4),
             predicted_breach_time=predicted_breach_time,
             confidence=round(confidence, 3),
-            detected_at=datetime.now(timezone.utc),
+            detected_at=detected_at,
+        )
+
+    def detect_drift_batch(
+        self,
+        entity_ids: Sequence[UUID],
+        entity_names: Sequence[str],
+        metric_names: Sequence[str],
+        current_values: np.ndarray,
+        baseline_values: np.ndarray,
+        detected_at: Optional[datetime] = None,
+    ) -> DriftBatch:
+        """
+        ``detect_drift`` over many (entity, KPI) rows in one NumPy pass.
+
+        Only rows with a predicted breach are kept. Call ``to_models()`` on the
+        result for API output; callers that just need magnitudes or counts
+        should use ``drift_arrays`` directly.
+        """
+        cur = np.asarray(current_values, dtype=np.float64)
+        base = np.asarray(baseline_values, dtype=np.float64)
+        mag, conf, minutes = drift_arrays(cur, base, self.drift_threshold_pct)
+        return DriftBatch.from_rows(
+            np.flatnonzero(minutes >= 0),
+            entity_ids, entity_names, metric_names, cur, base, mag, conf, minutes,
+            detected_at or datetime.now(timezone.utc),
+        )
+
+    def detect_drift_tracked(
+        self,
+        entity_ids: Sequence[UUID],
+        entity_names: Sequence[str],
+        metric_names: Sequence[str],
+        current_values: np.ndarray,
+        baseline_values: np.ndarray,
+        detected_at: Optional[datetime] = None,
+    ) -> DriftBatch:
+        """
+        ``detect_drift_batch`` on Kalman-filtered drift instead of raw samples.
+
+        Each (entity, KPI) series keeps a filter in the process-wide bank, so
+        a single noisy sample moves the estimate by the filter gain rather
+        than straight past the threshold; sustained drift still converges to
+        its true magnitude. The breach rule and timing are the batch path's,
+        applied to the filtered magnitude. Samples whose innovation exceeds
+        KALMAN_INNOVATION_GATE are logged as abrupt shifts.
+        """
+        cur = np.asarray(current_values, dtype=np.float64)
+        base = np.asarray(baseline_values, dtype=np.float64)
+        rel = np.full(base.shape, np.nan)
+        nonzero = base != 0
+        np.divide(cur - base, np.abs(base), out=rel, where=nonzero)
+
+        keys = [(str(e), m) for e, m in zip(entity_ids, metric_names)]
+        x_hat, nis = get_kalman_bank().update(keys, rel)
+        shifted = np.flatnonzero(nis > KALMAN_INNOVATION_GATE)
+        if shifted.size:
+            logger.info(f"Abrupt KPI shift on {shifted.size} tracked series")
+
+        mag = np.nan_to_num(np.abs(x_hat), nan=0.0)
+        conf = np.minimum(0.95, mag * 2.5)
+        minutes = np.maximum(15, (60.0 / np.maximum(mag, 0.01)).astype(np.int64))
+        return DriftBatch.from_rows(
+            np.flatnonzero((mag > self.drift_threshold_pct) & (conf > 0.3)),
+            entity_ids, entity_names, metric_names, cur, base, mag, conf, minutes,
+            detected_at or datetime.now(timezone.utc),
         )
 
     def evaluate_preventive_action(
@@ -113,31 +563,21 @@ class AutonomousShieldService:
 
         Returns a recommendation for human review — NOT an executed action.
         """
-        metric = drift.metric_name.lower()
         magnitude_pct = round(drift.drift_magnitude * 100, 1)
-
-        if "prb" in metric or "utilization" in metric or "load" in metric:
-            action = f"Review PRB allocation on {drift.entity_name}. Current utilization is {magnitude_pct}% above baseline."
-            benefit = "Prevent congestion-related service degradation"
-            risk = "Continued drift may cause dropped calls and increased latency"
-            priority = "critical" if drift.drift_magnitude > 0.3 else "high"
-        elif "latency" in metric or "rtt" in metric:
-            action = f"Investigate routing path for {drift.entity_name}. Latency is {magnitude_pct}% above baseline."
-            benefit = "Restore SLA-compliant response times"
-            risk = "Latency breach may trigger SLA penalties"
-            priority = "high"
-        elif "error" in metric or "fail" in metric:
-            action = f"Check hardware health and logs for {drift.entity_name}. Error rate is {magnitude_pct}% above baseline."
-            benefit = "Prevent service outage"
-            risk = "Unchecked error rate may indicate imminent hardware failure"
-            priority = "critical" if drift.drift_magnitude > 0.5 else "high"
-        else:
-            action = f"Monitor {drift.metric_name} on {drift.entity_name}. Deviation is {magnitude_pct}% from baseline."
-            benefit = "Early detection of potential service degradation"
-            risk = "Continued drift may impact service quality"
+        action_fmt, benefit, risk, critical_above = _PREVENTIVE_PLAYBOOK[
+            _metric_category(drift.metric_name)
+        ]
+        action = action_fmt.format(
+            entity=drift.entity_name, metric=drift.metric_name, pct=magnitude_pct
+        )
+        if critical_above is None:
             priority = "medium"
+        elif drift.drift_magnitude > critical_above:
+            priority = "critical"
+        else:
+            priority = "high"
 
-        return PreventiveRecommendation(
+        return PreventiveRecommendation.model_construct(
             recommendation_id=uuid.uuid4(),
             drift_prediction_id=None,
             action_description=action,
@@ -155,19 +595,16 @@ class AutonomousShieldService:
 
         This is a document for humans to act on — Pedkai does not execute it.
         """
-        return ChangeRequestOutput(
+        return ChangeRequestOutput.model_construct(
             change_request_id=uuid.uuid4(),
             recommendation_id=recommendation.recommendation_id,
             title=f"[Pedkai Recommendation] {recommendation.priority.upper()}: {recommendation.action_description[:80]}",
-            description=(
-                f"Pedkai has detected a KPI drift and recommends the following action:\n\n"
-                f"**Action**: {recommendation.action_description}\n\n"
-                f"**Expected Benefit**: {recommendation.expected_benefit}\n\n"
-                f"**Risk if Ignored**: {recommendation.risk_if_ignored}\n\n"
-                f"**Priority**: {recommendation.priority}\n\n"
-                f"This change request was generated by Pedkai Autonomous Shield. "
-                f"A qualified engineer must review, approve, and execute this change."
-            ),
+            description=_CR_DESCRIPTION_TPL.format_map({
+                "action": recommendation.action_description,
+                "benefit": recommendation.expected_benefit,
+                "risk": recommendation.risk_if_ignored,
+                "priority": recommendation.priority,
+            }),
             affected_entities=[],
             rollback_plan=(
                 "Revert any configuration changes made. Monitor KPIs for 30 minutes post-change. "
@@ -182,6 +619,8 @@ class AutonomousShieldService:
 
         Returns the effective fractional threshold used after calibration.
         """
+        from backend.app.services.drift_calibration import DriftCalibrationService
+
         try:
             calib = DriftCalibrationService(self.session_factory)
             result = await calib.get_false_positive_rate(tenant_id, session=session)
@@ -190,8 +629,7 @@ class AutonomousShieldService:
             # Parse recommended threshold from the message if present (simple heuristic)
             if "Recommend" in rec and "to" in rec:
                 # look for last percentage-like token
-                import re
-                m = re.search(r"to\s+([0-9]+\.?[0-9]*)%", rec)
+                m = _CALIB_PCT_RE.search(rec)
                 if m:
                     recommended_pct = float(m.group(1))
                     self._calibrated_for_tenant[tenant_id] = recommended_pct / 100.0
@@ -200,11 +638,11 @@ class AutonomousShieldService:
                     return self.drift_threshold_pct
 
             # Otherwise keep configured value
-            self._calibrated_for_tenant[tenant_id] = float(self.settings.drift_threshold_pct) / 100.0
+            self._calibrated_for_tenant[tenant_id] = _default_drift_frac()
             return self._calibrated_for_tenant[tenant_id]
         except Exception as e:
             logger.warning(f"Drift calibration unavailable for {tenant_id}: {e}")
-            return float(self.settings.drift_threshold_pct) / 100.0
+            return _default_drift_frac()
 
     def calculate_value_protected(
         self, actions_taken: List[Dict[str, Any]]
@@ -218,14 +656,19 @@ class AutonomousShieldService:
         Note: These are estimates based on counterfactual analysis. Confidence intervals
         are provided. Do not present as guaranteed savings without board sign-off.
         """
-        incidents_prevented = len([a for a in actions_taken if a.get("outcome") == "prevented"])
-        uptime_gained = sum(a.get("mttr_saved_minutes", 0.0) for a in actions_taken)
-
+        incidents_prevented = 0
+        uptime_gained = 0
         # Revenue protection: only calculated if billing data is available
         revenue_protected = None
-        priced_actions = [a for a in actions_taken if a.get("revenue_at_risk") is not None]
-        if priced_actions:
-            revenue_protected = sum(a.get("revenue_at_risk", 0.0) for a in priced_actions)
+        for a in actions_taken:
+            if a.get("outcome") == "prevented":
+                incidents_prevented += 1
+            uptime_gained += a.get("mttr_saved_minutes", 0.0)
+            revenue = a.get("revenue_at_risk")
+            if revenue is not None:
+                revenue_protected = (
+                    revenue if revenue_protected is None else revenue_protected + revenue
+                )
 
         return ValueProtected(
             revenue_protected=revenue_protected,
@@ -10,9 +10,12 @@ Future adapters: AmdocsBSSAdapter, CerillionBSSAdapter, CSGBSSAdapter.
 Used by: WS4 (service_impact.py), WS2 (incidents.py).
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from uuid import UUID
 from pydantic import BaseModel
+from sqlalchemy import bindparam, distinct, func, select
+
+from backend.app.models.bss_orm import BillingAccountORM, ServicePlanORM
 
 
 class BillingAccountInfo(BaseModel):
@@ -34,6 +37,24 @@ class RevenueResult(BaseModel):
     requires_manual_valuation: bool = False
 
 
+# One statement for any number of customers: the expanding bind keeps the SQL
+# text (and the driver's prepared plan) identical regardless of list length,
+# and the database returns a single (priced customers, fee total) row. A
+# customer may hold several accounts, so priced customers are counted
+# distinctly while every priced account still adds its fee.
+_STMT_REVENUE_TOTALS = (
+    select(
+        func.count(distinct(BillingAccountORM.customer_id)).filter(
+            ServicePlanORM.monthly_fee.is_not(None)
+        ),
+        func.coalesce(func.sum(ServicePlanORM.monthly_fee), 0.0),
+    )
+    .select_from(BillingAccountORM)
+    .outerjoin(ServicePlanORM, BillingAccountORM.plan_id == ServicePlanORM.id)
+    .where(BillingAccountORM.customer_id.in_(bindparam("ids", expanding=True)))
+)
+
+
 class BSSAdapter(ABC):
     """Abstract BSS adapter."""
 
@@ -51,8 +72,8 @@ class BSSAdapter(ABC):
         ...
 
     @abstractmethod
-    async def check_disputes(self, customer_ids: List[UUID]) -> List[UUID]:
-        """Return customer IDs with recent billing disputes."""
+    async def check_disputes(self, customer_ids: List[UUID]) -> Set[UUID]:
+        """Return the set of customer IDs with recent billing disputes."""
         ...
 
 
@@ -63,10 +84,11 @@ class LocalBSSAdapter(BSSAdapter):
 
     def __init__(self, session):
         from backend.app.services.bss_service import BSSService
+        self._session = session
         self._service = BSSService(session)
 
     async def get_billing_account(self, customer_id: UUID) -> Optional[BillingAccountInfo]:
-        account = await self._service.get_account_by_customer_id(customer_id)
+        account = await self._service.get_account_by_customer_id(customer_id, session=self._session)
         if not account:
             return None
         return BillingAccountInfo(
@@ -77,35 +99,30 @@ class LocalBSSAdapter(BSSAdapter):
         )
 
     async def get_revenue_at_risk(self, customer_ids: List[UUID]) -> RevenueResult:
+        return await self._revenue_at_risk(self._session, customer_ids)
+
+    async def check_disputes(self, customer_ids: List[UUID]) -> Set[UUID]:
+        return await self._service.check_recent_disputes(customer_ids, session=self._session)
+
+    @staticmethod
+    async def _revenue_at_risk(session, customer_ids: List[UUID]) -> RevenueResult:
         if not customer_ids:
             return RevenueResult()
 
-        from sqlalchemy import text as sql_text
-        id_strs = [str(cid) for cid in customer_ids]
-        placeholders = ", ".join(f":id_{i}" for i in range(len(id_strs)))
-        params = {f"id_{i}": id_strs[i] for i in range(len(id_strs))}
-        result = await self._service.session.execute(
-            sql_text(f"SELECT ba.customer_id, sp.monthly_fee FROM bss_accounts ba "
-                     f"LEFT JOIN service_plans sp ON ba.service_plan_id = sp.id "
-                     f"WHERE ba.customer_id IN ({placeholders})"),
-            params
-        )
-        rows = {str(r[0]): r[1] for r in result.fetchall()}
-        priced = [cid for cid in id_strs if rows.get(cid) is not None]
-        unpriced = [cid for cid in id_strs if rows.get(cid) is None]
-        total = sum(float(rows[cid]) for cid in priced) if priced else None
+        unique_ids = list(dict.fromkeys(customer_ids))
+        result = await session.execute(_STMT_REVENUE_TOTALS, {"ids": unique_ids})
+        priced_count, total = result.one()
+        # Covers both accounts without a plan fee and customers with no account
+        unpriced_count = max(len(unique_ids) - priced_count, 0)
         return RevenueResult(
-            total_revenue_at_risk=total,
+            total_revenue_at_risk=float(total) if priced_count else None,
             is_estimate=False,
             source="bss_local",
-            priced_customer_count=len(priced),
-            unpriced_customer_count=len(unpriced),
-            requires_manual_valuation=len(unpriced) > 0,
+            priced_customer_count=priced_count,
+            unpriced_customer_count=unpriced_count,
+            requires_manual_valuation=unpriced_count > 0,
         )
 
-    async def check_disputes(self, customer_ids: List[UUID]) -> List[UUID]:
-        return await self._service.check_recent_disputes(customer_ids)
-
 
 class MockBSSAdapter(BSSAdapter):
     """
@@ -134,6 +151,6 @@ class MockBSSAdapter(BSSAdapter):
             requires_manual_valuation=len(unpriced) > 0,
         )
 
-    async def check_disputes(self, customer_ids: List[UUID]) -> List[UUID]:
+    async def check_disputes(self, customer_ids: List[UUID]) -> Set[UUID]:
         # No disputes in mock by default
-        return []
+        return set()
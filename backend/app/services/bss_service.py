@@ -1,12 +1,87 @@
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
 from uuid import UUID
-from sqlalchemy import select, func, and_, cast, Float
+from sqlalchemy import select, func, and_, bindparam, cast, Float, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from contextlib import asynccontextmanager
-from sqlalchemy.orm import selectinload
+from functools import lru_cache
+from sqlalchemy.orm import raiseload, selectinload
 
 from backend.app.models.bss_orm import BillingAccountORM, ServicePlanORM
 from backend.app.models.customer_orm import CustomerORM
+from backend.app.models.decision_trace_orm import DecisionTraceORM
+
+
+_ACCOUNTS = BillingAccountORM.__table__
+
+_STMT_RECENT_DISPUTES = select(_ACCOUNTS.c.customer_id).where(
+    _ACCOUNTS.c.customer_id.in_(bindparam("ids", expanding=True)),
+    _ACCOUNTS.c.last_billing_dispute >= bindparam("since"),
+)
+
+_PLANS = ServicePlanORM.__table__
+
+_STMT_ACCOUNT_BY_CUSTOMER = (
+    select(BillingAccountORM)
+    # Anything beyond the plan must be loaded explicitly, never lazily per row
+    .options(selectinload(BillingAccountORM.service_plan), raiseload("*"))
+    .where(BillingAccountORM.customer_id == bindparam("customer_id"))
+)
+
+# monthly_fee is a FLOAT column, so the driver already hands back a Python
+# float; COALESCE covers the no-match case server-side.
+_STMT_REVENUE_SUM = (
+    select(func.coalesce(func.sum(ServicePlanORM.monthly_fee), 0.0))
+    .join(BillingAccountORM, BillingAccountORM.plan_id == ServicePlanORM.id)
+    .where(BillingAccountORM.customer_id.in_(bindparam("ids", expanding=True)))
+)
+
+# One row per matched account: fee, plan tier and a server-side
+# "disputed recently" flag
+_STMT_IMPACT_ROWS = (
+    select(
+        _ACCOUNTS.c.customer_id,
+        _PLANS.c.monthly_fee,
+        _PLANS.c.tier,
+        (_ACCOUNTS.c.last_billing_dispute >= bindparam("since")).label("disputed"),
+    )
+    .select_from(_ACCOUNTS.join(_PLANS, _ACCOUNTS.c.plan_id == _PLANS.c.id))
+    .where(_ACCOUNTS.c.customer_id.in_(bindparam("ids", expanding=True)))
+)
+
+
+@dataclass
+class ImpactSummary:
+    """Billing view of an impacted-customer set, from a single query."""
+    monthly_fees: Dict[UUID, float] = field(default_factory=dict)
+    revenue_at_risk: float = 0.0
+    disputed_customer_ids: Set[UUID] = field(default_factory=set)
+    plan_tiers: Set[str] = field(default_factory=set)  # tiers held by any impacted account
+
+
+def _revenue_loss_expr(dialect_name: str):
+    """context['predicted_revenue_loss'] as a float, per dialect.
+
+    On PostgreSQL the key is inlined so the expression matches the partial
+    index ix_decision_traces_active_revenue_loss even under generic plans.
+    """
+    if dialect_name == "postgresql":
+        return cast(
+            DecisionTraceORM.context.op("->>")(literal_column("'predicted_revenue_loss'")),
+            Float,
+        )
+    return DecisionTraceORM.context["predicted_revenue_loss"].as_float()
+
+
+@lru_cache(maxsize=None)
+def _cumulative_risk_stmt(dialect_name: str):
+    """Open-decision revenue-loss sum since :since, built once per dialect."""
+    return select(func.sum(_revenue_loss_expr(dialect_name))).where(and_(
+        DecisionTraceORM.created_at >= bindparam("since"),
+        DecisionTraceORM.outcome == None
+    ))
+
 
 class BSSService:
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
@@ -14,7 +89,7 @@ class BSSService:
 
     @asynccontextmanager
     async def _get_session(self, session: Optional[AsyncSession] = None):
-        if session:
+        if session is not None:
             yield session
         else:
             async with self.session_factory() as new_session:
@@ -27,14 +102,20 @@ class BSSService:
                 finally:
                     await new_session.close()
 
+    @asynccontextmanager
+    async def batch(self, session: Optional[AsyncSession] = None):
+        """
+        One session for several calls: pass it on as ``session=`` so the
+        whole sequence shares a single connection checkout and COMMIT.
+        A caller-owned ``session`` is reused as-is.
+        """
+        async with self._get_session(session) as s:
+            yield s
+
     async def get_account_by_customer_id(self, customer_id: UUID, session: Optional[AsyncSession] = None) -> Optional[BillingAccountORM]:
         """Retrieve the billing account for a specific customer."""
         async with self._get_session(session) as s:
-            result = await s.execute(
-                select(BillingAccountORM)
-                .options(selectinload(BillingAccountORM.service_plan))
-                .where(BillingAccountORM.customer_id == customer_id)
-            )
+            result = await s.execute(_STMT_ACCOUNT_BY_CUSTOMER, {"customer_id": customer_id})
             return result.scalar_one_or_none()
 
     async def calculate_revenue_at_risk(self, impacted_customer_ids: List[UUID], session: Optional[AsyncSession] = None) -> float:
@@ -45,50 +126,57 @@ class BSSService:
             return 0.0
 
         async with self._get_session(session) as s:
-            result = await s.execute(
-                select(func.sum(ServicePlanORM.monthly_fee))
-                .join(BillingAccountORM, BillingAccountORM.plan_id == ServicePlanORM.id)
-                .where(BillingAccountORM.customer_id.in_(impacted_customer_ids))
+            result = await s.execute(_STMT_REVENUE_SUM, {"ids": impacted_customer_ids})
+            return result.scalar()
+
+    async def summarize_impact(self, customer_ids: List[UUID], session: Optional[AsyncSession] = None) -> ImpactSummary:
+        """
+        Account fees, revenue at risk and recent disputes for the impacted
+        customers in one round-trip (instead of calculate_revenue_at_risk plus
+        check_recent_disputes plus per-customer account lookups).
+        """
+        if not customer_ids:
+            return ImpactSummary()
+
+        thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        summary = ImpactSummary()
+        async with self._get_session(session) as s:
+            conn = await s.connection()
+            result = await conn.execute(
+                _STMT_IMPACT_ROWS, {"ids": customer_ids, "since": thirty_days_ago}
             )
-            
-            total_revenue = result.scalar()
-            return float(total_revenue) if total_revenue else 0.0
+            for customer_id, monthly_fee, tier, disputed in result:
+                summary.monthly_fees[customer_id] = monthly_fee
+                summary.revenue_at_risk += monthly_fee
+                summary.plan_tiers.add(tier)
+                if disputed:
+                    summary.disputed_customer_ids.add(customer_id)
+        return summary
 
-    async def check_recent_disputes(self, customer_ids: List[UUID], session: Optional[AsyncSession] = None) -> List[UUID]:
+    async def check_recent_disputes(self, customer_ids: List[UUID], session: Optional[AsyncSession] = None) -> Set[UUID]:
         """
-        Returns a list of customer IDs who have had a billing dispute in the last 30 days.
+        Returns the set of customer IDs who have had a billing dispute in the last 30 days.
         """
-        from datetime import datetime, timedelta, timezone
         thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
         
         async with self._get_session(session) as s:
-            result = await s.execute(
-                select(BillingAccountORM.customer_id)
-                .where(
-                    BillingAccountORM.customer_id.in_(customer_ids),
-                    BillingAccountORM.last_billing_dispute >= thirty_days_ago
-                )
+            # Core statement on the session's connection: plain UUID rows,
+            # no ORM compilation or result hydration for large id lists
+            conn = await s.connection()
+            result = await conn.execute(
+                _STMT_RECENT_DISPUTES, {"ids": customer_ids, "since": thirty_days_ago}
             )
-            return result.scalars().all()
+            return set(result.scalars())
 
     async def calculate_cumulative_active_risk(self, session: Optional[AsyncSession] = None) -> float:
         """
         Finding M-7 FIX: Sums 'predicted_revenue_loss' from all active decisions in last 1h.
         """
-        from datetime import datetime, timedelta, timezone
-        from backend.app.models.decision_trace_orm import DecisionTraceORM
-        from sqlalchemy import cast, Float
-        
         one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
         
         async with self._get_session(session) as s:
-            query = select(func.sum(cast(DecisionTraceORM.context['predicted_revenue_loss'], Float)))
-            
             result = await s.execute(
-                query.where(and_(
-                    DecisionTraceORM.created_at >= one_hour_ago,
-                    DecisionTraceORM.outcome == None
-                ))
+                _cumulative_risk_stmt(s.get_bind().dialect.name), {"since": one_hour_ago}
             )
             total = result.scalar()
             return float(total) if total else 0.0
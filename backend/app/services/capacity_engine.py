@@ -5,17 +5,87 @@ Optimizes cell site densification based on congestion vs. budget.
 import hashlib
 import json
 from contextlib import asynccontextmanager
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import bindparam, select, and_, desc, func
+from sqlalchemy.orm import raiseload
 
 from backend.app.models.investment_planning import DensificationRequestORM, InvestmentPlanORM
 from backend.app.models.kpi_orm import KPIMetricORM
+from backend.app.models.topology_models import EntityRelationshipORM
 from backend.app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Built once at import; SQLAlchemy's compiled cache then serves every request
+_STMT_REQUEST_BY_ID = (
+    select(DensificationRequestORM)
+    .options(raiseload("*"))
+    .where(DensificationRequestORM.id == bindparam("request_id"))
+)
+
+_STMT_HOTSPOTS = (
+    select(
+        KPIMetricORM.entity_id,
+        func.avg(KPIMetricORM.value).label("avg_value")
+    )
+    .where(
+        and_(
+            KPIMetricORM.metric_name == bindparam("metric_name"),
+            KPIMetricORM.value > 0.85  # Congestion threshold
+        )
+    )
+    .group_by(KPIMetricORM.entity_id)
+    .order_by(desc("avg_value"))
+    .limit(10)
+)
+
+_STMT_TOPOLOGY_PROPS = (
+    select(EntityRelationshipORM.from_entity_id, EntityRelationshipORM.properties)
+    .where(EntityRelationshipORM.from_entity_id.in_(bindparam("ids", expanding=True)))
+)
+
+# Region centres for hotspots whose topology carries no coordinates
+_DEFAULT_CENTER = (18.52, 73.85)
+_GAZETTEER = {
+    "pune": (18.52, 73.85),
+    "london": (51.50, -0.12),
+    "new york": (40.71, -74.00),
+    "mumbai": (19.07, 72.87),
+    "bengaluru": (12.97, 77.59),
+}
+
+
+def _select_within_budget(
+    candidates: List[Dict[str, Any]], budget: float
+) -> Tuple[List[Dict[str, Any]], float]:
+    """
+    Greedy by pressure (highest first): take each site that still fits.
+
+    The leading run of sites that all fit is found with one cumsum and
+    searchsorted; only the tail after the first site that overflows the
+    budget is scanned one by one (a cheaper later site may still fit).
+    Same picks and same running cost as the plain greedy loop.
+    """
+    if not candidates:
+        return [], 0.0
+    costs = np.fromiter((c["cost"] for c in candidates), dtype=np.float64, count=len(candidates))
+    pressures = np.fromiter((c["pressure"] for c in candidates), dtype=np.float64, count=len(candidates))
+    order = np.argsort(-pressures, kind="stable")
+    cumcost = np.cumsum(costs[order])
+    cutoff = int(np.searchsorted(cumcost, budget, side="right"))
+
+    selected = [candidates[i] for i in order[:cutoff].tolist()]
+    current_cost = float(cumcost[cutoff - 1]) if cutoff else 0.0
+    for i in order[cutoff:].tolist():
+        cost = float(costs[i])
+        if current_cost + cost <= budget:
+            selected.append(candidates[i])
+            current_cost += cost
+    return selected, current_cost
+
 
 class CapacityEngine:
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
@@ -39,6 +109,12 @@ class CapacityEngine:
                 finally:
                     await new_session.close()
 
+    @asynccontextmanager
+    async def batch(self, session: Optional[AsyncSession] = None):
+        """Shared session (committed once on exit) for back-to-back optimisations."""
+        async with self._get_session(session) as s:
+            yield s
+
     async def optimize_densification(self, request_id: str, session: Optional[AsyncSession] = None) -> InvestmentPlanORM:
         """
         Orchestrates the multi-variable tradeoff between cost and coverage.
@@ -49,30 +125,15 @@ class CapacityEngine:
         """
         async with self._get_session(session) as s:
             # Fetch the request
-            request = await s.get(DensificationRequestORM, request_id)
+            result = await s.execute(_STMT_REQUEST_BY_ID, {"request_id": request_id})
+            request = result.scalar_one_or_none()
             if not request:
                 raise ValueError(f"Request {request_id} not found")
 
             logger.info(f"🚀 Optimizing densification for region: {request.region_name}")
 
             # 1. Fetch Hotspots from KPIMetricORM
-            query = (
-                select(
-                    KPIMetricORM.entity_id,
-                    func.avg(KPIMetricORM.value).label("avg_value")
-                )
-                .where(
-                    and_(
-                        KPIMetricORM.metric_name == request.target_kpi,
-                        KPIMetricORM.value > 0.85  # Congestion threshold
-                    )
-                )
-                .group_by(KPIMetricORM.entity_id)
-                .order_by(desc("avg_value"))
-                .limit(10)
-            )
-
-            result = await s.execute(query)
+            result = await s.execute(_STMT_HOTSPOTS, {"metric_name": request.target_kpi})
             hotspots = result.all()
 
             if not hotspots:
@@ -84,8 +145,16 @@ class CapacityEngine:
                     {"name": f"{request.region_name}-Sector-C", "lat": 18.54, "lon": 73.87, "cost": 55000, "pressure": 0.95, "backhaul": "mw"},
                 ]
             else:
-                from backend.app.models.topology_models import EntityRelationshipORM
+                # Topology metadata for every hotspot in one round-trip; the
+                # first relationship row per entity carries its site coordinates
+                topo_rows = await s.execute(
+                    _STMT_TOPOLOGY_PROPS, {"ids": [h.entity_id for h in hotspots]}
+                )
+                topo_by_id: Dict[str, Any] = {}
+                for entity_id, properties in topo_rows:
+                    topo_by_id.setdefault(entity_id, properties)
 
+                center_lat, center_lon = _GAZETTEER.get(request.region_name.lower(), _DEFAULT_CENTER)
                 candidates = []
                 for h in hotspots:
                     region_type = request.parameters.get("region_type", "urban") if request.parameters else "urban"
@@ -99,30 +168,21 @@ class CapacityEngine:
                     cost_multiplier = 1.0 + (h.avg_value - 0.85) * 0.5
                     final_cost = base_cost * cost_multiplier
 
-                    topo_entry = await s.execute(
-                        select(EntityRelationshipORM).where(EntityRelationshipORM.from_entity_id == h.entity_id).limit(1)
-                    )
-                    entity_meta = topo_entry.scalar_one_or_none()
+                    properties = topo_by_id.get(h.entity_id)
 
                     lat, lon = None, None
-                    if entity_meta and entity_meta.properties:
+                    if properties:
                         try:
-                            props = json.loads(entity_meta.properties) if isinstance(entity_meta.properties, str) else entity_meta.properties
+                            props = json.loads(properties) if isinstance(properties, str) else properties
                             lat = props.get("lat")
                             lon = props.get("lon")
                         except Exception:
                             pass
 
                     if lat is None or lon is None:
-                        gazetteer = {
-                            "pune": (18.52, 73.85),
-                            "london": (51.50, -0.12),
-                            "new york": (40.71, -74.00),
-                            "mumbai": (19.07, 72.87),
-                            "bengaluru": (12.97, 77.59),
-                        }
-                        center_lat, center_lon = gazetteer.get(request.region_name.lower(), (18.52, 73.85))
-                        h_val = int(hashlib.md5(h.entity_id.encode()).hexdigest(), 16)
+                        h_val = int.from_bytes(
+                            hashlib.blake2b(h.entity_id.encode(), digest_size=8).digest(), "little"
+                        )
                         lat = center_lat + ((h_val % 100) - 50) * 0.001
                         lon = center_lon + ((h_val % 100) - 50) * 0.001
 
@@ -136,17 +196,10 @@ class CapacityEngine:
                     })
 
             # 2. Greedy selection based on budget
-            selected_sites = []
-            current_cost = 0.0
+            selected_sites, current_cost = _select_within_budget(candidates, request.budget_limit)
             total_improvement = 0.0
-
-            candidates.sort(key=lambda x: x["pressure"], reverse=True)
-
-            for cand in candidates:
-                if current_cost + cand["cost"] <= request.budget_limit:
-                    selected_sites.append(cand)
-                    current_cost += cand["cost"]
-                    total_improvement += (cand["pressure"] - 0.70) * 100  # Simulated reduction to 70%
+            for cand in selected_sites:
+                total_improvement += (cand["pressure"] - 0.70) * 100  # Simulated reduction to 70%
 
             if not selected_sites:
                 request.status = "failed"
@@ -156,6 +209,7 @@ class CapacityEngine:
             avg_improvement = total_improvement / len(selected_sites)
 
             plan = InvestmentPlanORM(
+                tenant_id=request.tenant_id,
                 request_id=request.id,
                 total_estimated_cost=current_cost,
                 expected_kpi_improvement=avg_improvement,
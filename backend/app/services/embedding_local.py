@@ -53,6 +53,22 @@ class LocalEmbeddingService:
             logger.error(f"Error generating local embedding: {e}", exc_info=True)
             return None
 
+    async def generate_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Generate 384-dimensional embeddings for several texts in one encode call.
+        """
+        try:
+            model = await self._get_model()
+            loop = asyncio.get_event_loop()
+
+            embeddings = await loop.run_in_executor(
+                None, lambda: model.encode(texts)
+            )
+            return embeddings.tolist()
+        except Exception as e:
+            logger.error(f"Error generating local embeddings: {e}", exc_info=True)
+            return [None] * len(texts)
+
 def get_local_embedding_service() -> LocalEmbeddingService:
     """Get the local embedding service instance."""
     return LocalEmbeddingService()
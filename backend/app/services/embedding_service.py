@@ -5,7 +5,8 @@ Uses Gemini embedding model to create vector representations
 for semantic similarity search.
 """
 
-from typing import Optional, List
+from operator import attrgetter
+from typing import Any, Iterable, Optional, List
 from google import genai
 
 from backend.app.core.config import get_settings
@@ -15,6 +16,13 @@ from backend.app.services.embedding_local import get_local_embedding_service
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Maximum texts per Gemini batch embed request
+EMBED_BATCH_LIMIT = 100
+
+_decision_fields = attrgetter(
+    "trigger_description", "decision_summary", "tradeoff_rationale", "action_taken"
+)
+
 
 class EmbeddingService:
     """Service for generating embeddings using the modern google-genai SDK."""
@@ -59,6 +67,37 @@ class EmbeddingService:
             logger.error(f"Error generating embedding: {e}", exc_info=True)
             return None
     
+    async def generate_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Generate embedding vectors for several texts with one provider call per
+        chunk of EMBED_BATCH_LIMIT texts.
+
+        Returns one entry per input text, None where embedding failed.
+        """
+        if not texts:
+            return []
+        if not self.client:
+            if self.local_svc:
+                return await self.local_svc.generate_embeddings(texts)
+            return [None] * len(texts)
+
+        vectors: List[Optional[List[float]]] = []
+        for i in range(0, len(texts), EMBED_BATCH_LIMIT):
+            chunk = texts[i:i + EMBED_BATCH_LIMIT]
+            try:
+                result = await self.client.aio.models.embed_content(
+                    model=self.model_name,
+                    contents=chunk,
+                    config={
+                        "task_type": "RETRIEVAL_DOCUMENT"
+                    }
+                )
+                vectors.extend(e.values for e in result.embeddings)
+            except Exception as e:
+                logger.error(f"Error generating batch embeddings: {e}", exc_info=True)
+                vectors.extend([None] * len(chunk))
+        return vectors
+
     def create_decision_text(
         self,
         trigger_description: str,
@@ -85,6 +124,19 @@ class EmbeddingService:
         
         return "\n".join(parts)
 
+    def create_decision_text_batch(self, records: Iterable[Any]) -> List[str]:
+        """
+        Build decision texts for many rows at once.
+
+        ``records`` are ORM instances or result rows exposing trigger_description,
+        decision_summary, tradeoff_rationale and action_taken. Output matches
+        create_decision_text() per record (missing fields render as empty).
+        """
+        return [
+            f"Trigger: {t or ''}\nDecision: {d or ''}\nRationale: {r or ''}\nAction: {a or ''}"
+            for t, d, r, a in map(_decision_fields, records)
+        ]
+
 
 # Singleton instance
 _embedding_service: Optional[EmbeddingService] = None
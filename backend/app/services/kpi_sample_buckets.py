@@ -0,0 +1,153 @@
+"""
+KPI Sample Bucketing — vertical (array-per-minute) storage for kpi_samples.
+
+Instead of one ``kpi_samples`` row per measurement, samples are accumulated
+in-process and written as one ``kpi_sample_buckets`` row per
+(tenant, entity, metric, minute), holding the minute's values and their
+millisecond offsets as parallel arrays. At 1 Hz telemetry this replaces ~60
+row headers / WAL records with one.
+
+Write path:
+    buffer = KpiSampleBucketBuffer(source="RAN_TELEMETRY")
+    buffer.add(tenant_id, entity_id, "PRB_UTIL", 71.5, ts)
+    ...
+    await buffer.flush(session)          # on the minute tick
+
+Read path:
+    rows = (await session.execute(expand_buckets_query(), {
+        "tenant_id": tid, "entity_id": eid, "metric_name": "PRB_UTIL",
+        "start": start, "end": end,
+    })).all()                            # [(timestamp, value), ...]
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+
+from backend.app.core.logging import get_logger
+from backend.app.models.kpi_sample_orm import KpiSampleBucketORM
+
+logger = get_logger(__name__)
+
+# (tenant_id, entity_id, metric_name, bucket_start)
+BucketKey = Tuple[str, UUID, str, datetime]
+
+# Expands buckets back into (timestamp, value) rows. unnest() over two arrays
+# zips them element-wise, so values[i] stays paired with ts_offsets_ms[i].
+_EXPAND_SQL = """
+    SELECT b.bucket_start + (u.offset_ms * INTERVAL '1 millisecond') AS timestamp,
+           u.value
+    FROM kpi_sample_buckets b,
+         unnest(b.values, b.ts_offsets_ms) AS u(value, offset_ms)
+    WHERE b.tenant_id = :tenant_id
+      AND b.entity_id = :entity_id
+      AND b.metric_name = :metric_name
+      AND b.bucket_start >= :start
+      AND b.bucket_start < :end
+    ORDER BY 1
+"""
+
+# Per-minute averages computed inside Postgres without materialising samples.
+_BUCKET_AVG_SQL = """
+    SELECT b.bucket_start,
+           (SELECT AVG(v) FROM unnest(b.values) v) AS avg_value
+    FROM kpi_sample_buckets b
+    WHERE b.tenant_id = :tenant_id
+      AND b.entity_id = :entity_id
+      AND b.metric_name = :metric_name
+      AND b.bucket_start >= :start
+      AND b.bucket_start < :end
+    ORDER BY b.bucket_start
+"""
+
+
+def bucket_start_for(ts: datetime) -> datetime:
+    """Truncate a timestamp to its UTC minute boundary."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    else:
+        ts = ts.astimezone(timezone.utc)
+    return ts.replace(second=0, microsecond=0)
+
+
+class KpiSampleBucketBuffer:
+    """
+    In-process accumulator keyed by the bucket primary key.
+
+    Not thread-safe; intended to be owned by a single ingest task.
+    """
+
+    def __init__(self, source: str = "RAN_TELEMETRY"):
+        self.source = source
+        self._buckets: Dict[BucketKey, Tuple[List[float], List[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def add(
+        self,
+        tenant_id: str,
+        entity_id: UUID,
+        metric_name: str,
+        value: float,
+        timestamp: datetime,
+    ) -> None:
+        """Append one sample to its minute bucket."""
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        start = bucket_start_for(timestamp)
+        offset_ms = (timestamp - start) // timedelta(milliseconds=1)
+        key = (tenant_id, entity_id, metric_name, start)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = ([], [])
+            self._buckets[key] = bucket
+        bucket[0].append(float(value))
+        bucket[1].append(offset_ms)
+
+    def drain(self, before: Optional[datetime] = None) -> List[dict]:
+        """
+        Remove and return buffered buckets as insert-ready row dicts.
+
+        Args:
+            before: If given, only buckets starting strictly before this time are
+                drained (the current, still-filling minute stays buffered).
+        """
+        cutoff = bucket_start_for(before) if before is not None else None
+        rows: List[dict] = []
+        for key in list(self._buckets):
+            tenant_id, entity_id, metric_name, start = key
+            if cutoff is not None and start >= cutoff:
+                continue
+            values, offsets = self._buckets.pop(key)
+            rows.append({
+                "tenant_id": tenant_id,
+                "entity_id": entity_id,
+                "metric_name": metric_name,
+                "bucket_start": start,
+                "values": values,
+                "ts_offsets_ms": offsets,
+                "source": self.source,
+            })
+        return rows
+
+    async def flush(self, session, before: Optional[datetime] = None) -> int:
+        """Bulk-insert drained buckets. Returns the number of bucket rows written."""
+        rows = self.drain(before)
+        if not rows:
+            return 0
+        await KpiSampleBucketORM.bulk_insert(session, rows)
+        logger.debug(f"Flushed {len(rows)} KPI sample buckets")
+        return len(rows)
+
+
+def expand_buckets_query():
+    """Textual query yielding (timestamp, value) rows for one entity/metric/time range."""
+    return text(_EXPAND_SQL)
+
+
+def bucket_avg_query():
+    """Textual query yielding (bucket_start, avg_value) rows for one entity/metric/time range."""
+    return text(_BUCKET_AVG_SQL)
@@ -277,31 +277,22 @@ class LLMService:
             bss_service = BSSService(self.session_factory)
             customer_ids = incident_context.get("impacted_customer_ids", [])
 
-            # Finding M-7: Calculate Cumulative Risk
-            cumulative_revenue_loss = (
-                await bss_service.calculate_cumulative_active_risk(session=session)
-            )
-
-            if customer_ids:
-                predicted_revenue_loss = await bss_service.calculate_revenue_at_risk(
-                    customer_ids, session=session
+            # Cumulative risk and the impact summary share one session
+            async with bss_service.batch(session) as bss_session:
+                # Finding M-7: Calculate Cumulative Risk
+                cumulative_revenue_loss = (
+                    await bss_service.calculate_cumulative_active_risk(session=bss_session)
                 )
-                bss_resolved = True
 
-                # Check for Gold tier in any account
-                found_gold = False
-                for cid in customer_ids:
-                    account = await bss_service.get_account_by_customer_id(
-                        cid, session=session
+                if customer_ids:
+                    # Revenue at risk and the plan tiers of every impacted
+                    # account in one query, not one lookup per customer
+                    impact = await bss_service.summarize_impact(
+                        customer_ids, session=bss_session
                     )
-                    if (
-                        account
-                        and account.service_plan
-                        and account.service_plan.tier == "GOLD"
-                    ):
-                        found_gold = True
-                        break
-                customer_tier = "GOLD" if found_gold else "BRONZE"
+                    predicted_revenue_loss = impact.revenue_at_risk
+                    bss_resolved = True
+                    customer_tier = "GOLD" if "GOLD" in impact.plan_tiers else "BRONZE"
         except Exception as bse:
             logger.warning(f"BSS Context Retrieval Failed: {bse}")
 
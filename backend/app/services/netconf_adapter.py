@@ -5,7 +5,8 @@ Provides a mock Netconf session and vendor-specific operations for Nokia and Cis
 This is a dry-run capable PoC; no real devices are required for testing.
 """
 import asyncio
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Dict, Any, List
 from dataclasses import dataclass
 from backend.app.core.logging import get_logger
 
@@ -90,3 +91,50 @@ class NetconfSession:
         if operation == "qos_update":
             return {"success": True, "message": "QoS updated (mock)"}
         return {"success": False, "message": "Unknown operation"}
+
+
+class NetconfSessionPool:
+    """
+    Connected NetconfSessions kept per device host, so callers skip the
+    connect handshake (seconds over real SSH) on every operation.
+
+    At most ``max_size`` sessions per host are in use at once; further
+    acquirers wait. A session whose block raised is discarded rather than
+    returned, so a broken connection is never handed out again.
+    """
+
+    def __init__(self, max_size: int = 4, use_mock: bool = True):
+        self.max_size = max_size
+        self.use_mock = use_mock
+        self._idle: Dict[str, List[NetconfSession]] = {}
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def acquire(self, host: str) -> AsyncIterator[NetconfSession]:
+        limit = self._limits.setdefault(host, asyncio.Semaphore(self.max_size))
+        async with limit:
+            idle = self._idle.setdefault(host, [])
+            session = idle.pop() if idle else None
+            if session is None or not session.connected:
+                session = NetconfSession(host=host)
+                if not session.connect(use_mock=self.use_mock):
+                    raise ConnectionError(f"Netconf connect to {host} failed")
+            try:
+                yield session
+            except BaseException:
+                session.connected = False
+                raise
+            if session.connected:
+                idle.append(session)
+
+
+# Global Pool for Singleton
+_netconf_pool: Optional[NetconfSessionPool] = None
+
+
+def get_netconf_pool() -> NetconfSessionPool:
+    """Process-wide Netconf session pool."""
+    global _netconf_pool
+    if _netconf_pool is None:
+        _netconf_pool = NetconfSessionPool()
+    return _netconf_pool
@@ -38,6 +38,7 @@ class ActionDecision(BaseModel):
     reason: str
     trace_id: Optional[str] = None
     recommended_confirmation_window_sec: int = 30
+    policy_id: Optional[str] = None
 
 class PolicyEngine:
     """
@@ -281,11 +282,10 @@ class PolicyEngine:
             )
             
             # Store evaluation in audit trail
-            from backend.app.models.policy_orm import PolicyEvaluationORM
-            
-            evaluation = PolicyEvaluationORM(
-                id=str(uuid.uuid4()),
-                policy_id=policy_orm.id if policy_orm else "default",
+            policy_id = policy_orm.id if policy_orm else "default"
+            await self.record_evaluation(
+                session,
+                policy_id=policy_id,
                 tenant_id=tenant_id,
                 action_type=action_type,
                 action_parameters=action_parameters,
@@ -293,11 +293,7 @@ class PolicyEngine:
                 confidence=final_confidence,
                 matched_rules=matched_rules,
                 trace_id=trace_id,
-                evaluated_by="autonomous-executor",
-                evaluated_at=datetime.utcnow()
             )
-            session.add(evaluation)
-            await session.flush()
             
             logger.info(
                 f"Policy evaluation: tenant={tenant_id}, action={action_type}, "
@@ -310,7 +306,8 @@ class PolicyEngine:
                 matched_rules=matched_rules,
                 reason=reason,
                 trace_id=trace_id,
-                recommended_confirmation_window_sec=rules.get("confirmation_window_sec", 30)
+                recommended_confirmation_window_sec=rules.get("confirmation_window_sec", 30),
+                policy_id=policy_id,
             )
         
         except Exception as e:
@@ -324,6 +321,39 @@ class PolicyEngine:
                 trace_id=trace_id
             )
 
+    async def record_evaluation(
+        self,
+        session: AsyncSession,
+        *,
+        policy_id: str,
+        tenant_id: str,
+        action_type: str,
+        action_parameters: Optional[Dict[str, Any]],
+        decision: str,
+        confidence: float,
+        matched_rules: Dict[str, Dict[str, Any]],
+        trace_id: Optional[str] = None,
+    ) -> None:
+        """Add an autonomous action evaluation to the audit trail on `session`."""
+        from backend.app.models.policy_orm import ActionDecision as Decision, PolicyEvaluationORM
+
+        evaluation = PolicyEvaluationORM(
+            id=str(uuid.uuid4()),
+            policy_id=policy_id,
+            tenant_id=tenant_id,
+            action_type=action_type,
+            action_parameters=action_parameters,
+            # The column stores enum names; a raw "deny" would not load back
+            decision=Decision(decision),
+            confidence=confidence,
+            matched_rules=matched_rules,
+            trace_id=trace_id,
+            evaluated_by="autonomous-executor",
+            evaluated_at=datetime.utcnow()
+        )
+        session.add(evaluation)
+        await session.flush()
+
 # Global Cache for Singleton
 _policy_engine: Optional[PolicyEngine] = None
 
@@ -59,7 +59,7 @@ class RLEvaluatorService:
         3. Improvement delta vs threshold
         """
         try:
-            from sqlalchemy import select, func, and_
+            from sqlalchemy import select, func, and_, case
             from backend.app.models.kpi_orm import KPIMetricORM
             from datetime import timedelta
             
@@ -91,27 +91,25 @@ class RLEvaluatorService:
             window_pre_start = decision_time - timedelta(minutes=30)
             window_post_end = decision_time + timedelta(minutes=30)
             
-            # 3. Query Pre-Decision Baseline
-            res_pre = await self.db_session.execute(
-                select(func.avg(KPIMetricORM.value))
+            # 3-4. Pre-decision baseline and post-decision performance in one
+            # pass over the combined window (conditional aggregation)
+            res = await self.db_session.execute(
+                select(
+                    func.avg(case(
+                        (KPIMetricORM.timestamp <= decision_time, KPIMetricORM.value)
+                    )).label("baseline"),
+                    func.avg(case(
+                        (KPIMetricORM.timestamp >= decision_time, KPIMetricORM.value)
+                    )).label("post"),
+                )
                 .where(and_(
                     KPIMetricORM.entity_id == entity_id,
                     KPIMetricORM.metric_name == target_metric,
-                    KPIMetricORM.timestamp.between(window_pre_start, decision_time)
+                    KPIMetricORM.timestamp.between(window_pre_start, window_post_end)
                 ))
             )
-            baseline = res_pre.scalar() or 0.0
-
-            # 4. Query Post-Decision Performance
-            res_post = await self.db_session.execute(
-                select(func.avg(KPIMetricORM.value))
-                .where(and_(
-                    KPIMetricORM.entity_id == entity_id,
-                    KPIMetricORM.metric_name == target_metric,
-                    KPIMetricORM.timestamp.between(decision_time, window_post_end)
-                ))
-            )
-            post_value = res_post.scalar()
+            baseline, post_value = res.one()
+            baseline = baseline or 0.0
             
             # If no post-data yet (e.g., immediate check), we can't evaluate
             if post_value is None:
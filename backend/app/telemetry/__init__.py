@@ -6,6 +6,7 @@ This package provides:
 - Production-equivalent message schemas (schemas.py)
 - Parquet → Kafka replay producer (replay_producer.py)
 - Kafka → DB consumers with batched writes (kafka_consumers.py)
+- In-process notifications of freshly written KPI samples (kpi_events.py)
 
 Architectural constraint: downstream systems are unaware whether telemetry
 originates from historical Parquet replay or a live network stream.
@@ -30,6 +30,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from backend.app.core.config import get_settings
+from backend.app.telemetry.kpi_events import publish_rows as publish_kpi_rows
 from backend.app.telemetry.topics import TelemetryTopics
 
 logger = logging.getLogger(__name__)
@@ -404,6 +405,8 @@ class TelemetryConsumer:
                     await session.execute(text(_UPSERT_KPI_SQL), kpi_batch)
                     await session.commit()
                 self._total_kpi_written += len(kpi_batch)
+                # Wake anything waiting on these series (post-action validation)
+                publish_kpi_rows(kpi_batch)
             except Exception as e:
                 logger.error(
                     "KPI DB write error (%d rows lost): %s", len(kpi_batch), e
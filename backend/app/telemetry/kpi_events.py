@@ -0,0 +1,75 @@
+"""
+In-process KPI sample notifications.
+
+The telemetry consumer publishes every KPI row it writes; anything that
+needs to react to fresh samples for one entity (e.g. post-execution
+validation of an autonomous action) subscribes here instead of polling
+kpi_metrics.
+
+Subscribers and publishers must share the event loop — the consumer runs
+inside the API process (see main.py lifespan), so this holds in practice.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Per-subscriber backlog; a subscriber that falls further behind than this
+# is only ever interested in recent values, so extra samples are dropped.
+_SUBSCRIBER_QUEUE_MAXSIZE = 256
+
+# (entity_id, kpi_name) → queues of subscribers waiting on that series
+_subscribers: dict[tuple[str, str], set[asyncio.Queue]] = defaultdict(set)
+
+
+@lru_cache(maxsize=8192)
+def canonical_entity_id(entity_id: str) -> str:
+    """UUID-shaped ids in canonical lowercase-hyphenated form; others unchanged."""
+    try:
+        return str(uuid.UUID(entity_id))
+    except ValueError:
+        return entity_id
+
+
+@contextmanager
+def subscribe(entity_id: str, kpi_name: str) -> Iterator[asyncio.Queue]:
+    """Yield a queue receiving each new value of ``kpi_name`` for ``entity_id``."""
+    key = (canonical_entity_id(str(entity_id)), kpi_name)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_MAXSIZE)
+    _subscribers[key].add(queue)
+    try:
+        yield queue
+    finally:
+        queues = _subscribers.get(key)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del _subscribers[key]
+
+
+def publish(entity_id: str, kpi_name: str, value: float) -> None:
+    """Hand one sample to every subscriber of the series (never blocks)."""
+    queues = _subscribers.get((canonical_entity_id(str(entity_id)), kpi_name))
+    if not queues:
+        return
+    for queue in queues:
+        try:
+            queue.put_nowait(value)
+        except asyncio.QueueFull:
+            logger.debug("KPI subscriber backlog full for %s/%s", entity_id, kpi_name)
+
+
+def publish_rows(rows: Iterable[dict[str, Any]]) -> None:
+    """Publish a batch of narrow kpi_metrics rows (as built by the consumer)."""
+    if not _subscribers:
+        return
+    for row in rows:
+        publish(row["entity_id"], row["kpi_name"], row["kpi_value"])
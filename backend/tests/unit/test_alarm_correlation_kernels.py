@@ -0,0 +1,168 @@
+"""Characterisation tests for AlarmCorrelationService.correlate_alarms.
+
+Pure in-process tests — no DB. Pins the clustering semantics (per-entity
+temporal chaining, cross-entity merge by alarm_type, severity and root-cause
+selection) so the hot loop can be optimised without behavioural drift.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from backend.app.services.alarm_correlation import AlarmCorrelationService
+
+T0 = datetime(2026, 10, 16, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _svc() -> AlarmCorrelationService:
+    return AlarmCorrelationService(async_sessionmaker())
+
+
+def _alarm(aid, entity, minutes, alarm_type="LINK_DOWN", severity="minor", **extra):
+    alarm = {
+        "id": aid,
+        "entity_id": entity,
+        "alarm_type": alarm_type,
+        "severity": severity,
+        "raised_at": (T0 + timedelta(minutes=minutes)).isoformat() if minutes is not None else None,
+    }
+    alarm.update(extra)
+    return alarm
+
+
+def _ids(clusters):
+    return sorted(sorted(a["id"] for a in c["alarms"]) for c in clusters)
+
+
+def test_empty_input():
+    assert _svc().correlate_alarms([]) == []
+
+
+def test_same_entity_chains_within_window_and_splits_after_gap():
+    alarms = [
+        _alarm("a", "e1", 0),
+        _alarm("b", "e1", 4),
+        _alarm("c", "e1", 8),   # 4 min after b -> chained
+        _alarm("d", "e1", 20),  # 12 min gap -> new cluster
+    ]
+    assert _ids(_svc().correlate_alarms(alarms)) == [["a", "b", "c"], ["d"]]
+
+
+def test_cross_entity_merge_requires_same_type_and_overlap():
+    alarms = [
+        _alarm("a", "e1", 0),
+        _alarm("b", "e2", 3),                       # same type, overlaps -> merged
+        _alarm("c", "e3", 1, alarm_type="POWER"),   # different type -> separate
+        _alarm("d", "e4", 30),                      # same type, too late -> separate
+    ]
+    assert _ids(_svc().correlate_alarms(alarms)) == [["a", "b"], ["c"], ["d"]]
+
+
+def test_window_boundary_is_inclusive():
+    alarms = [_alarm("a", "e1", 0), _alarm("b", "e2", 5)]
+    assert _ids(_svc().correlate_alarms(alarms)) == [["a", "b"]]
+
+
+def test_missing_alarm_type_never_merges_across_entities():
+    alarms = [_alarm("a", "e1", 0, alarm_type=None), _alarm("b", "e2", 0, alarm_type=None)]
+    assert _ids(_svc().correlate_alarms(alarms)) == [["a"], ["b"]]
+
+
+def test_clusters_without_timestamps_do_not_merge_across_entities():
+    alarms = [_alarm("a", "e1", None), _alarm("b", "e2", None)]
+    assert _ids(_svc().correlate_alarms(alarms)) == [["a"], ["b"]]
+
+
+def test_severity_emergency_and_root_cause():
+    alarms = [
+        _alarm("a", "e1", 0, severity="warning"),
+        _alarm("b", "e1", 1, severity="major"),
+        _alarm("c", "e2", 2, severity="minor"),
+    ]
+    (cluster,) = _svc().correlate_alarms(alarms)
+    assert cluster["alarm_count"] == 3
+    assert cluster["severity"] == "major"
+    assert cluster["root_cause_entity_id"] == "e1"
+    assert cluster["is_emergency_service"] is False
+
+    alarms.append(_alarm("d", "e3", 1, severity="warning", entity_type="EMERGENCY_SERVICE"))
+    (cluster,) = _svc().correlate_alarms(alarms)
+    assert cluster["severity"] == "critical"
+    assert cluster["is_emergency_service"] is True
+
+
+def test_severity_and_root_cause_ties_keep_first_seen():
+    alarms = [
+        _alarm("a", "e2", 0, severity="major"),
+        _alarm("b", "e1", 1, severity="major", alarm_type="LINK_DOWN"),
+        _alarm("c", "e3", 9, severity="minor", alarm_type="OTHER"),
+    ]
+    clusters = _svc().correlate_alarms(alarms)
+    merged = next(c for c in clusters if c["alarm_count"] == 2)
+    # Same clock tick for every cluster of one call
+    assert len({c["created_at"] for c in clusters}) == 1
+    assert merged["severity"] == "major"
+    assert merged["root_cause_entity_id"] == merged["alarms"][0]["entity_id"]
+
+
+def test_accepts_datetime_and_z_suffixed_strings():
+    alarms = [
+        {"id": "a", "entity_id": "e1", "alarm_type": "X", "raised_at": T0},
+        {"id": "b", "entity_id": "e2", "alarm_type": "X", "raised_at": "2026-10-16T12:02:00Z"},
+    ]
+    assert _ids(_svc().correlate_alarms(alarms)) == [["a", "b"]]
+
+
+def test_kernels_match_python_path(monkeypatch):
+    import random
+
+    from backend.app.services import alarm_correlation as mod
+
+    rng = random.Random(7)
+    alarms = [
+        _alarm(
+            f"a{i}",
+            f"e{rng.randrange(40)}",
+            rng.choice([None] + list(range(120))),
+            alarm_type=rng.choice("XYZ"),
+        )
+        for i in range(400)
+    ]
+
+    monkeypatch.setattr(mod, "NUMBA_AVAILABLE", False)
+    expected = [[a["id"] for a in c["alarms"]] for c in _svc().correlate_alarms(alarms)]
+
+    monkeypatch.setattr(mod, "NUMBA_AVAILABLE", True)
+    for name in ("_merge_labels", "_chain_starts"):
+        kernel = getattr(mod, name)
+        monkeypatch.setattr(mod, name, getattr(kernel, "py_func", kernel))
+    actual = [[a["id"] for a in c["alarms"]] for c in _svc().correlate_alarms(alarms)]
+
+    assert actual == expected
+
+
+def test_malformed_timestamp_is_treated_as_missing():
+    svc = _svc()
+    assert svc._parse_time("not-a-time") is None
+    assert svc._parse_time("not-a-time") is None  # memoised miss stays None
+    assert svc._parse_time("2026-10-16T12:00:00Z") == T0
+    assert svc._parse_time(12345) is None
+
+
+def test_untimed_alarm_joins_timed_entity_cluster():
+    # Untimed alarms sort last within their entity and chain onto its last cluster.
+    alarms = [_alarm("a", "e1", None), _alarm("b", "e1", 0), _alarm("c", "e1", 30)]
+    assert _ids(_svc().correlate_alarms(alarms)) == [["a", "c"], ["b"]]
+
+
+def test_vectorised_time_column_matches_per_value_parse():
+    svc = _svc()
+    utc = ["2026-10-16T12:00:00Z", "2026-10-16T12:04:59.123456+00:00"]
+    fast = svc._time_column(utc)
+    slow = svc._time_column(utc + [T0])  # a datetime forces the per-value path
+    assert fast.tolist() == slow.tolist()[:2]
+    # Non-UTC offsets and malformed strings take the per-value path
+    mixed = svc._time_column(["2026-10-16T14:00:00+02:00", "garbage"])
+    assert mixed.tolist()[0] == fast.tolist()[0]
+    assert mixed.tolist()[1] == np.iinfo(np.int64).max
@@ -0,0 +1,147 @@
+"""Unit tests for auth_service login hot paths (verify memo, timing guard, user cache).
+
+Pure in-process tests — no DB. Low bcrypt cost keeps hashing fast.
+"""
+
+import bcrypt
+
+from backend.app.services import auth_service
+
+
+def _hash(plain: str) -> str:
+    return bcrypt.hashpw(plain.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+
+def test_repeat_verification_skips_bcrypt(monkeypatch):
+    hashed = _hash("Correct1!")
+    assert auth_service.verify_password("Correct1!", hashed) is True
+
+    def _boom(*_args):
+        raise AssertionError("checkpw called on a cached pair")
+
+    monkeypatch.setattr(auth_service.bcrypt, "checkpw", _boom)
+    assert auth_service.verify_password("Correct1!", hashed) is True
+
+
+def test_failed_verification_is_never_cached(monkeypatch):
+    """A fast repeat failure would reveal the username exists and make guesses free."""
+    hashed = _hash("Correct1!")
+    calls = []
+    real_checkpw = bcrypt.checkpw
+    monkeypatch.setattr(
+        auth_service.bcrypt, "checkpw", lambda p, h: calls.append(p) or real_checkpw(p, h)
+    )
+    for _ in range(3):
+        assert auth_service.verify_password("wrong", hashed) is False
+    assert calls == [b"wrong"] * 3
+
+
+def test_cache_is_bounded_and_stores_no_plaintext(monkeypatch):
+    monkeypatch.setattr(auth_service, "_VERIFY_CACHE_SIZE", 4)
+    monkeypatch.setattr(auth_service, "_verify_cache", type(auth_service._verify_cache)())
+    for i in range(10):
+        auth_service.verify_password(f"secret-{i}", _hash(f"secret-{i}"))
+
+    assert len(auth_service._verify_cache) == 4
+    assert all(len(k) == 16 and b"secret" not in k for k in auth_service._verify_cache)
+
+
+def test_malformed_hash_is_not_cached():
+    before = len(auth_service._verify_cache)
+    assert auth_service.verify_password("x", "not-a-bcrypt-hash") is False
+    assert len(auth_service._verify_cache) == before
+
+
+def test_missing_user_still_pays_for_a_bcrypt_check(monkeypatch):
+    import asyncio
+
+    checked = []
+
+    async def _no_user(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(auth_service, "get_user_by_username", _no_user)
+    monkeypatch.setattr(auth_service.bcrypt, "checkpw", lambda p, h: checked.append(h) or False)
+
+    assert asyncio.run(auth_service.authenticate_user(None, "ghost", "pw", tenant_id="t1")) is None
+    assert checked == [auth_service._DUMMY_HASH.encode()]
+
+
+def test_dummy_check_bypasses_verify_memo(monkeypatch):
+    """A memo hit on the shared dummy hash would make missing users answer in ~0ms."""
+    import asyncio
+
+    async def _no_user(*_args, **_kwargs):
+        return None
+
+    class _NoTouch(dict):
+        def __getattribute__(self, name):
+            raise AssertionError(f"dummy path touched _verify_cache.{name}")
+
+    checked = []
+    monkeypatch.setattr(auth_service, "get_user_by_username", _no_user)
+    monkeypatch.setattr(auth_service, "_user_cache", {})
+    monkeypatch.setattr(auth_service, "_verify_cache", _NoTouch())
+    monkeypatch.setattr(auth_service.bcrypt, "checkpw", lambda p, h: checked.append(p) or False)
+
+    for _ in range(3):
+        assert asyncio.run(auth_service.authenticate_user(None, "ghost", "pw", tenant_id="t1")) is None
+    assert checked == [b"pw"] * 3  # bcrypt paid on every attempt
+
+
+def test_login_lookup_is_cached_until_invalidated(monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    calls = []
+    row = SimpleNamespace(
+        id="u1", username="alice", hashed_password="h", is_active=True,
+        role="operator", tenant_id="t1", must_change_password=False,
+    )
+
+    async def _lookup(_db, username, tenant_id=None):
+        calls.append((tenant_id, username))
+        return row
+
+    monkeypatch.setattr(auth_service, "get_user_by_username", _lookup)
+    monkeypatch.setattr(auth_service, "_user_cache", {})
+
+    first = asyncio.run(auth_service._get_user_data(None, "alice", "t1"))
+    second = asyncio.run(auth_service._get_user_data(None, "alice", "t1"))
+    assert first is second and first.id == "u1"
+    assert len(calls) == 1
+
+    auth_service.invalidate_user("alice")
+    asyncio.run(auth_service._get_user_data(None, "alice", "t1"))
+    assert len(calls) == 2
+
+
+def test_repeated_failures_pay_bcrypt_for_real_and_unknown_users(monkeypatch):
+    """Timing must not separate real from unknown usernames on repeat attempts either."""
+    import asyncio
+    from types import SimpleNamespace
+
+    row = SimpleNamespace(
+        id="u1", username="alice", hashed_password=_hash("Correct1!"), is_active=True,
+        role="operator", tenant_id="t1", must_change_password=False,
+    )
+
+    async def _lookup(_db, username, tenant_id=None):
+        return row if username == "alice" else None
+
+    calls = []
+    real_checkpw = bcrypt.checkpw
+    monkeypatch.setattr(auth_service, "get_user_by_username", _lookup)
+    monkeypatch.setattr(auth_service, "_user_cache", {})
+    monkeypatch.setattr(auth_service, "_verify_cache", type(auth_service._verify_cache)())
+    monkeypatch.setattr(
+        auth_service.bcrypt, "checkpw", lambda p, h: calls.append(h) or real_checkpw(p, h)
+    )
+
+    for username in ("alice", "ghost"):
+        for _ in range(3):
+            assert asyncio.run(
+                auth_service.authenticate_user(None, username, "wrong", tenant_id="t1")
+            ) is None
+    assert calls[:3] == [row.hashed_password.encode()] * 3
+    assert calls[3:] == [auth_service._DUMMY_HASH_BYTES] * 3
@@ -0,0 +1,158 @@
+"""Unit tests for AutonomousActionExecutor helpers.
+
+Pure in-process tests — no DB. Decision Memory and the embedding provider
+are mocked.
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from backend.app.services import autonomous_action_executor as mod
+from backend.app.services.autonomous_action_executor import AutonomousActionExecutor, _ActionSnapshot
+
+
+def _snapshot(**overrides) -> _ActionSnapshot:
+    fields = dict(
+        id="a1", tenant_id="t1", action_type="cell_failover", entity_id="cell-1",
+        parameters={"target_cell": "cell-2"}, affected_entity_count=1, trace_id=None,
+        created_at=datetime(2026, 10, 16, 12, 0),
+    )
+    fields.update(overrides)
+    return _ActionSnapshot(**fields)
+
+
+def test_confidence_lookup_is_cached_per_action_text():
+    executor = AutonomousActionExecutor()
+    embed = SimpleNamespace(generate_embedding=AsyncMock(return_value=[0.1, 0.2]))
+    find_similar = AsyncMock(return_value=[(object(), 0.82)])
+
+    async def _run():
+        with patch.object(mod, "get_embedding_service", return_value=embed), \
+             patch.object(mod.DecisionTraceRepository, "find_similar", find_similar):
+            first = await executor._confidence_score(None, _snapshot(id="a1"))
+            second = await executor._confidence_score(None, _snapshot(id="a2"))
+            other_tenant = await executor._confidence_score(None, _snapshot(id="a3", tenant_id="t2"))
+        return first, second, other_tenant
+
+    first, second, other_tenant = asyncio.run(_run())
+    assert first == second == other_tenant == 0.82
+    # One embedding for the shared text; one vector search per tenant
+    assert embed.generate_embedding.await_count == 1
+    assert find_similar.await_count == 2
+
+
+def test_ttl_cache_expires_and_evicts(monkeypatch):
+    cache = mod._TTLCache(maxsize=2, ttl=10.0)
+    now = [100.0]
+    monkeypatch.setattr(mod.time, "monotonic", lambda: now[0])
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is mod._MISSING  # evicted, oldest first
+    assert cache.get("b") == 2
+
+    now[0] += 10.0
+    assert cache.get("b") is mod._MISSING  # expired
+
+
+class _BaselineSession:
+    def __init__(self, baseline, stored_avg=None):
+        self._baseline = baseline
+        self._stored_avg = baseline if stored_avg is None else stored_avg
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, _params=None):
+        value = self._baseline if stmt is mod._STMT_KPI_BASELINE else self._stored_avg
+        return SimpleNamespace(scalar=lambda: value)
+
+
+def _validate(executor, publish_values, window=0.2, stored_avg=None):
+    from backend.app.telemetry import kpi_events
+
+    executor.VALIDATION_POLL_SECONDS = window
+    pred = SimpleNamespace(risk_score=10)
+
+    async def _run():
+        async def _feed():
+            await asyncio.sleep(0)  # let validation subscribe first
+            for value in publish_values:
+                kpi_events.publish("cell-1", "traffic_volume", value)
+
+        with patch.object(mod, "metrics_session_maker", lambda: _BaselineSession(100.0, stored_avg)):
+            feeder = asyncio.create_task(_feed())
+            passed = await executor._validate_post_execution(None, _snapshot(), pred)
+            await feeder
+        return passed
+
+    return asyncio.run(_run())
+
+
+def test_validation_fails_on_published_degradation():
+    executor = AutonomousActionExecutor()
+    # EWMA: 95 → 85 → 77.5 vs baseline 100; fails on the second sample
+    assert _validate(executor, [95.0, 75.0, 60.0], window=5.0) is False
+
+
+def test_validation_passes_when_samples_hold():
+    executor = AutonomousActionExecutor()
+    assert _validate(executor, [99.0, 101.0, 98.0]) is True
+    assert _validate(executor, []) is True  # no samples; stored KPIs hold
+
+
+def test_validation_falls_back_to_stored_kpis_without_pushed_samples():
+    """Degradation written by another process must still fail the gate."""
+    executor = AutonomousActionExecutor()
+    assert _validate(executor, [], stored_avg=80.0) is False
+    assert _validate(executor, [99.0], stored_avg=80.0) is False  # too few samples
+    # Enough healthy pushed samples: the stored average is not consulted
+    assert _validate(executor, [99.0, 101.0, 98.0], stored_avg=80.0) is True
+
+
+def test_kpi_events_match_non_canonical_uuid():
+    from backend.app.telemetry import kpi_events
+
+    entity = "7c9e6679-7425-40de-944b-e07fc1f90ae7"
+
+    async def _run():
+        with kpi_events.subscribe(entity, "traffic_volume") as samples:
+            kpi_events.publish(entity.upper(), "traffic_volume", 1.0)
+            kpi_events.publish("{%s}" % entity, "traffic_volume", 2.0)
+            return [samples.get_nowait(), samples.get_nowait()]
+
+    assert asyncio.run(_run()) == [1.0, 2.0]
+
+
+def test_canonical_entity_id():
+    assert mod._canonical_entity_id("7C9E6679-7425-40DE-944B-E07FC1F90AE7") == "7c9e6679-7425-40de-944b-e07fc1f90ae7"
+    assert mod._canonical_entity_id("cell-1") == "cell-1"
+
+
+def test_kpi_numerics():
+    from backend.app.services.autonomous_actions import _kpi_numerics as kn
+
+    ewma = kn.update_ewma(float("nan"), 95.0, 0.5)
+    assert ewma == 95.0
+    ewma = kn.update_ewma(ewma, 75.0, 0.5)
+    assert ewma == 85.0
+    assert kn.check_degradation(100.0, ewma, 10.0) is True
+    assert kn.check_degradation(100.0, 95.0, 10.0) is False
+    assert kn.check_degradation(0.0, 50.0, 10.0) is False  # no usable baseline
+
+
+def test_cell_failover_prediction_calls_twin_once():
+    executor = AutonomousActionExecutor(session_factory=lambda: _BaselineSession(None))
+    pred = SimpleNamespace(risk_score=20, impact_delta=0.02, confidence_interval="0-0")
+    predict = AsyncMock(return_value=pred)
+
+    with patch.object(mod.DigitalTwinMock, "predict", predict):
+        assert asyncio.run(executor._predict_outcome(_snapshot())) is pred
+    assert predict.await_count == 1
+    assert predict.await_args.kwargs["parameters"] == {"target_cell": "cell-2"}
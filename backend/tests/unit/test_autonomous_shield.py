@@ -0,0 +1,249 @@
+"""Unit tests for AutonomousShieldService drift detection.
+
+The batch path must agree with the scalar ``detect_drift`` row for row.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+
+from backend.app.services.autonomous_shield import AutonomousShieldService, drift_arrays
+
+
+def _service() -> AutonomousShieldService:
+    service = AutonomousShieldService(None)
+    service.drift_threshold_pct = 0.15
+    return service
+
+
+def test_drift_arrays_edge_cases():
+    mag, conf, minutes = drift_arrays(
+        np.array([0.65, 0.9, 5.0, 1.0]), np.array([0.65, 0.65, 0.0, -2.0]), 0.15
+    )
+    assert mag[0] == 0.0 and minutes[0] == -1          # no drift
+    assert minutes[1] == int(60 / mag[1])               # breach predicted
+    assert mag[2] == 0.0 and conf[2] == 0.0             # zero baseline
+    assert mag[3] == 1.5 and conf[3] == 0.95            # negative baseline, capped
+
+
+def test_batch_matches_scalar_detection():
+    service = _service()
+    rng = np.random.default_rng(7)
+    base = rng.uniform(0.0, 2.0, 200)
+    base[::17] = 0.0
+    cur = base * rng.uniform(0.5, 1.6, 200)
+    ids = [uuid.uuid4() for _ in range(200)]
+    names = [f"cell-{i}" for i in range(200)]
+    metrics = ["prb_utilization"] * 200
+
+    now = datetime.now(timezone.utc)
+    batch = service.detect_drift_batch(ids, names, metrics, cur, base, detected_at=now).to_models()
+    scalar = [
+        service.detect_drift(
+            ids[i], names[i], metrics[i], float(cur[i]), float(base[i]), detected_at=now
+        )
+        for i in range(200)
+    ]
+    expected = [p for p in scalar if p.predicted_breach_time is not None]
+    assert [p.model_dump() for p in batch] == [p.model_dump() for p in expected]
+
+
+def test_kernel_matches_numpy_path(monkeypatch):
+    from backend.app.services import autonomous_shield as mod
+
+    kernel = getattr(mod._drift_kernel, "py_func", mod._drift_kernel)
+    rng = np.random.default_rng(11)
+    base = rng.uniform(-1.0, 2.0, 64)
+    base[::9] = 0.0
+    cur = base * rng.uniform(0.5, 1.6, 64)
+
+    monkeypatch.setattr(mod, "NUMBA_AVAILABLE", False)
+    expected = drift_arrays(cur, base, 0.15)
+    got = kernel(cur, base, 0.15)
+    for g, e in zip(got, expected):
+        np.testing.assert_array_equal(g, e)
+
+
+def test_preventive_action_category_dispatch():
+    service = _service()
+    cases = [
+        ("prb_utilization", 0.4, "critical", "Review PRB allocation"),
+        ("cell_load", 0.2, "high", "Review PRB allocation"),
+        ("error_load", 0.9, "critical", "Review PRB allocation"),  # load wins
+        ("rtt_ms", 0.9, "high", "Investigate routing path"),
+        ("call_fail_rate", 0.6, "critical", "Check hardware health"),
+        ("Error_Rate", 0.2, "high", "Check hardware health"),
+        ("throughput", 0.9, "medium", "Monitor throughput on cell-1"),
+    ]
+    for metric, magnitude, priority, prefix in cases:
+        drift = service.detect_drift(uuid.uuid4(), "cell-1", metric, 1.0 + magnitude, 1.0)
+        drift.drift_magnitude = magnitude
+        rec = service.evaluate_preventive_action(drift)
+        assert rec.priority == priority, metric
+        assert rec.action_description.startswith(prefix), metric
+
+
+def test_value_protected_single_pass():
+    service = _service()
+    value = service.calculate_value_protected([
+        {"outcome": "prevented", "mttr_saved_minutes": 12.5, "revenue_at_risk": 100.0},
+        {"outcome": "escalated", "mttr_saved_minutes": 2.5},
+        {"outcome": "prevented", "revenue_at_risk": 50.0},
+    ])
+    assert value.incidents_prevented == 2
+    assert value.uptime_gained_minutes == 15.0
+    assert value.revenue_protected == 150.0
+
+    unpriced = service.calculate_value_protected([{"outcome": "prevented"}])
+    assert unpriced.revenue_protected is None
+    assert unpriced.uptime_gained_minutes == 0.0
+
+
+def test_calibrated_threshold_parsed_from_recommendation(monkeypatch):
+    import asyncio
+
+    from backend.app.services import drift_calibration
+
+    class _Calib:
+        def __init__(self, _factory):
+            pass
+
+        async def get_false_positive_rate(self, tenant_id, session=None):
+            return {"recommendation": "Recommend increasing DRIFT_THRESHOLD_PCT from 15.0% to 16.5% to reduce noise."}
+
+    monkeypatch.setattr(drift_calibration, "DriftCalibrationService", _Calib)
+    service = _service()
+    assert asyncio.run(service.refresh_calibrated_threshold("t1")) == 0.165
+    assert service.drift_threshold_pct == 0.165
+
+
+def test_constructed_models_survive_validation():
+    """model_construct skips validation, so the service must emit valid field types."""
+    from backend.app.schemas.autonomous import (
+        ChangeRequestOutput,
+        DriftPrediction,
+        PreventiveRecommendation,
+    )
+
+    service = _service()
+    drift = service.detect_drift(uuid.uuid4(), "cell-1", "prb_utilization", 1, 0.65)
+    rec = service.evaluate_preventive_action(drift)
+    cr = service.generate_change_request(rec)
+    for model, obj in (
+        (DriftPrediction, drift),
+        (PreventiveRecommendation, rec),
+        (ChangeRequestOutput, cr),
+    ):
+        dumped = obj.model_dump()
+        assert model.model_validate(dumped).model_dump() == dumped
+    assert isinstance(drift.current_value, float)
+
+
+def test_change_request_description():
+    service = _service()
+    drift = service.detect_drift(uuid.uuid4(), "cell-{7}", "rtt_ms", 1.5, 1.0)
+    rec = service.evaluate_preventive_action(drift)
+    cr = service.generate_change_request(rec)
+    assert cr.description == (
+        "Pedkai has detected a KPI drift and recommends the following action:\n\n"
+        f"**Action**: {rec.action_description}\n\n"
+        f"**Expected Benefit**: {rec.expected_benefit}\n\n"
+        f"**Risk if Ignored**: {rec.risk_if_ignored}\n\n"
+        "**Priority**: high\n\n"
+        "This change request was generated by Pedkai Autonomous Shield. "
+        "A qualified engineer must review, approve, and execute this change."
+    )
+    assert "cell-{7}" in cr.description  # braces in values are not re-interpreted
+
+
+def test_kalman_bank_filters_per_series():
+    from backend.app.services.autonomous_shield import _KalmanBank
+
+    bank = _KalmanBank(process_var=1e-4, measurement_var=1e-2, capacity=1)
+    a, b = ("e1", "prb"), ("e2", "prb")
+
+    x_hat, nis = bank.update([a, b], [0.0, 0.5])
+    assert x_hat[0] == 0.0
+    assert 0.0 < x_hat[1] < 0.1                        # prior is "no drift": moved by the gain only
+    assert len(bank) == 2                              # grew past capacity
+
+    for _ in range(60):
+        x_hat, nis = bank.update([a, b], [0.0, 0.5])
+    assert abs(x_hat[1] - 0.5) < 0.01 and nis[1] < 0.1
+
+    # One spike on a only moves it by the gain, and flags a large innovation
+    x_hat, nis = bank.update([a, b], [1.0, 0.5])
+    assert 0.0 < x_hat[0] < 0.2 and nis[0] > 3.84
+    x_b = x_hat[1]
+
+    # Two samples of one series in one batch are applied in order
+    x_seq, _ = bank.update([a, a], [0.3, 0.3])
+    assert x_seq[0] < x_seq[1] < 0.3
+
+    x_nan, nis_nan = bank.update([b], [np.nan])
+    assert x_nan[0] == x_b and nis_nan[0] == 0.0
+
+
+def test_kalman_bank_evicts_least_recently_updated():
+    from backend.app.services.autonomous_shield import _KalmanBank
+
+    bank = _KalmanBank(capacity=1, max_series=2)
+    a, b, c = ("e1", "prb"), ("e2", "prb"), ("e3", "prb")
+    for _ in range(30):
+        bank.update([a, b], [0.5, 0.5])
+    bank.update([b], [0.5])                            # a is now least recent
+
+    x_hat, _ = bank.update([c], [0.5])
+    assert len(bank) == 2 and a not in bank._slots
+    assert x_hat[0] < 0.1                              # c starts from the prior
+
+    # a returns with fresh state, not c's or its own old estimate
+    x_hat, _ = bank.update([a], [0.0])
+    assert x_hat[0] == 0.0 and len(bank) == 2
+
+    # A batch wider than the cap never evicts a series it also samples
+    x_hat, _ = bank.update([a, c, b], [0.0, 0.5, 0.5])
+    assert len(bank) == 3 and x_hat[1] > 0.05
+
+
+def test_tracked_drift_ignores_single_spike(monkeypatch):
+    from backend.app.services import autonomous_shield as mod
+
+    monkeypatch.setattr(mod, "_kalman_bank", mod._KalmanBank())
+    service = _service()
+    entity = uuid.uuid4()
+
+    def tick(value):
+        return service.detect_drift_tracked([entity], ["cell-1"], ["prb_utilization"], [value], [1.0])
+
+    assert len(tick(1.8)) == 0      # a new series' first sample is not trusted outright
+    for _ in range(20):
+        assert len(tick(1.0)) == 0
+    assert len(tick(1.8)) == 0      # raw 80% deviation, filtered well below 15%
+    assert service.detect_drift_batch([entity], ["cell-1"], ["prb_utilization"], [1.8], [1.0])
+
+    for _ in range(40):
+        batch = tick(1.5)           # sustained 50% drift converges past threshold
+    preds = batch.to_models()
+    assert preds and preds[0].drift_magnitude > 0.4
+    assert preds[0].current_value == 1.5
+
+
+def test_drift_batch_arrays():
+    from backend.app.services.autonomous_shield import METRIC_CATEGORIES
+
+    service = _service()
+    ids = [uuid.uuid4() for _ in range(4)]
+    batch = service.detect_drift_batch(
+        ids, ["a", "b", "c", "d"], ["prb_util", "rtt", "throughput", "call_fail"],
+        np.array([2.0, 1.0, 3.0, 1.5]), np.array([1.0, 1.0, 1.0, 1.0]),
+    )
+    assert len(batch) == 3                                   # "rtt" row holds
+    assert list(batch.entity_ids) == [ids[0], ids[2], ids[3]]
+    assert [METRIC_CATEGORIES[c] for c in batch.category] == ["load", "other", "error"]
+    np.testing.assert_array_equal(batch.magnitude, [1.0, 2.0, 0.5])
+    assert [p.entity_name for p in batch.to_models()] == ["a", "c", "d"]
+
+    empty = service.detect_drift_batch([], [], [], np.array([]), np.array([]))
+    assert len(empty) == 0 and empty.to_models() == []
@@ -0,0 +1,38 @@
+"""Unit tests for CapacityEngine budget selection."""
+
+import random
+
+from backend.app.services.capacity_engine import _select_within_budget
+
+
+def _greedy(candidates, budget):
+    selected, cost = [], 0.0
+    for cand in sorted(candidates, key=lambda x: x["pressure"], reverse=True):
+        if cost + cand["cost"] <= budget:
+            selected.append(cand)
+            cost += cand["cost"]
+    return selected, cost
+
+
+def test_select_within_budget_matches_greedy_loop():
+    rng = random.Random(5)
+    for _ in range(200):
+        n = rng.randint(0, 40)
+        candidates = [
+            {"name": f"s{i}", "cost": round(rng.uniform(30000, 90000), 2),
+             "pressure": rng.choice([0.86, 0.9, 0.9, 0.93, 0.97])}
+            for i in range(n)
+        ]
+        budget = rng.uniform(0, 600000)
+        assert _select_within_budget(candidates, budget) == _greedy(candidates, budget)
+
+
+def test_cheaper_site_after_overflow_is_still_taken():
+    candidates = [
+        {"name": "a", "cost": 60000, "pressure": 0.95},
+        {"name": "b", "cost": 50000, "pressure": 0.92},  # does not fit after a
+        {"name": "c", "cost": 30000, "pressure": 0.90},
+    ]
+    selected, cost = _select_within_budget(candidates, 100000)
+    assert [c["name"] for c in selected] == ["a", "c"]
+    assert cost == 90000
@@ -0,0 +1,57 @@
+"""Unit tests for customer prioritisation.
+
+The NumPy path for large lists must return exactly the order the
+``sorted`` path does, ties included.
+"""
+
+import random
+
+import pytest
+
+from backend.app.services import customer_prioritisation as mod
+from backend.app.services.customer_prioritisation import PrioritisationStrategy, prioritise_customers
+
+
+def _customers(n: int):
+    rng = random.Random(3)
+    tiers = ["platinum", "gold", "silver", "bronze", "unknown", None]
+    out = []
+    for i in range(n):
+        c = {"id": i}
+        if rng.random() < 0.9:
+            c["monthly_fee"] = rng.choice([None, 0, 10, 25.5, 99, 99, 120])
+        if rng.random() < 0.9:
+            c["sla_tier"] = rng.choice(tiers)
+        if rng.random() < 0.9:
+            c["churn_risk_score"] = rng.choice([None, 0.1, 0.5, 0.5, 0.9])
+        if rng.random() < 0.5:
+            c["is_emergency_service"] = rng.random() < 0.2
+        out.append(c)
+    return out
+
+
+@pytest.mark.parametrize("strategy", list(PrioritisationStrategy))
+def test_vectorised_order_matches_sorted(monkeypatch, strategy):
+    customers = _customers(2000)
+    vectorised = prioritise_customers(customers, strategy)
+
+    monkeypatch.setattr(mod, "VECTORISE_MIN_CUSTOMERS", 10**9)
+    expected = prioritise_customers(customers, strategy)
+
+    assert [c["id"] for c in vectorised] == [c["id"] for c in expected]
+
+
+def test_emergency_first_small_list():
+    customers = [
+        {"id": "a", "monthly_fee": 50},
+        {"id": "b", "monthly_fee": 10, "is_emergency_service": True},
+        {"id": "c", "monthly_fee": 80},
+    ]
+    ordered = prioritise_customers(customers, PrioritisationStrategy.EMERGENCY_FIRST)
+    assert [c["id"] for c in ordered] == ["b", "c", "a"]
+
+
+def test_unknown_strategy_falls_back_to_revenue():
+    customers = [{"id": "a", "monthly_fee": 5}, {"id": "b", "monthly_fee": 50}]
+    assert [c["id"] for c in prioritise_customers(customers, "bogus")] == ["b", "a"]
+    assert [c["id"] for c in prioritise_customers(customers, "revenue")] == ["b", "a"]
@@ -0,0 +1,33 @@
+"""Unit tests for EmbeddingService decision-text builders (no provider calls)."""
+
+from types import SimpleNamespace
+
+from backend.app.services.embedding_service import EmbeddingService
+
+
+def test_batch_text_matches_single_record_builder():
+    svc = EmbeddingService.__new__(EmbeddingService)
+    rows = [
+        SimpleNamespace(
+            trigger_description="Cell outage",
+            decision_summary="Reroute",
+            tradeoff_rationale="Lower latency",
+            action_taken="Shift traffic",
+        ),
+        SimpleNamespace(
+            trigger_description=None,
+            decision_summary="Hold",
+            tradeoff_rationale=None,
+            action_taken="",
+        ),
+    ]
+    expected = [
+        svc.create_decision_text(
+            trigger_description=r.trigger_description or "",
+            decision_summary=r.decision_summary or "",
+            tradeoff_rationale=r.tradeoff_rationale or "",
+            action_taken=r.action_taken or "",
+        )
+        for r in rows
+    ]
+    assert svc.create_decision_text_batch(rows) == expected
@@ -0,0 +1,61 @@
+"""Unit tests for KpiSampleBucketBuffer (vertical kpi_sample_buckets storage).
+
+Pure in-process tests — no DB. Exercises minute bucketing, offset encoding
+and partial drains.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from backend.app.services.kpi_sample_buckets import KpiSampleBucketBuffer, bucket_start_for
+
+T0 = datetime(2026, 10, 16, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def test_bucket_start_truncates_to_utc_minute():
+    ts = datetime(2026, 10, 16, 14, 30, 45, 123456, tzinfo=timezone(timedelta(hours=2)))
+    assert bucket_start_for(ts) == datetime(2026, 10, 16, 12, 30, tzinfo=timezone.utc)
+
+
+def test_samples_in_same_minute_share_one_row():
+    buf = KpiSampleBucketBuffer(source="SYNTHETIC_TEST")
+    eid = uuid4()
+    for s in range(60):
+        buf.add("t1", eid, "PRB_UTIL", float(s), T0 + timedelta(seconds=s, milliseconds=250))
+
+    rows = buf.drain()
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["bucket_start"] == T0
+    assert row["values"] == [float(s) for s in range(60)]
+    assert row["ts_offsets_ms"] == [s * 1000 + 250 for s in range(60)]
+    assert row["source"] == "SYNTHETIC_TEST"
+    assert len(buf) == 0
+
+
+def test_keys_split_by_metric_and_minute():
+    buf = KpiSampleBucketBuffer()
+    eid = uuid4()
+    buf.add("t1", eid, "PRB_UTIL", 1.0, T0)
+    buf.add("t1", eid, "LATENCY_MS", 2.0, T0)
+    buf.add("t1", eid, "PRB_UTIL", 3.0, T0 + timedelta(minutes=1))
+    assert len(buf) == 3
+
+
+def test_drain_before_keeps_open_minute_buffered():
+    buf = KpiSampleBucketBuffer()
+    eid = uuid4()
+    buf.add("t1", eid, "PRB_UTIL", 1.0, T0 + timedelta(seconds=5))
+    buf.add("t1", eid, "PRB_UTIL", 2.0, T0 + timedelta(minutes=1, seconds=5))
+
+    rows = buf.drain(before=T0 + timedelta(minutes=1, seconds=30))
+    assert [r["bucket_start"] for r in rows] == [T0]
+    assert len(buf) == 1
+
+
+def test_naive_timestamps_treated_as_utc():
+    buf = KpiSampleBucketBuffer()
+    buf.add("t1", uuid4(), "PRB_UTIL", 1.0, datetime(2026, 10, 16, 12, 0, 7))
+    (row,) = buf.drain()
+    assert row["bucket_start"] == T0
+    assert row["ts_offsets_ms"] == [7000]
@@ -0,0 +1,60 @@
+"""Unit tests for ORJSONPydanticResponse.
+
+The fast path must produce the same JSON document FastAPI would have produced
+via Pydantic's own serializer.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+from backend.app.core.responses import ORJSONPydanticResponse
+from backend.app.schemas.service_impact import AlarmCluster
+from backend.app.schemas.topology import EntityResponse, TopologyGraphResponse
+
+
+def _graph() -> TopologyGraphResponse:
+    return TopologyGraphResponse(
+        tenant_id="t1",
+        entities=[
+            EntityResponse(
+                id=uuid.uuid4(),
+                external_id="CELL-1",
+                name="Cell 1",
+                entity_type="CELL",
+                tenant_id="t1",
+                last_synced_at=datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+            )
+        ],
+        relationships=[],
+    )
+
+
+def test_model_matches_pydantic_json():
+    model = _graph()
+    body = ORJSONPydanticResponse(model).body
+    assert json.loads(body) == json.loads(model.model_dump_json())
+
+
+def test_list_of_models_matches_pydantic_json():
+    clusters = [
+        AlarmCluster(
+            cluster_id=uuid.uuid4(),
+            alarm_count=3,
+            noise_reduction_pct=66.7,
+            severity="major",
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+    ]
+    body = ORJSONPydanticResponse(clusters).body
+    assert json.loads(body) == [json.loads(c.model_dump_json()) for c in clusters]
+
+
+def test_json_column_serializer_matches_stdlib_shape():
+    import numpy as np
+
+    from backend.app.core.database import _json_serializer
+
+    payload = {"prediction": {"risk_score": 10, "impact_delta": 0.1}, 3: [1, 2]}
+    assert json.loads(_json_serializer(payload)) == json.loads(json.dumps(payload))
+    assert json.loads(_json_serializer({"v": np.float64(0.5)})) == {"v": 0.5}
@@ -39,6 +39,11 @@ CREATE INDEX IF NOT EXISTS idx_kpi_tenant_time
 CREATE INDEX IF NOT EXISTS idx_kpi_name_time
     ON kpi_metrics (kpi_name, timestamp DESC);
 
+-- Per-series windows (one entity's KPI, newest first): action validation
+-- baselines and RL outcome checks
+CREATE INDEX IF NOT EXISTS idx_kpi_entity_name_time
+    ON kpi_metrics (entity_id, kpi_name, timestamp DESC);
+
 -- Enable compression after 7 days
 ALTER TABLE kpi_metrics SET (
     timescaledb.compress,
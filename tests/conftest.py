@@ -3,6 +3,7 @@ Pytest configuration and fixtures.
 """
 
 import asyncio
+import os
 from typing import AsyncGenerator, Generator
 
 import pytest
@@ -10,10 +11,13 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import JSON, String, Text
 
+# Minimum bcrypt cost for test hashing; must be set before auth_service imports.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 # Compliance patch for SQLite (doesn't support JSONB/Vector/UUID natively)
 @compiles(JSONB, 'sqlite')
 def compile_jsonb_sqlite(type_, compiler, **kw):
@@ -27,17 +31,23 @@ def compile_vector_sqlite(type_, compiler, **kw):
 def compile_uuid_sqlite(type_, compiler, **kw):
     return "VARCHAR(36)"
 
+@compiles(ARRAY, 'sqlite')
+def compile_array_sqlite(type_, compiler, **kw):
+    return "JSON"
+
 from backend.app.main import app
+from backend.app.core import database
 from backend.app.core.database import Base, get_db
 from backend.app.core.config import get_settings
 from backend.app.core.security import get_current_user, oauth2_scheme
+from backend.app.services import auth_service
 
 # Import all models to register them with Base.metadata (Fix for "No such table" in tests)
 from backend.app.models.incident_orm import IncidentORM
 from backend.app.models.decision_trace_orm import DecisionTraceORM, DecisionFeedbackORM
 from backend.app.models.topology_models import EntityRelationshipORM
 from backend.app.models.network_entity_orm import NetworkEntityORM
-from backend.app.models.kpi_sample_orm import KpiSampleORM
+from backend.app.models.kpi_sample_orm import KpiSampleORM, KpiSampleBucketORM
 from backend.app.models.audit_orm import IncidentAuditEntryORM
 from backend.app.models.action_execution_orm import ActionExecutionORM
 from backend.app.models.tenant_orm import TenantORM
@@ -56,6 +66,8 @@ engine = create_async_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
+    # Same JSON column codec as the application engines
+    **database._json_kwargs,
 )
 
 TestingSessionLocal = async_sessionmaker(
@@ -88,6 +100,8 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Each test gets fresh tables, so cached login rows from earlier tests are stale
+    auth_service._user_cache.clear()
 
     async with TestingSessionLocal() as session:
         yield session
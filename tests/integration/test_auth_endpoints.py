@@ -267,8 +267,12 @@ async def test_change_password_success(client_real_auth: AsyncClient, db_session
 
 
 @pytest.mark.asyncio
-async def test_change_password_wrong_current(client_real_auth: AsyncClient, db_session: AsyncSession):
-    """Wrong current password is rejected."""
+async def test_change_password_wrong_current(
+    client_real_auth: AsyncClient, db_session: AsyncSession, monkeypatch
+):
+    """Wrong current password is rejected without hashing the new one."""
+    from backend.app.services import auth_service
+
     await _setup_env(db_session)
     login = await client_real_auth.post(
         "/api/v1/auth/token",
@@ -276,6 +280,11 @@ async def test_change_password_wrong_current(client_real_auth: AsyncClient, db_s
     )
     token = login.json()["access_token"]
 
+    def _no_hash(_plain):
+        raise AssertionError("new password hashed before the current one was verified")
+
+    monkeypatch.setattr(auth_service, "hash_password", _no_hash)
+
     resp = await client_real_auth.post(
         "/api/v1/auth/change-password",
         json={"current_password": "wrong", "new_password": "NewAdminPass1!"},
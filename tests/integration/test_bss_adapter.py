@@ -0,0 +1,176 @@
+import pytest
+from uuid import uuid4
+
+from backend.app.models.bss_orm import BillingAccountORM, ServicePlanORM
+from backend.app.services.bss_adapter import LocalBSSAdapter
+
+
+@pytest.mark.asyncio
+async def test_local_adapter_revenue_at_risk(db_session):
+    """Priced customers are summed; customers without a BSS account are unpriced."""
+    gold = ServicePlanORM(id=uuid4(), tenant_id="test", name="Gold", tier="GOLD", monthly_fee=120.0)
+    silver = ServicePlanORM(id=uuid4(), tenant_id="test", name="Silver", tier="SILVER", monthly_fee=45.5)
+    db_session.add_all([gold, silver])
+    customers = [uuid4() for _ in range(3)]
+    db_session.add_all([
+        BillingAccountORM(tenant_id="test", customer_id=customers[0], plan_id=gold.id),
+        BillingAccountORM(tenant_id="test", customer_id=customers[1], plan_id=silver.id),
+    ])
+    await db_session.flush()
+
+    result = await LocalBSSAdapter(db_session).get_revenue_at_risk(customers)
+
+    assert result.source == "bss_local"
+    assert result.total_revenue_at_risk == pytest.approx(165.5)
+    assert result.priced_customer_count == 2
+    assert result.unpriced_customer_count == 1
+    assert result.requires_manual_valuation is True
+
+
+@pytest.mark.asyncio
+async def test_local_adapter_counts_customers_not_accounts(db_session):
+    """Two priced accounts for one customer must not hide an unpriced customer."""
+    plan = ServicePlanORM(id=uuid4(), tenant_id="test", name="Gold", tier="GOLD", monthly_fee=50.0)
+    db_session.add(plan)
+    multi, missing = uuid4(), uuid4()
+    db_session.add_all([
+        BillingAccountORM(tenant_id="test", customer_id=multi, plan_id=plan.id),
+        BillingAccountORM(tenant_id="test", customer_id=multi, plan_id=plan.id),
+    ])
+    await db_session.flush()
+
+    result = await LocalBSSAdapter(db_session).get_revenue_at_risk([multi, missing, multi])
+
+    assert result.total_revenue_at_risk == pytest.approx(100.0)
+    assert result.priced_customer_count == 1
+    assert result.unpriced_customer_count == 1
+    assert result.requires_manual_valuation is True
+
+
+@pytest.mark.asyncio
+async def test_local_adapter_revenue_at_risk_no_accounts(db_session):
+    adapter = LocalBSSAdapter(db_session)
+    assert (await adapter.get_revenue_at_risk([])).total_revenue_at_risk is None
+
+    result = await adapter.get_revenue_at_risk([uuid4(), uuid4()])
+    assert result.total_revenue_at_risk is None
+    assert result.priced_customer_count == 0
+    assert result.unpriced_customer_count == 2
+
+
+@pytest.mark.asyncio
+async def test_local_adapter_disputes(db_session):
+    from datetime import datetime, timedelta, timezone
+
+    plan = ServicePlanORM(id=uuid4(), tenant_id="test", name="Gold", tier="GOLD", monthly_fee=80.0)
+    db_session.add(plan)
+    disputed, calm = uuid4(), uuid4()
+    db_session.add_all([
+        BillingAccountORM(
+            tenant_id="test", customer_id=disputed, plan_id=plan.id,
+            last_billing_dispute=datetime.now(timezone.utc) - timedelta(days=3),
+        ),
+        BillingAccountORM(tenant_id="test", customer_id=calm, plan_id=plan.id),
+    ])
+    await db_session.commit()
+
+    assert await LocalBSSAdapter(db_session).check_disputes([disputed, calm]) == {disputed}
+
+
+@pytest.mark.asyncio
+async def test_bss_service_revenue_at_risk_returns_float(db_session):
+    from backend.app.services.bss_service import BSSService
+
+    plan = ServicePlanORM(id=uuid4(), tenant_id="test", name="Gold", tier="GOLD", monthly_fee=99.5)
+    customer = uuid4()
+    db_session.add_all([plan, BillingAccountORM(tenant_id="test", customer_id=customer, plan_id=plan.id)])
+    await db_session.flush()
+
+    service = BSSService(None)
+    assert await service.calculate_revenue_at_risk([customer], session=db_session) == 99.5
+    none_matched = await service.calculate_revenue_at_risk([uuid4()], session=db_session)
+    assert none_matched == 0.0 and isinstance(none_matched, float)
+
+
+@pytest.mark.asyncio
+async def test_bss_service_summarize_impact(db_session):
+    from datetime import datetime, timedelta, timezone
+
+    from sqlalchemy import event
+
+    from backend.app.services.bss_service import BSSService
+
+    plan = ServicePlanORM(id=uuid4(), tenant_id="test", name="Gold", tier="GOLD", monthly_fee=60.0)
+    disputed, calm, stale, unknown = uuid4(), uuid4(), uuid4(), uuid4()
+    now = datetime.now(timezone.utc)
+    db_session.add_all([
+        plan,
+        BillingAccountORM(tenant_id="test", customer_id=disputed, plan_id=plan.id,
+                          last_billing_dispute=now - timedelta(days=2)),
+        BillingAccountORM(tenant_id="test", customer_id=calm, plan_id=plan.id),
+        BillingAccountORM(tenant_id="test", customer_id=stale, plan_id=plan.id,
+                          last_billing_dispute=now - timedelta(days=90)),
+    ])
+    await db_session.flush()
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    service = BSSService(None)
+    ids = [disputed, calm, stale, unknown]
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        summary = await service.summarize_impact(ids, session=db_session)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    assert len(statements) == 1
+    assert summary.revenue_at_risk == await service.calculate_revenue_at_risk(ids, session=db_session)
+    assert summary.monthly_fees == {disputed: 60.0, calm: 60.0, stale: 60.0}
+    assert summary.disputed_customer_ids == await service.check_recent_disputes(
+        ids, session=db_session
+    ) == {disputed}
+    assert summary.plan_tiers == {"GOLD"}
+
+
+@pytest.mark.asyncio
+async def test_local_adapter_billing_account(db_session):
+    """The plan is eager-loaded; every other relationship is raiseload'ed."""
+    plan = ServicePlanORM(id=uuid4(), tenant_id="test", name="Gold", tier="GOLD", monthly_fee=120.0)
+    db_session.add(plan)
+    customer = uuid4()
+    db_session.add(BillingAccountORM(tenant_id="test", customer_id=customer, plan_id=plan.id))
+    await db_session.commit()
+    db_session.expunge_all()
+
+    info = await LocalBSSAdapter(db_session).get_billing_account(customer)
+    assert info.plan_name == "Gold"
+    assert info.monthly_fee == 120.0
+    assert await LocalBSSAdapter(db_session).get_billing_account(uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_bss_service_batch_shares_one_session(db_session, session_factory):
+    from backend.app.services.bss_service import BSSService
+
+    opened = []
+
+    def factory():
+        opened.append(1)
+        return session_factory()
+
+    service = BSSService(factory)
+    async with service.batch() as s:
+        await service.calculate_cumulative_active_risk(session=s)
+        await service.calculate_revenue_at_risk([uuid4()], session=s)
+        await service.get_account_by_customer_id(uuid4(), session=s)
+    assert len(opened) == 1
+
+    # A caller-owned session is passed straight through
+    async with session_factory() as own:
+        async with service.batch(own) as s:
+            assert s is own
+    assert len(opened) == 1
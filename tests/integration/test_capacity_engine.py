@@ -0,0 +1,47 @@
+import json
+
+import pytest
+from sqlalchemy import event
+
+from backend.app.models.investment_planning import DensificationRequestORM
+from backend.app.models.kpi_orm import KPIMetricORM
+from backend.app.models.topology_models import EntityRelationshipORM
+from backend.app.services.capacity_engine import CapacityEngine
+
+
+@pytest.mark.asyncio
+async def test_densification_reads_topology_in_one_query(db_session):
+    request = DensificationRequestORM(
+        tenant_id="test", region_name="Pune", budget_limit=1_000_000.0,
+        target_kpi="prb_utilization", parameters={},
+    )
+    db_session.add(request)
+    for i in range(5):
+        db_session.add(KPIMetricORM(
+            tenant_id="test", entity_id=f"cell-{i}", metric_name="prb_utilization", value=0.9 + i * 0.01,
+        ))
+    db_session.add(EntityRelationshipORM(
+        from_entity_id="cell-0", from_entity_type="cell", relationship_type="served_by",
+        to_entity_id="site-0", to_entity_type="site", tenant_id="test",
+        properties=json.dumps({"lat": 10.5, "lon": 20.5}),
+    ))
+    await db_session.commit()
+
+    selects = []
+
+    def _count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        plan = await CapacityEngine(db_session).optimize_densification(request.id, session=db_session)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    # request, hotspots, topology — independent of the number of hotspots
+    assert sum("topology_relationships" in q for q in selects) == 1
+    sites = {site["name"]: site for site in plan.site_placements}
+    assert len(sites) == 5
+    assert (sites["Site-cell-0"]["lat"], sites["Site-cell-0"]["lon"]) == (10.5, 20.5)
@@ -56,3 +56,36 @@ async def test_cumulative_risk_protection(db_session):
     assert "🛑 **POLICY BLOCK**" in sitrep
     assert "Cumulative Revenue Protection" in sitrep
     print("Successfully blocked autonomous action due to cumulative risk threshold breach!")
+
+
+@pytest.mark.asyncio
+async def test_cumulative_active_risk_sums_open_recent_decisions(db_session):
+    from backend.app.services.bss_service import BSSService
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        ({"predicted_revenue_loss": 1200.5}, None, now),
+        ({"predicted_revenue_loss": 800}, None, now - timedelta(minutes=30)),
+        ({"predicted_revenue_loss": 5000}, {"status": "resolved"}, now),  # closed
+        ({"predicted_revenue_loss": 7000}, None, now - timedelta(hours=2)),  # stale
+        ({}, None, now),  # no estimate
+    ]
+    for i, (context, outcome, created_at) in enumerate(rows):
+        trace = DecisionTraceORM(
+            tenant_id="test",
+            trigger_type="anomaly",
+            trigger_description=f"event {i}",
+            decision_summary=f"decision {i}",
+            tradeoff_rationale="n/a",
+            action_taken="NO_ACTION",
+            decision_maker="pedkai:test_suite",
+            context=context,
+            created_at=created_at,
+        )
+        if outcome is not None:  # an explicit None would store JSON 'null'
+            trace.outcome = outcome
+        db_session.add(trace)
+    await db_session.commit()
+
+    total = await BSSService(None).calculate_cumulative_active_risk(session=db_session)
+    assert total == pytest.approx(2000.5)
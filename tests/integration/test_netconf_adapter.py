@@ -15,3 +15,27 @@ async def test_netconf_validate_and_execute():
     assert v.get("valid") is True
     r = await s.execute("cell_failover", {"target_cell": "cell-2"})
     assert r.get("success") is True
+
+@pytest.mark.asyncio
+async def test_netconf_pool_reuses_and_discards_sessions():
+    from backend.app.services.netconf_adapter import NetconfSessionPool
+
+    pool = NetconfSessionPool(max_size=2)
+    async with pool.acquire("nokia-mock-host") as first:
+        assert first.connected and first.vendor == "nokia"
+    async with pool.acquire("nokia-mock-host") as again:
+        assert again is first
+
+    with pytest.raises(RuntimeError):
+        async with pool.acquire("nokia-mock-host") as broken:
+            raise RuntimeError("device dropped the session")
+    async with pool.acquire("nokia-mock-host") as fresh:
+        assert fresh is not broken
+
+@pytest.mark.asyncio
+async def test_cell_failover_executes_through_pool():
+    from backend.app.services.autonomous_actions.cell_failover import CellFailoverAction
+
+    handler = CellFailoverAction()
+    r = await handler.validate_and_execute(None, "nokia-mock-host", "cell-1", "cell-2", dry_run=False)
+    assert r == {"success": True, "message": "Failover applied (mock)"}
@@ -1,6 +1,6 @@
 import pytest
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 from unittest.mock import AsyncMock, patch
 from httpx import AsyncClient
@@ -11,6 +11,7 @@ from backend.app.models.incident_orm import IncidentORM
 from backend.app.models.audit_orm import IncidentAuditEntryORM
 from backend.app.models.action_execution_orm import ActionExecutionORM, ActionState
 from backend.app.models.kpi_sample_orm import KpiSampleORM
+from backend.app.models.policy_orm import ActionDecision as PolicyDecision, PolicyEvaluationORM
 from backend.app.schemas.incidents import IncidentStatus, IncidentSeverity
 from backend.app.services.autonomous_action_executor import AutonomousActionExecutor
 
@@ -123,10 +124,11 @@ async def test_safety_gates_blast_radius(db_session: AsyncSession, session_facto
     # Ensure it's in DB
     await db_session.commit()
     
-    # Mock the queue to return only one item and then stop
-    with patch("backend.app.services.autonomous_action_executor._pending_queue.get", side_effect=[action.id, asyncio.CancelledError()]):
+    # Mock the action's shard queue to return only one item and then stop
+    shard = executor._shard_for("test-tenant", "node-1")
+    with patch.object(executor._queues[shard], "get", side_effect=[action.id, asyncio.CancelledError()]):
         try:
-            await executor._worker_loop()
+            await executor._worker_loop(shard)
         except asyncio.CancelledError:
             pass
         
@@ -138,6 +140,52 @@ async def test_safety_gates_blast_radius(db_session: AsyncSession, session_facto
          assert updated_action.state == ActionState.FAILED
          assert updated_action.result["reason"] == "blast_radius_exceeded"
 
+@pytest.mark.asyncio
+async def test_action_pipeline_completes(db_session: AsyncSession, session_factory):
+    """Happy path through the gates persists AWAITING → EXECUTING → COMPLETED."""
+    from types import SimpleNamespace
+    from backend.app.services import autonomous_action_executor as mod
+    from backend.app.services.digital_twin import Prediction
+
+    executor = AutonomousActionExecutor(session_factory)
+    action = await executor.submit_action(db_session, "test-tenant", "restart", "node-2")
+    await db_session.commit()
+
+    policy = AsyncMock()
+    policy.evaluate_autonomous_action.return_value = SimpleNamespace(
+        decision="allow", matched_rules=[], reason="", recommended_confirmation_window_sec=1
+    )
+    states = []
+    persist = executor._persist_state
+
+    async def _record(action_id, state, **kw):
+        states.append(state)
+        await persist(action_id, state, **kw)
+
+    with patch.object(mod, "get_policy_engine", return_value=policy), \
+         patch.object(mod.asyncio, "sleep", AsyncMock()), \
+         patch.object(mod.DigitalTwinMock, "predict", AsyncMock(return_value=Prediction(10, 0.1, "0-0"))), \
+         patch.object(executor, "_confidence_score", AsyncMock(return_value=0.9)), \
+         patch.object(executor, "_validate_post_execution", AsyncMock(return_value=True)), \
+         patch.object(executor, "_persist_state", side_effect=_record):
+        await executor._process_action(action.id)
+        # Parked on the confirmation timer; the worker is free again
+        assert states == [ActionState.AWAITING_CONFIRMATION]
+        assert [aid for _, aid in executor._confirm_heap] == [action.id]
+        # What the worker does when the timer hands the id back
+        await executor._process_action(action.id)
+
+    assert states == [ActionState.AWAITING_CONFIRMATION, ActionState.EXECUTING, ActionState.COMPLETED]
+    assert not executor._awaiting
+    async with session_factory() as session:
+        row = (await session.execute(
+            select(ActionExecutionORM).where(ActionExecutionORM.id == action.id)
+        )).scalar_one()
+        assert row.state == ActionState.COMPLETED
+        assert row.success is True
+        assert row.result["prediction"] == {"risk_score": 10, "impact_delta": 0.1}
+        assert row.updated_at >= row.created_at
+
 @pytest.mark.asyncio
 @pytest.mark.skipif(True, reason="Requires local metrics PostgreSQL (port 5433) for KPI baseline fetch")
 async def test_safety_gates_validation_rollback(db_session: AsyncSession, session_factory):
@@ -197,3 +245,189 @@ async def test_safety_gates_validation_rollback(db_session: AsyncSession, sessio
         
         passed = await executor._validate_post_execution(db_session, action, pred)
         assert passed is False # Should fail validation
+
+@pytest.mark.asyncio
+async def test_action_claimed_by_one_executor(db_session: AsyncSession, session_factory):
+    """Two executors sharing the table: only the first claim wins."""
+    first = AutonomousActionExecutor(session_factory)
+    second = AutonomousActionExecutor(session_factory)
+    action = await first.submit_action(db_session, "test-tenant", "restart", "node-3")
+    await db_session.commit()
+
+    assert (await first._claim_action(action.id)) is not None
+    assert (await second._claim_action(action.id)) is None
+    # Re-claiming our own row (e.g. after a sweep) is idempotent
+    assert (await first._claim_action(action.id)) is not None
+
+@pytest.mark.asyncio
+async def test_sweep_claims_orphaned_pending_actions(db_session: AsyncSession, session_factory):
+    """Stale unclaimed PENDING rows are claimed once, then skipped."""
+    executor = AutonomousActionExecutor(session_factory)
+    stale = datetime.utcnow() - timedelta(seconds=executor.CLAIM_SWEEP_SECONDS * 2)
+    db_session.add_all([
+        ActionExecutionORM(id="orphan-1", tenant_id="test-tenant", action_type="restart",
+                           entity_id="node-4", state=ActionState.PENDING, created_at=stale),
+        ActionExecutionORM(id="fresh-1", tenant_id="test-tenant", action_type="restart",
+                           entity_id="node-5", state=ActionState.PENDING),
+    ])
+    await db_session.commit()
+
+    assert await executor._claim_pending() == [("orphan-1", "test-tenant", "node-4")]
+    assert await AutonomousActionExecutor(session_factory)._claim_pending() == []
+
+@pytest.mark.asyncio
+async def test_sweep_takes_over_lapsed_claims(db_session: AsyncSession, session_factory):
+    """Claims of a crashed executor expire; live claims are renewed and kept."""
+    executor = AutonomousActionExecutor(session_factory)
+    now = datetime.utcnow()
+    lapsed = now - timedelta(seconds=executor.CLAIM_LEASE_SECONDS * 2)
+    old = now - timedelta(seconds=executor.CLAIM_SWEEP_SECONDS * 2)
+
+    def _row(action_id, state, executed_by, claimed_at):
+        return ActionExecutionORM(
+            id=action_id, tenant_id="test-tenant", action_type="restart", entity_id=action_id,
+            state=state, created_at=old, executed_by=executed_by, claimed_at=claimed_at,
+        )
+
+    db_session.add_all([
+        _row("dead-pending", ActionState.PENDING, "dead-host:1:aa", lapsed),
+        _row("dead-parked", ActionState.AWAITING_CONFIRMATION, "dead-host:1:aa", lapsed),
+        _row("dead-running", ActionState.EXECUTING, "dead-host:1:aa", lapsed),
+        _row("live-pending", ActionState.PENDING, "live-host:2:bb", now),
+        _row("mine-pending", ActionState.PENDING, executor.worker_id, lapsed),
+    ])
+    await db_session.commit()
+
+    await executor._renew_claims()
+    claimed = await executor._claim_pending()
+    assert sorted(r[0] for r in claimed) == ["dead-parked", "dead-pending"]
+
+    async with session_factory() as session:
+        rows = {
+            r.id: r for r in (await session.execute(select(ActionExecutionORM))).scalars()
+        }
+    for action_id in ("dead-pending", "dead-parked"):
+        assert rows[action_id].state == ActionState.PENDING
+        assert rows[action_id].executed_by == executor.worker_id
+        assert rows[action_id].claimed_at >= now
+    assert rows["dead-running"].executed_by == "dead-host:1:aa"  # never re-executed
+    assert rows["live-pending"].executed_by == "live-host:2:bb"
+    assert rows["mine-pending"].claimed_at >= now                 # renewed by the sweep
+
+    # The new holder can now claim the row for processing
+    assert await executor._claim_action("dead-pending") is not None
+
+
+@pytest.mark.asyncio
+async def test_deterministic_rejections_skip_the_queue(db_session: AsyncSession, session_factory):
+    """Blast radius and cached action-type denies fail at submit, unqueued."""
+    executor = AutonomousActionExecutor(session_factory)
+    oversized = await executor.submit_action(
+        db_session, "test-tenant", "failover", "node-6", affected_entity_count=15
+    )
+    assert oversized.state == ActionState.FAILED
+    assert oversized.result["reason"] == "blast_radius_exceeded"
+
+    # Only the policy deny is audited; the blast radius gate is not a policy decision
+    evaluations = (await db_session.execute(select(PolicyEvaluationORM))).scalars().all()
+    assert evaluations == []
+
+    denied_rules = {"action_type_check": {"passed": False, "action_type": "reboot_core"}}
+    executor._policy_deny_cache.set(("test-tenant", "reboot_core"), ("default", denied_rules))
+    denied = await executor.submit_action(
+        db_session, "test-tenant", "reboot_core", "node-7", trace_id="trace-7"
+    )
+    assert denied.state == ActionState.FAILED
+    assert denied.result == {"reason": "policy_blocked", "details": denied_rules}
+
+    evaluation = (await db_session.execute(select(PolicyEvaluationORM))).scalar_one()
+    assert evaluation.policy_id == "default"
+    assert evaluation.tenant_id == "test-tenant"
+    assert evaluation.action_type == "reboot_core"
+    assert evaluation.decision == PolicyDecision.DENY
+    assert evaluation.matched_rules == denied_rules
+    assert evaluation.trace_id == "trace-7"
+    assert evaluation.evaluated_by == "autonomous-executor"
+
+    assert all(q.empty() for q in executor._queues)
+
+@pytest.mark.asyncio
+async def test_stop_drains_in_flight_and_releases_claims(db_session: AsyncSession, session_factory):
+    """stop() lets a running action finish and un-claims untouched PENDING rows."""
+    executor = AutonomousActionExecutor(session_factory)
+    action = await executor.submit_action(db_session, "test-tenant", "restart", "node-8")
+    await db_session.commit()
+    assert await executor._claim_action(action.id) is not None
+
+    finished = []
+
+    async def _slow_process(action_id):
+        await asyncio.sleep(0.2)
+        finished.append(action_id)
+
+    with patch.object(executor, "_process_action", side_effect=_slow_process):
+        await executor.start()
+        await asyncio.sleep(0.05)  # let the worker take the queued id
+        await executor.stop()
+
+    assert finished == [action.id]
+    async with session_factory() as session:
+        row = (await session.execute(
+            select(ActionExecutionORM).where(ActionExecutionORM.id == action.id)
+        )).scalar_one()
+        assert row.state == ActionState.PENDING
+        assert row.executed_by is None
+
+@pytest.mark.asyncio
+async def test_confirmation_timer_requeues_due_actions(session_factory):
+    """One timer task wakes at the earliest deadline and feeds the shard."""
+    from types import SimpleNamespace
+
+    executor = AutonomousActionExecutor(session_factory)
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    done.cancel()  # stands in for a finished prediction task
+    for aid, delay in (("late", 0.2), ("early", 0.05)):
+        executor._awaiting[aid] = (SimpleNamespace(tenant_id="t", entity_id=aid), done)
+        executor._confirm_heap.append((loop.time() + delay, aid))
+    executor._confirm_heap.sort()
+
+    timer = asyncio.create_task(executor._confirmation_timer())
+    try:
+        first = await asyncio.wait_for(executor._queues[executor._shard_for("t", "early")].get(), 1)
+        second = await asyncio.wait_for(executor._queues[executor._shard_for("t", "late")].get(), 1)
+    finally:
+        timer.cancel()
+    assert (first, second) == ("early", "late")
+    assert executor._confirm_heap == []
+
+@pytest.mark.asyncio
+async def test_intermediate_transitions_are_batched(db_session: AsyncSession, session_factory):
+    """Concurrent transitions land in one flusher transaction."""
+    sessions_opened = []
+
+    def _counting_factory():
+        sessions_opened.append(1)
+        return session_factory()
+
+    executor = AutonomousActionExecutor(_counting_factory)
+    ids = []
+    for i in range(3):
+        action = await executor.submit_action(db_session, "test-tenant", "restart", f"node-b{i}")
+        ids.append(action.id)
+    await db_session.commit()
+
+    executor._flusher_task = asyncio.create_task(executor._state_flusher())
+    try:
+        await asyncio.gather(*(
+            executor._persist_transition(aid, ActionState.EXECUTING) for aid in ids
+        ))
+    finally:
+        executor._flusher_task.cancel()
+
+    assert len(sessions_opened) == 1
+    async with session_factory() as session:
+        states = (await session.execute(
+            select(ActionExecutionORM.state).where(ActionExecutionORM.id.in_(ids))
+        )).scalars().all()
+    assert states == [ActionState.EXECUTING] * 3
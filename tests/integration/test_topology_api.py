@@ -25,6 +25,68 @@ async def test_topology_impact_recursive(client: AsyncClient, db_session):
     assert "B" in [n["entity_id"] for n in data["downstream"]]
     assert "C" in [n["entity_id"] for n in data["downstream"]]
 
+@pytest.mark.asyncio
+async def test_topology_impact_flat_layout(client: AsyncClient, db_session):
+    """layout=flat returns parallel arrays with parent indices."""
+    token = create_access_token({"sub": "admin", "role": Role.ADMIN})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for src, dst in (("FA", "FB"), ("FB", "FC"), ("FA", "FD")):
+        db_session.add(EntityRelationshipORM(id=uuid.uuid4(), from_entity_id=src, from_entity_type="NODE", to_entity_id=dst, to_entity_type="NODE", relationship_type="CONNECTED", tenant_id="t1"))
+    await db_session.commit()
+
+    resp = await client.get("/api/v1/topology/t1/impact/FA?max_hops=3&layout=flat", headers=headers)
+    assert resp.status_code == 200, resp.text
+    down = resp.json()["downstream"]
+    assert down["direction"] == "downstream"
+    by_id = dict(zip(down["entity_ids"], range(len(down["entity_ids"]))))
+    assert set(by_id) == {"FB", "FC", "FD"}
+    assert down["parents"][by_id["FB"]] == -1
+    assert down["parents"][by_id["FD"]] == -1
+    assert down["parents"][by_id["FC"]] == by_id["FB"]
+    assert down["depths"][by_id["FC"]] == 2
+
+@pytest.mark.asyncio
+@pytest.mark.filterwarnings("error::UserWarning")  # pydantic serializer warnings
+async def test_topology_graph_body_matches_schema(client: AsyncClient, db_session):
+    """The stitched graph body is valid TopologyGraphResponse JSON."""
+    from backend.app.schemas.topology import TopologyGraphResponse
+
+    token = create_access_token({"sub": "admin", "role": Role.ADMIN})
+    headers = {"Authorization": f"Bearer {token}"}
+    rel_id = uuid.uuid4()
+    db_session.add(EntityRelationshipORM(id=rel_id, from_entity_id="GA", from_entity_type="SITE", to_entity_id="GB", to_entity_type="CELL", relationship_type="HOSTS", tenant_id="tg"))
+    await db_session.commit()
+
+    resp = await client.get("/api/v1/topology/tg", headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"] == "application/json"
+    graph = TopologyGraphResponse.model_validate(resp.json())
+    assert graph.tenant_id == "tg"
+    assert {e.id for e in graph.entities} == {"GA", "GB"}
+    assert [(r.source_entity_id, r.target_entity_id) for r in graph.relationships] == [("GA", "GB")]
+    assert resp.json()["relationships"][0]["id"] == str(rel_id)
+    assert graph.topology_health is not None
+
+@pytest.mark.asyncio
+@pytest.mark.filterwarnings("error::UserWarning")  # pydantic serializer warnings
+async def test_topology_graph_ndjson(client: AsyncClient, db_session):
+    """Accept: application/x-ndjson streams an envelope line then one line per row."""
+    import json
+
+    token = create_access_token({"sub": "admin", "role": Role.ADMIN})
+    headers = {"Authorization": f"Bearer {token}", "Accept": "application/x-ndjson"}
+    db_session.add(EntityRelationshipORM(id=uuid.uuid4(), from_entity_id="NA", from_entity_type="SITE", to_entity_id="NB", to_entity_type="CELL", relationship_type="HOSTS", tenant_id="tn"))
+    await db_session.commit()
+
+    resp = await client.get("/api/v1/topology/tn", headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(l) for l in resp.text.splitlines()]
+    assert lines[0]["type"] == "graph" and lines[0]["tenant_id"] == "tn"
+    assert sorted(l["id"] for l in lines if l["type"] == "entity") == ["NA", "NB"]
+    assert [l["source_entity_id"] for l in lines if l["type"] == "relationship"] == ["NA"]
+
 @pytest.mark.asyncio
 async def test_topology_health_staleness(client: AsyncClient, db_session):
     """Verify Finding 3: Health staleness check logic."""
@@ -197,3 +197,39 @@ async def test_reset_password(client_real_auth: AsyncClient, db_session: AsyncSe
         headers={"Authorization": f"Bearer {token}"},
     )
     assert resp.status_code == 200, resp.text
+
+
+# ---------------------------------------------------------------------------
+# auth_service batch lookups and seeding
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_users_by_usernames(db_session: AsyncSession):
+    from backend.app.services.auth_service import get_users_by_usernames
+
+    admin = await _seed(db_session)
+    found = await get_users_by_usernames(db_session, ["mgmt_admin", "nobody"])
+    assert list(found) == ["mgmt_admin"]
+    assert found["mgmt_admin"].id == admin.id
+    assert await get_users_by_usernames(db_session, ["mgmt_admin"], tenant_id="other") == {}
+
+
+@pytest.mark.asyncio
+async def test_seed_default_users_is_idempotent(db_session: AsyncSession):
+    from sqlalchemy import select
+
+    from backend.app.services.auth_service import seed_default_users
+
+    db_session.add(TenantORM(id="seed_a", display_name="A", is_active=True))
+    db_session.add(TenantORM(id="seed_b", display_name="B", is_active=True))
+    await db_session.commit()
+
+    await seed_default_users(db_session)
+    await seed_default_users(db_session)
+
+    rows = await db_session.execute(
+        select(UserTenantAccessORM.tenant_id)
+        .join(UserORM, UserORM.id == UserTenantAccessORM.user_id)
+        .where(UserORM.username == "pedkai_admin")
+    )
+    assert sorted(rows.scalars()) == ["seed_a", "seed_b"]